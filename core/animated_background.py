@@ -0,0 +1,152 @@
+import os
+import glob
+import mmap
+import hashlib
+import logging
+
+import pygame
+
+from core.baked import PIXEL_FORMAT, source_stamp
+from utils.asset_manager import asset_manager
+from utils.resource_loader import resource_path, get_cache_path
+
+logger = logging.getLogger("AnimatedBackground")
+
+# Збільшуйте, коли змінюється спосіб масштабування кадрів — старі файли кешу стануть недійсними
+BACKGROUND_CACHE_VERSION = 1
+CACHE_FOLDER = "backgrounds"
+
+
+def cache_path(gif_path, screen_size):
+    """Файл кадрів для GIF і роздільності; ключ містить розмір і час зміни GIF, тож змінений GIF перебудується."""
+    width, height = screen_size
+    relative = os.path.relpath(gif_path, resource_path("")).replace(os.sep, "/")
+    stamp = f"{BACKGROUND_CACHE_VERSION}|{relative}|{source_stamp(gif_path)}"
+    key = hashlib.sha1(stamp.encode("utf-8")).hexdigest()[:16]
+    name = os.path.splitext(os.path.basename(gif_path))[0]
+    return get_cache_path(CACHE_FOLDER, f"{name}-{width}x{height}-{key}.frames")
+
+
+def build_frames(gif_path, screen_size):
+    """Декодує GIF і масштабує кожен кадр під екран (smoothscale, як раніше робив render щокадру)."""
+    from PIL import Image, ImageSequence  # Лише коли кешу кадрів ще немає
+
+    frames = []
+    with Image.open(gif_path) as gif:
+        for frame in ImageSequence.Iterator(gif):
+            frame = frame.convert("RGBA")
+            surface = pygame.image.fromstring(frame.tobytes(), frame.size, frame.mode).convert_alpha()
+            frames.append(pygame.transform.smoothscale(surface, screen_size))
+    return frames
+
+
+def save_frames(frames, path):
+    try:
+        with open(path + ".tmp", "wb") as f:
+            for frame in frames:
+                f.write(pygame.image.tobytes(frame, PIXEL_FORMAT))
+        os.replace(path + ".tmp", path)
+    except Exception as e:
+        logger.warning(f"[AnimatedBackground] Не вдалося зберегти кеш {path}: {e}")
+        return
+
+    # Попередні варіанти того самого фону для цієї роздільності (змінений GIF) більше не потрібні
+    prefix = os.path.basename(path).rsplit("-", 1)[0]
+    for stale in glob.glob(get_cache_path(CACHE_FOLDER, f"{prefix}-*.frames*")):
+        if stale != path:
+            try:
+                os.remove(stale)
+            except OSError as e:
+                pass
+
+
+def read_frames(path, screen_size):
+    """Кадри з файлу кешу: Surface над відображеними в пам'ять сторінками (без копій і convert)."""
+    width, height = screen_size
+    frame_bytes = width * height * 4
+    with open(path, "rb") as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    view = memoryview(mapping)
+    frames = []
+    for offset in range(0, len(mapping) - frame_bytes + 1, frame_bytes):
+        surface = pygame.image.frombuffer(view[offset:offset + frame_bytes], screen_size, PIXEL_FORMAT)
+        frames.append(surface)
+    if frames and frames[0].get_masks() != frames[0].convert_alpha().get_masks():
+        frames = [frame.convert_alpha() for frame in frames]  # Екран іншого формату — звичайна копія
+    return frames
+
+
+def load_background_frames(gif_path, screen_size):
+    """Кадри фону під роздільність: з дискового кешу, а за його відсутності — декодовані і збережені в кеш."""
+    path = cache_path(gif_path, screen_size)
+    if os.path.exists(path):
+        try:
+            return read_frames(path, screen_size)
+        except Exception as e:
+            logger.warning(f"[AnimatedBackground] Кеш {path} пошкоджено: {e}")
+    frames = build_frames(gif_path, screen_size)
+    save_frames(frames, path)
+    return frames
+
+
+class AnimatedBackground:
+    """
+    Анімований фон меню з відтворенням туди-назад (ping-pong).
+    Кадри вже масштабовані під поточну роздільність і беруться з кешу на диску (та спільного asset_manager),
+    тож кожен кадр меню — один blit без масштабування. Кадри лишаються Surface над сторінками файлу кешу (mmap):
+    їх не треба ні збирати, ні копіювати під час start() меню.
+    """
+    def __init__(self, gif_path, frame_delay=2):
+        self.gif_path = resource_path(gif_path)
+        self.frames = []
+        self.screen_size = None
+        self.frame_index = 0
+        self.reverse = False
+        self.frame_delay = frame_delay
+        self.current_delay = 0
+
+    def load(self, screen_size):
+        """Готує кадри для роздільності (нічого не робить, якщо вони вже є)."""
+        screen_size = tuple(screen_size)
+        if self.frames and self.screen_size == screen_size:
+            return
+        self.screen_size = screen_size
+        try:
+            self.frames = asset_manager.get(
+                (self.gif_path, screen_size, "background"),
+                lambda: load_background_frames(self.gif_path, screen_size)
+            )
+        except Exception as e:
+            logger.error(f"[AnimatedBackground] Помилка завантаження GIF {self.gif_path}: {e}")
+            self.frames = []
+        self.frame_index = min(self.frame_index, max(len(self.frames) - 1, 0))
+
+    def update(self):
+        """Один тік анімації. Повертає True, якщо кадр змінився."""
+        if self.current_delay < self.frame_delay:
+            self.current_delay += 1
+            return False
+        self.current_delay = 0
+        if not self.reverse:
+            self.frame_index += 1
+            if self.frame_index >= len(self.frames) - 1:
+                self.reverse = True
+        else:
+            self.frame_index -= 1
+            if self.frame_index <= 0:
+                self.reverse = False
+        return True
+
+    def progress(self):
+        """Положення поточного кадру в анімації (0..1)."""
+        return self.frame_index / (len(self.frames) - 1) if len(self.frames) > 1 else 0.0
+
+    def draw(self, screen):
+        if self.screen_size != screen.get_size():
+            self.load(screen.get_size())  # Роздільність змінилась (налаштування)
+        if self.frames:
+            screen.blit(self.frames[self.frame_index], (0, 0))
+
+    def clear(self):
+        self.frames = []
+        self.screen_size = None
@@ -2,19 +2,22 @@ import pygame
 import random
 import logging
 from utils.resource_loader import resource_path
+from utils.asset_manager import asset_manager
 
 
 class AudioManager:
     """
-    Менеджер звуку: музика, ефекти, гучність, кешування.
+    Менеджер звуку: музика, ефекти, гучність.
+    Звуки ефектів кешуються в спільному asset_manager від імені сцени, що їх відтворює (asset_manager.owner):
+    коли сцену знищено, її звуки стають звичайними записами LRU і витісняються в межах бюджету.
     """
+
     def __init__(self, music_volume=0.5, sound_volume=0.5):
         pygame.mixer.init()
 
         self.music_volume = music_volume
         self.sound_volume = sound_volume
         self.current_music = None
-        self.sounds = {}
 
         pygame.mixer.music.set_volume(self.music_volume)
         self.update_sound_channels()
@@ -50,12 +53,7 @@ class AudioManager:
             if isinstance(file_or_sound, pygame.mixer.Sound):
                 sound = file_or_sound
             else:
-                file_path = file_or_sound
-                if file_path not in self.sounds:
-                    full_path = resource_path(file_path)
-                    self.sounds[file_path] = pygame.mixer.Sound(full_path)
-
-                sound = self.sounds[file_path]
+                sound = asset_manager.sound(resource_path(file_or_sound))
 
             sound.set_volume(self.sound_volume)
             sound.play()
@@ -82,11 +80,7 @@ class AudioManager:
         Відтворення звуку в циклі. Повертає канал, у якому відтворюється звук.
         """
         try:
-            if file_path not in self.sounds:
-                full_path = resource_path(file_path)
-                self.sounds[file_path] = pygame.mixer.Sound(full_path)
-
-            sound = self.sounds[file_path]
+            sound = asset_manager.sound(resource_path(file_path))
             sound.set_volume(self.sound_volume)
 
             # Знайти вільний канал і програти
@@ -0,0 +1,73 @@
+import os
+import time
+import itertools
+
+import pygame
+
+from core.baked import baked
+from core.input_source import ScriptedInput
+from core.layer_generation import bake_sprites
+from core.manifest import write_manifest
+from objects.player_level1 import Player
+from utils.asset_manager import asset_manager
+from utils.resource_loader import resource_path
+
+# Сцени, чиї завантажувачі читають запечені кадри (core.baked.baked.load)
+BAKED_SCENES = ("level_1",)
+LOADING_BUDGET_MS = 50
+BAKE_WORLD_SEED = 0  # Запечене (кадри, зменшені спрайти) від seed світу не залежить
+
+
+def parse_size(text):
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+
+def bake_heroes():
+    """Дані героя для кожної папки героя в assets/characters, для якої є анімації (walk)."""
+    heroes = []
+    for race, gender, appearance in itertools.product(
+        Player.RACE_FOLDERS, Player.GENDER_FOLDERS, Player.APPEARANCE_FOLDERS
+    ):
+        hero_data = {"Раса": race, "Стать": gender, "Зовнішність": appearance}
+        if os.path.isdir(resource_path(os.path.join(Player.get_base_path(hero_data), "walk"))):
+            heroes.append(hero_data)
+    return heroes
+
+
+def run_bake(scene_manager, screen_sizes):
+    """
+    Для кожної роздільності створює екран, повністю завантажує сцени з BAKED_SCENES,
+    записуючи все, що збудували їхні завантажувачі, і зберігає це як сирі пікселі у форматі екрана (assets/baked).
+    Запікаються саме ті кадри, які будує гра, тож у грі вони збігаються піксель у піксель.
+    Кадри героя запікаються для всіх героїв з assets/characters, а не для героя зі збереження розробника;
+    сцени працюють зі сценарним введенням, тож збереження (прогрес, seed світу) не змінюється.
+    Разом із кадрами оновлюється маніфест ресурсів (assets/manifest.json).
+    """
+    write_manifest()
+    heroes = bake_heroes()
+    scene_manager.input_source = ScriptedInput(
+        [], hero_data=heroes[0] if heroes else {}, world_seed=BAKE_WORLD_SEED
+    )
+    for screen_size in screen_sizes:
+        start = time.perf_counter()
+        pygame.display.set_mode(screen_size)
+        asset_manager.clear()  # Інакше кадри, вже збудовані для попередньої сцени, не потраплять у запис
+        baked.start_recording()
+
+        for name in BAKED_SCENES:
+            scene = scene_manager.scenes[name]()
+            scene.start()
+            while scene.advance_loading(LOADING_BUDGET_MS):
+                scene_manager.jobs.pump(LOADING_BUDGET_MS)
+                pygame.event.pump()
+            sprites = bake_sprites(getattr(scene, "layer_recipes", {}).values())
+            for hero_data in heroes[1:]:  # Перший герой уже завантажений сценою
+                Player(scene.screen, scene.scale_x, scene.scale_y, hero_data)
+            scene_manager.destroy_scene(scene)
+
+        count, size = baked.save_recording(screen_size)
+        print(
+            f"🍞 {screen_size[0]}x{screen_size[1]}: {count} кадрів ({len(heroes)} героїв), {size / 1024 / 1024:.1f} МБ, "
+            f"{sprites} нових зменшених спрайтів за {time.perf_counter() - start:.1f} с"
+        )
@@ -0,0 +1,145 @@
+import os
+import json
+import mmap
+import logging
+
+import pygame
+
+from utils.resource_loader import resource_path
+
+logger = logging.getLogger("Baked")
+
+BAKED_VERSION = 3
+BAKED_FOLDER = "assets/baked"
+PIXEL_FORMAT = "BGRA"  # Порядок байтів як у convert_alpha() для 32-бітного екрана — кадр не потребує конвертації
+
+
+def baked_paths(screen_size):
+    """Файли запеченого набору для роздільності: сирі пікселі (PIXEL_FORMAT) та JSON-індекс до них."""
+    width, height = screen_size
+    base = resource_path(os.path.join(BAKED_FOLDER, f"{width}x{height}"))
+    return base + ".pixels", base + ".json"
+
+
+def source_stamp(path):
+    """
+    Розмір файлу-джерела: запечений кадр дійсний, лише поки джерело не змінилось.
+    Не mtime — його копіювання ресурсів у збірку PyInstaller не зберігає.
+    """
+    return [os.path.getsize(path)]
+
+
+class BakedAssets:
+    """
+    Заздалегідь масштабовані кадри для поточної роздільності (див. `main.py --bake`).
+    Завантажувачі об'єктів викликають load(path, params, build): якщо для цього файлу і параметрів
+    масштабування є запечені пікселі — Surface створюється з сирих байтів (без розпаковки PNG і scale),
+    інакше викликається build(), тобто звичайне завантаження.
+    Файл пікселів відображається в пам'ять (mmap), а Surface створюється через frombuffer прямо над
+    відображеними сторінками: якщо формат збігається з форматом екрана, власної копії пікселів немає,
+    їх тримає кеш сторінок ОС (copy-on-write, тож запис у Surface не змінює файл).
+    Під час запікання recording збирає все, що збудували завантажувачі.
+    """
+    def __init__(self):
+        self.screen_size = None
+        self.index = {}        # {"шлях|параметри": {"offset", "length", "size", "alpha", "source"}}
+        self.blob_path = None
+        self.mapping = None    # mmap файлу пікселів; живе, доки на нього посилаються Surface
+        self.native = False    # Чи можна брати Surface над mmap без convert_alpha (формат як у екрана)
+        self.recording = None  # {"шлях|параметри": (Surface, alpha, джерело)} під час --bake
+
+    def open(self, screen_size):
+        """Підключає запечений набір для роздільності екрана (якщо його створено)."""
+        self.screen_size = tuple(screen_size)
+        self.index = {}
+        self.mapping = None  # Попереднє відображення звільниться разом з останньою Surface над ним
+        self.blob_path, index_path = baked_paths(self.screen_size)
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == BAKED_VERSION and os.path.getsize(self.blob_path):
+                with open(self.blob_path, "rb") as f:
+                    self.mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+                self.index = data["entries"]
+                self.native = self.is_native()
+                logger.info(f"[Baked] {len(self.index)} запечених кадрів для {self.screen_size}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"[Baked] Не вдалося прочитати {index_path}: {e}")
+
+    @staticmethod
+    def is_native():
+        """Чи збігаються маски PIXEL_FORMAT з тим, що дає convert_alpha() для поточного екрана."""
+        probe = pygame.image.frombuffer(bytearray(4), (1, 1), PIXEL_FORMAT)
+        return probe.get_masks() == probe.convert_alpha().get_masks()
+
+    @staticmethod
+    def make_key(path, params):
+        relative = os.path.relpath(path, resource_path("")).replace(os.sep, "/")
+        return "|".join([relative] + [str(param) for param in params])
+
+    def load(self, path, params, build, alpha=True):
+        """
+        Кадр з файлу path, масштабований з параметрами params (усе, від чого залежить результат build).
+        alpha=False — для непрозорих зображень (convert замість convert_alpha).
+        """
+        key = self.make_key(path, params)
+        if self.recording is not None:
+            surface = build()
+            self.recording[key] = (surface, alpha, path)
+            return surface
+
+        entry = self.index.get(key)
+        try:
+            if entry is not None and entry["source"] == source_stamp(path):
+                return self.read(entry)
+        except Exception as e:
+            logger.warning(f"[Baked] Запечений кадр {key} недоступний: {e}")
+        return build()
+
+    def read(self, entry):
+        offset = entry["offset"]
+        data = memoryview(self.mapping)[offset:offset + entry["length"]]
+        surface = pygame.image.frombuffer(data, tuple(entry["size"]), PIXEL_FORMAT)
+        if entry["alpha"] and self.native:
+            return surface  # Пікселі лишаються у відображених сторінках файлу
+        return surface.convert_alpha() if entry["alpha"] else surface.convert()
+
+    # --- Запікання ---
+    def start_recording(self):
+        self.recording = {}
+
+    def save_recording(self, screen_size):
+        """Записує зібрані кадри у файли набору для screen_size і повертає їхню кількість."""
+        recorded, self.recording = self.recording or {}, None
+        blob_path, index_path = baked_paths(screen_size)
+        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+
+        entries = {}
+        offset = 0
+        with open(blob_path + ".tmp", "wb") as f:
+            for key, (surface, alpha, path) in recorded.items():
+                data = pygame.image.tobytes(surface, PIXEL_FORMAT)
+                f.write(data)
+                entries[key] = {
+                    "offset": offset,
+                    "length": len(data),
+                    "size": list(surface.get_size()),
+                    "alpha": alpha,
+                    "source": source_stamp(path),
+                }
+                offset += len(data)
+        with open(index_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"version": BAKED_VERSION, "screen_size": list(screen_size), "entries": entries}, f)
+
+        if blob_path == self.blob_path:
+            self.index, self.mapping = {}, None  # Старий файл більше не читаємо (і не тримаємо відображеним)
+        os.replace(blob_path + ".tmp", blob_path)
+        os.replace(index_path + ".tmp", index_path)
+        logger.info(f"[Baked] {len(entries)} кадрів ({offset / 1024 / 1024:.1f} МБ) → {blob_path}")
+        return len(entries), offset
+
+
+# Спільний набір для гри: main.py підключає його після створення екрана
+baked = BakedAssets()
@@ -0,0 +1,150 @@
+import math
+import time
+
+import pygame
+
+from core.input_source import ScriptedInput
+
+# 🎬 Сценарій введення для Level1: ходьба, біг з Shift, стрибок, атака (F)
+LEVEL1_TIMELINE = [
+    (45, (pygame.K_RIGHT,), 0),
+    (60, (pygame.K_RIGHT,), pygame.KMOD_LSHIFT),
+    (4, (pygame.K_RIGHT, pygame.K_SPACE), 0),
+    (30, (pygame.K_RIGHT,), 0),
+    (3, (pygame.K_f,), 0),
+    (20, (), 0),
+]
+
+TIMELINES = {
+    "level_1": LEVEL1_TIMELINE,
+}
+
+# 🧝 Бенчмарк не залежить від збереження розробника: герой, чиї кадри є в assets/characters, і сталий seed світу
+BENCH_HERO = {
+    "Раса": "Людина",
+    "Стать": "Жіноча",
+    "Зовнішність": "Темна",
+    "HP": 100,
+    "Mana": 100,
+    "Stamina": 100,
+}
+BENCH_WORLD_SEED = 1
+
+LOADING_BUDGET_MS = 50
+
+
+def percentile(values, p):
+    """Повертає перцентиль p (0–100) методом найближчого рангу."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(p / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(values):
+    return {
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": max(values) if values else 0.0,
+    }
+
+
+def format_report(scene_name, frames, ticks, stats):
+    lines = [
+        f"🏁 Бенчмарк сцени '{scene_name}': {frames} кадрів, {ticks} тіків",
+        f"{'етап':<26}{'p50 мс':>10}{'p95 мс':>10}{'p99 мс':>10}{'max мс':>10}",
+    ]
+    for stage, values in stats.items():
+        lines.append(
+            f"{stage:<26}{values['p50']:>10.2f}{values['p95']:>10.2f}{values['p99']:>10.2f}{values['max']:>10.2f}"
+        )
+    return "\n".join(lines)
+
+
+def run_benchmark(scene_manager, screen, scene_name, frames=600, fps=30, input_source=None):
+    """
+    Запускає сцену з введенням за сценарієм і вимірює час update() кожного тіку та render() кожного кадру.
+    Цикл той самий, що й у грі (main.py): кадри йдуть з частотою fps (0 — без обмеження), а симуляція —
+    фіксованими тіками SceneManager.tick_ms через акумулятор, з інтерполяцією у відмальовці.
+    frames — скільки тіків симуляції прогнати. Повертає словник статистики.
+    input_source — інше джерело введення (наприклад, відтворення запису; один запис = frames тіків).
+    """
+    scene_manager.input_source = input_source or ScriptedInput(
+        TIMELINES.get(scene_name, []), hero_data=BENCH_HERO, world_seed=BENCH_WORLD_SEED
+    )
+    scene_manager.change_scene(scene_name)
+
+    # ⏳ Завантаження сцени не вимірюємо — лише доводимо його до кінця
+    while scene_manager.advance_loading(LOADING_BUDGET_MS):
+        pygame.event.pump()
+
+    # 📊 Профайлер збирає час окремих етапів сцени (шари, павуки, ворони...) в окремий список:
+    # історія оверлея F3 лишається такою, як була
+    profiler = scene_manager.profiler
+    was_enabled = profiler.enabled
+    profiler.enabled = True
+    captured = []
+    profiler.captures.append(captured)
+
+    clock = pygame.time.Clock()
+    accumulator = 0.0
+    ticks = 0
+    update_times = []
+    render_times = []
+    frame_times = []
+
+    while ticks < frames:
+        if not scene_manager.running or getattr(scene_manager.input_source, "finished", False):
+            break
+
+        accumulator += min(clock.tick(fps), scene_manager.MAX_FRAME_MS)
+        profiler.begin_frame()
+        with profiler.section("events"):
+            events = pygame.event.get()
+            scene_manager.handle_events(events)
+
+        frame_start = time.perf_counter()
+        with profiler.section("loading"):
+            scene_manager.advance_loading(LOADING_BUDGET_MS)
+
+        # 🧮 Фіксований крок симуляції, як у головному циклі гри. Час update міряється на кожен тік:
+        # кадри без тіків (fps вище за частоту тіків) не розбавляють статистику нулями
+        while accumulator >= scene_manager.tick_ms and ticks < frames:
+            if getattr(scene_manager.input_source, "finished", False):
+                break
+            tick_start = time.perf_counter()
+            with profiler.section("update"):
+                scene_manager.update()
+            update_times.append((time.perf_counter() - tick_start) * 1000)
+            accumulator -= scene_manager.tick_ms
+            ticks += 1
+
+        render_start = time.perf_counter()
+        with profiler.section("render"):
+            scene_manager.render(screen, min(accumulator / scene_manager.tick_ms, 1.0))
+        render_end = time.perf_counter()
+        with profiler.section("flip"):
+            pygame.display.flip()
+        frame_end = time.perf_counter()
+        profiler.end_frame()
+
+        render_times.append((render_end - render_start) * 1000)
+        frame_times.append((frame_end - frame_start) * 1000)
+
+    profiler.captures.remove(captured)
+    profiler.enabled = was_enabled
+
+    stats = {
+        "update": summarize(update_times),
+        "render": summarize(render_times),
+        "frame": summarize(frame_times),
+    }
+    for stage in profiler.stage_order:
+        if stage in ("update", "render"):
+            continue
+        # Лише кадри, в яких етап виконувався: етапи update пропускають кадри без тіків
+        stats[stage] = summarize([stages[stage] for _, stages in captured if stage in stages])
+    print(format_report(scene_name, len(frame_times), ticks, stats))
+    return stats
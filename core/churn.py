@@ -0,0 +1,95 @@
+import gc
+import tracemalloc
+
+import pygame
+
+from core.benchmark import BENCH_HERO
+from core.input_source import ScriptedInput
+from utils.asset_manager import asset_manager
+from utils.memory import live_surfaces, format_bytes
+
+# 🔁 Маршрут одного циклу: так гравець проходить гру від меню до рівня і виходить через паузу
+CHURN_ROUTE = ("menu", "scene_1", "HeroCreator", "level_1", "pause")
+FRAMES_PER_SCENE = 5
+LOADING_BUDGET_MS = 50
+
+WARMUP_CYCLES = 2  # Перші цикли імпортують модулі, створюють шрифти і кеші меню — це не витік
+PY_HEAP_TOLERANCE = 2 * 1024 * 1024
+SURFACE_TOLERANCE = 1024 * 1024
+
+
+def run_frames(scene_manager, screen, frames):
+    for _ in range(frames):
+        scene_manager.handle_events(pygame.event.get())
+        scene_manager.update()
+        scene_manager.render(screen)
+        pygame.display.flip()
+
+
+def run_cycle(scene_manager, screen):
+    """Один прохід маршруту; вихід у меню — як з пункту паузи «Вийти в меню»."""
+    for name in CHURN_ROUTE:
+        scene_manager.change_scene(name)
+        while scene_manager.advance_loading(LOADING_BUDGET_MS):
+            pygame.event.pump()
+        run_frames(scene_manager, screen, FRAMES_PER_SCENE)
+
+    scene_manager.reset()
+    scene_manager.change_scene("menu")
+    run_frames(scene_manager, screen, FRAMES_PER_SCENE)
+
+
+def snapshot():
+    """
+    Пам'ять після виходу в меню: купа Python (tracemalloc) і пікселі живих Surface (пам'ять SDL).
+    Ресурси asset_manager без власників — це LRU-кеш в межах бюджету, а не витік, тож перед заміром їх скидаємо;
+    усе, що досі має власника-сцену, залишається і буде видно як ріст.
+    """
+    asset_manager.evict(0)
+    gc.collect()
+    py_bytes, _ = tracemalloc.get_traced_memory()
+    surfaces, surface_bytes = live_surfaces()
+    return py_bytes, surfaces, surface_bytes
+
+
+def run_churn(scene_manager, screen, cycles=6):
+    """
+    Ганяє сцени по колу і після кожного циклу (коли всі сцени рівня вже знищено) знімає пам'ять.
+    Якщо після розігріву пам'ять продовжує рости — сцени щось утримують після destroy().
+    Повертає True, якщо витоку не виявлено.
+    """
+    scene_manager.input_source = ScriptedInput([], hero_data=BENCH_HERO)  # Герой, чиї кадри є, а не зі збереження
+    tracemalloc.start()
+
+    samples = []
+    for cycle in range(cycles):
+        run_cycle(scene_manager, screen)
+        samples.append(snapshot())
+
+    tracemalloc.stop()
+
+    lines = [
+        f"🔁 Цикли сцен {' → '.join(CHURN_ROUTE)} → menu: {cycles}",
+        f"{'цикл':>6}{'купа Python':>16}{'Surface':>10}{'пікселі':>14}",
+    ]
+    for cycle, (py_bytes, surfaces, surface_bytes) in enumerate(samples, 1):
+        lines.append(f"{cycle:>6}{format_bytes(py_bytes):>16}{surfaces:>10}{format_bytes(surface_bytes):>14}")
+
+    if len(samples) <= WARMUP_CYCLES:
+        lines.append(f"⚠️ Замало циклів для перевірки (потрібно більше {WARMUP_CYCLES})")
+        print("\n".join(lines))
+        return True
+
+    base_py, base_count, base_pixels = samples[WARMUP_CYCLES - 1]
+    last_py, last_count, last_pixels = samples[-1]
+    py_growth = last_py - base_py
+    pixel_growth = last_pixels - base_pixels
+
+    leaked = py_growth > PY_HEAP_TOLERANCE or pixel_growth > SURFACE_TOLERANCE
+    verdict = "❌ Пам'ять росте між циклами" if leaked else "✅ Витоків не виявлено"
+    lines.append(
+        f"{verdict}: купа {py_growth / 1024:+.0f} КБ, "
+        f"Surface {last_count - base_count:+d} ({pixel_growth / 1024:+.0f} КБ) після розігріву"
+    )
+    print("\n".join(lines))
+    return not leaked
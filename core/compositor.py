@@ -0,0 +1,163 @@
+import os
+import hashlib
+import logging
+
+import numpy as np
+from PIL import Image, ImageEnhance
+
+from core.baked import source_stamp
+from core.manifest import manifest
+from utils.resource_loader import resource_path, get_cache_path
+
+logger = logging.getLogger("Compositor")
+
+
+def alpha_paste(canvas, sprite, x, y):
+    """
+    Накладання RGBA-спрайта на RGBA-полотно (масиви numpy HxWx4, uint8) зрізами numpy.
+    Той самий результат, що Image.paste(sprite, (x, y), sprite): кожен канал, разом з альфою,
+    змішується з полотном за альфою спрайта. Частини поза полотном відсікаються.
+    """
+    height, width = sprite.shape[:2]
+    left, top = max(x, 0), max(y, 0)
+    right, bottom = min(x + width, canvas.shape[1]), min(y + height, canvas.shape[0])
+    if left >= right or top >= bottom:
+        return
+
+    source = sprite[top - y:bottom - y, left - x:right - x].astype(np.uint32)
+    target = canvas[top:bottom, left:right]
+    alpha = source[:, :, 3:4]
+    target[:] = (source * alpha + target * (255 - alpha) + 127) // 255
+
+
+def save_sprite(image, path):
+    try:
+        # Той самий спрайт можуть одночасно зменшувати кілька процесів генерації — у кожного свій .tmp
+        temporary = f"{path}.{os.getpid()}.tmp"
+        image.save(temporary, format="PNG", compress_level=1)
+        os.replace(temporary, path)
+    except Exception as e:
+        logger.warning(f"[Compositor] Не вдалося зберегти зменшений спрайт {path}: {e}")
+
+
+class SpriteBank:
+    """
+    Банк варіантів спрайтів для генерації шарів: кожен варіант (масштаб, дзеркалення, розмір павутини...)
+    будується один раз через build(зображення, *варіант) і далі береться з пам'яті як масив numpy.
+    Вихідні зображення відкриваються лише під час першого запиту.
+    max_width — вихідні зображення, ширші за нього, один раз зменшуються і зберігаються в кеші користувача:
+    декодування багатомегапіксельного PNG коштує більше, ніж уся решта генерації. `main.py --bake` зменшує їх
+    ще під час збирання (assets/baked/sprites), тож і перший запуск зібраної гри їх не декодує.
+    measure(розмір вихідного, *варіант) — розмір варіанта без побудови (для планування розміщення).
+    """
+    FOLDER = "sprites"
+    BAKED_FOLDER = "assets/baked/sprites"
+
+    def __init__(self, paths, build, max_width=None, measure=None):
+        self.paths = paths
+        self.build = build
+        self.max_width = max_width
+        self.measure = measure
+        self.sources = {}
+        self.variants = {}
+
+    def __len__(self):
+        return len(self.paths)
+
+    def source(self, index):
+        image = self.sources.get(index)
+        if image is None:
+            image = self.sources[index] = self.load_source(self.paths[index])
+        return image
+
+    def load_source(self, path):
+        if self.max_width is None:
+            return Image.open(path).convert("RGBA")
+
+        # Зменшені під час збирання (main.py --bake) постачаються з грою — перший запуск їх не декодує
+        baked_path = self.baked_path(path)
+        if os.path.exists(baked_path):
+            return Image.open(baked_path).convert("RGBA")
+
+        relative = os.path.relpath(path, resource_path("")).replace(os.sep, "/")
+        key = hashlib.sha1(f"{relative}|{source_stamp(path)}|{self.max_width}".encode("utf-8")).hexdigest()[:16]
+        name = os.path.splitext(os.path.basename(path))[0]
+        cached = get_cache_path(self.FOLDER, f"{name}-{self.max_width}-{key}.png")
+        if os.path.exists(cached):
+            return Image.open(cached).convert("RGBA")
+
+        image = self.shrink(path)
+        save_sprite(image, cached)
+        return image
+
+    def shrink(self, path):
+        image = Image.open(path).convert("RGBA")
+        if image.width > self.max_width:
+            height = int(self.max_width * image.height / image.width)
+            image = image.resize((self.max_width, height), Image.LANCZOS, reducing_gap=3.0)
+        return image
+
+    def baked_path(self, path):
+        """
+        Зменшений спрайт серед запечених ресурсів. Ключ — шлях і розмір файлу (а не час зміни:
+        він не переживає копіювання в зібраний застосунок).
+        """
+        relative = os.path.relpath(path, resource_path("")).replace(os.sep, "/")
+        key = hashlib.sha1(f"{relative}|{os.path.getsize(path)}|{self.max_width}".encode("utf-8")).hexdigest()[:16]
+        name = os.path.splitext(os.path.basename(path))[0]
+        return resource_path(os.path.join(self.BAKED_FOLDER, f"{name}-{self.max_width}-{key}.png"))
+
+    def bake(self):
+        """Запікає зменшені вихідні зображення (main.py --bake). Повертає кількість нових файлів."""
+        if self.max_width is None:
+            return 0
+        count = 0
+        for path in self.paths:
+            baked_path = self.baked_path(path)
+            if not os.path.exists(baked_path):
+                os.makedirs(os.path.dirname(baked_path), exist_ok=True)
+                save_sprite(self.shrink(path), baked_path)
+                count += 1
+        return count
+
+    def source_size(self, index):
+        """Розмір вихідного зображення (після зменшення до max_width) — з маніфесту або заголовка PNG."""
+        path = self.paths[index]
+        width, height = manifest.image_size(path) or Image.open(path).size
+        if self.max_width is not None and width > self.max_width:
+            return self.max_width, int(self.max_width * height / width)
+        return width, height
+
+    def size(self, index, *variant):
+        """Розмір варіанта (ширина, висота) без декодування зображень."""
+        return self.measure(self.source_size(index), *variant)
+
+    def get(self, index, *variant):
+        key = (index,) + variant
+        sprite = self.variants.get(key)
+        if sprite is None:
+            sprite = self.variants[key] = np.asarray(self.build(self.source(index), *variant))
+        return sprite
+
+
+def tree_variant(image, flip, scale):
+    """Дерево: можливе дзеркалення і масштаб (LANCZOS)."""
+    if flip:
+        image = image.transpose(Image.FLIP_LEFT_RIGHT)
+    return image.resize((int(image.width * scale), int(image.height * scale)), Image.LANCZOS)
+
+
+def tree_variant_size(size, flip, scale):
+    return int(size[0] * scale), int(size[1] * scale)
+
+
+def web_variant(image, width, brightness=1.8, contrast=1.5):
+    """Павутина заданої ширини (зі збереженням пропорцій), освітлена і контрастніша."""
+    height = int(width * image.height / image.width)
+    web = image.resize((width, height), Image.LANCZOS)
+    web = ImageEnhance.Brightness(web).enhance(brightness)
+    return ImageEnhance.Contrast(web).enhance(contrast)
+
+
+def web_variant_size(size, width, brightness=1.8, contrast=1.5):
+    return width, int(width * size[1] / size[0])
@@ -0,0 +1,137 @@
+import pygame
+
+from core.baked import PIXEL_FORMAT
+
+
+class DeltaFrames:
+    """
+    Компактна послідовність повноекранних кадрів анімації.
+    Замість N Surface розміру екрана тримає одну робочу Surface (поточний кадр) і для кожного переходу
+    між сусідніми кадрами — лише змінені області: їхній вміст «до» і «після».
+    Перехід уперед накладає «після», назад — «до», тож працюють і цикл, і ping-pong.
+    Якщо змінилась більша частина кадру, перехід зберігає кадри повністю (спільні з сусідніми переходами),
+    тож анімація, що змінюється цілком, займає лише на один (робочий) кадр більше за звичайний список.
+    frame(i) відновлює кадр i покроково від поточного і повертає ту саму робочу Surface;
+    окремий перехід «останній → перший» робить повернення циклу на початок одним кроком.
+
+    Побудова не звертається до дисплея (можна у фоновому потоці); convert() — на головному.
+    """
+    TILE = 32  # Розмір клітинки, за якою шукаються зміни
+
+    def __init__(self, frames):
+        self.count = len(frames)
+        self.size = frames[0].get_size()
+        self.surface = frames[0].copy()
+        self.index = 0
+        self.deltas = []  # Для переходу i → i+1: [(Rect, пікселі «до», пікселі «після»), ...]
+        self.wrap = None  # Перехід з останнього кадру на перший: цикл (i % len) повертається на 0 одним кроком
+
+        full = {}  # {індекс: пікселі кадру} — кадри, збережені повністю
+        first = previous = pygame.image.tobytes(frames[0], PIXEL_FORMAT)
+        for index, frame in enumerate(frames[1:]):
+            current = pygame.image.tobytes(frame, PIXEL_FORMAT)
+            self.deltas.append(self.delta(previous, current, full, index, index + 1))
+            previous = current
+        if self.count > 2:
+            self.wrap = self.delta(previous, first, full, self.count - 1, 0)
+
+    def delta(self, previous, current, full, previous_index, current_index):
+        """Перехід між двома кадрами: змінені області або, якщо змінилось більше половини, повні кадри."""
+        screen_rect = pygame.Rect((0, 0), self.size)
+        regions = self.changed_regions(previous, current)
+        if sum(rect.width * rect.height for rect in regions) * 2 > screen_rect.width * screen_rect.height:
+            before = full.setdefault(previous_index, previous)
+            after = full.setdefault(current_index, current)
+            return [(screen_rect, before, after)]
+        return [(rect, self.pack(previous, rect), self.pack(current, rect)) for rect in regions]
+
+    def __len__(self):
+        return self.count
+
+    def changed_regions(self, previous, current):
+        """Прямокутники, що змінились: клітинки TILE×TILE, злиті в горизонтальні смуги."""
+        width, height = self.size
+        stride = width * 4
+        columns = [(x, x * 4, min(x + self.TILE, width) * 4) for x in range(0, width, self.TILE)]
+        changed = []
+        for top in range(0, height, self.TILE):
+            unchanged = columns  # Клітинки смуги, в яких змін ще не знайдено
+            for y in range(top, min(top + self.TILE, height)):
+                start = y * stride
+                if previous[start:start + stride] == current[start:start + stride]:
+                    continue
+                remaining = []
+                for column in unchanged:
+                    x, begin, end = column
+                    if previous[start + begin:start + end] != current[start + begin:start + end]:
+                        changed.append((top, x))
+                    else:
+                        remaining.append(column)
+                unchanged = remaining
+                if not unchanged:
+                    break
+
+        regions = []
+        for top, x in sorted(changed):
+            bottom = min(top + self.TILE, height)
+            right = min(x + self.TILE, width)
+            last = regions[-1] if regions else None
+            if last and last.top == top and last.right == x:
+                last.width = right - last.left
+            else:
+                regions.append(pygame.Rect(x, top, right - x, bottom - top))
+        return regions
+
+    def pack(self, data, rect):
+        stride = self.size[0] * 4
+        rows = (
+            data[(rect.top + row) * stride + rect.left * 4:(rect.top + row) * stride + rect.right * 4]
+            for row in range(rect.height)
+        )
+        return b"".join(rows)
+
+    def apply(self, delta, forward):
+        for rect, before, after in delta:
+            tile = pygame.image.frombuffer(after if forward else before, rect.size, PIXEL_FORMAT)
+            # Точне копіювання з альфою: очищаємо область і додаємо пікселі (без змішування)
+            self.surface.fill((0, 0, 0, 0), rect)
+            self.surface.blit(tile, rect, special_flags=pygame.BLEND_RGBA_ADD)
+
+    def frame(self, index):
+        """
+        Кадр index у робочій Surface (її вміст зміниться під час наступного виклику).
+        Якщо через перехід «останній → перший» кроків менше, ніж напряму, йде через нього.
+        """
+        if self.wrap is not None:
+            last = self.count - 1
+            if index < self.index and (last - self.index) + 1 + index < self.index - index:
+                self.seek(last)
+                self.apply(self.wrap, True)
+                self.index = 0
+            elif index > self.index and self.index + 1 + (last - index) < index - self.index:
+                self.seek(0)
+                self.apply(self.wrap, False)
+                self.index = last
+        self.seek(index)
+        return self.surface
+
+    def seek(self, index):
+        while self.index < index:
+            self.apply(self.deltas[self.index], True)
+            self.index += 1
+        while self.index > index:
+            self.index -= 1
+            self.apply(self.deltas[self.index], False)
+
+    def memory_bytes(self):
+        """Пікселі робочої Surface плюс змінені області всіх переходів (спільні кадри — один раз)."""
+        deltas = self.deltas + ([self.wrap] if self.wrap is not None else [])
+        stored = {
+            id(data): len(data) for delta in deltas for _, before, after in delta for data in (before, after)
+        }
+        return self.surface.get_bytesize() * self.size[0] * self.size[1] + sum(stored.values())
+
+    def convert(self):
+        """Переводить робочу Surface у формат екрана (головний потік)."""
+        self.surface = self.surface.convert_alpha()
+        return self
@@ -0,0 +1,69 @@
+import builtins
+import sys
+import threading
+import time
+
+
+class ImportTimer:
+    """
+    Вбудований аналог `python -X importtime`: підміняє builtins.__import__ і міряє,
+    скільки часу займає перший імпорт кожного модуля (власний і сумарний з вкладеними).
+    Рахуються лише імпорти з потоку, що його увімкнув (фонові передзавантаження не змішуються).
+    """
+    FLAG = "--import-times"
+
+    def __init__(self):
+        self.owner = threading.get_ident()
+        self.records = []       # [(глибина, модуль, власний мс, сумарний мс), ...] у порядку завершення
+        self.stack = []         # Час вкладених імпортів для кожного рівня
+        self.original_import = None
+        self.started_at = time.perf_counter()
+
+    @classmethod
+    def from_argv(cls, argv):
+        """Вмикає таймер, якщо гру запущено з --import-times (до імпорту pygame та сцен)."""
+        if cls.FLAG not in argv:
+            return None
+        timer = cls()
+        timer.install()
+        return timer
+
+    def install(self):
+        self.original_import = builtins.__import__
+        builtins.__import__ = self._import
+
+    def uninstall(self):
+        if self.original_import is not None:
+            builtins.__import__ = self.original_import
+            self.original_import = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level != 0 or name in sys.modules or threading.get_ident() != self.owner:
+            return self.original_import(name, globals, locals, fromlist, level)
+
+        self.stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self.original_import(name, globals, locals, fromlist, level)
+        finally:
+            total = (time.perf_counter() - start) * 1000
+            children = self.stack.pop()
+            if self.stack:
+                self.stack[-1] += total
+            self.records.append((len(self.stack), name, total - children, total))
+
+    def report(self, first_frame_ms=None, limit=25, min_ms=1.0):
+        """Друкує найдовші імпорти (за сумарним часом) і час до першого кадру."""
+        top_level = sum(total for depth, _, _, total in self.records if depth == 0)
+        lines = [
+            f"📦 Імпорти: {len(self.records)} модулів, {top_level:.1f} мс на верхньому рівні",
+            f"{'власний мс':>12}{'сумарний мс':>14}  модуль",
+        ]
+        slowest = sorted(self.records, key=lambda record: record[3], reverse=True)[:limit]
+        for depth, name, self_ms, total in slowest:
+            if total < min_ms:
+                break
+            lines.append(f"{self_ms:>12.1f}{total:>14.1f}  {'  ' * depth}{name}")
+        if first_frame_ms is not None:
+            lines.append(f"🚀 Перший кадр через {first_frame_ms:.0f} мс після старту main.py")
+        print("\n".join(lines))
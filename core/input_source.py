@@ -0,0 +1,67 @@
+import pygame
+
+
+class KeyState:
+    """
+    Знімок натиснутих клавіш. Індексується так само, як результат pygame.key.get_pressed().
+    """
+    def __init__(self, keys=()):
+        self.keys = frozenset(keys)
+
+    def __getitem__(self, key):
+        return key in self.keys
+
+
+class KeyboardInput:
+    """
+    Живе введення з клавіатури (джерело за замовчуванням).
+    """
+    def get_pressed(self):
+        return pygame.key.get_pressed()
+
+    def get_mods(self):
+        return pygame.key.get_mods()
+
+
+class ScriptedInput:
+    """
+    Введення за сценарієм: послідовність відрізків (кількість кадрів, клавіші, модифікатори).
+    Після кінця сценарію починає спочатку, якщо loop=True.
+    hero_data і world_seed, якщо задані, замінюють героя і seed світу зі збереження гравця.
+    Сесія за сценарієм не записує прогрес у збереження гравця (saves_progress).
+    """
+    saves_progress = False
+
+    def __init__(self, timeline, loop=True, hero_data=None, world_seed=None):
+        self.timeline = list(timeline)
+        self.loop = loop
+        self.hero_data = hero_data
+        self.world_seed = world_seed
+        self.frame = 0
+        self.total_frames = sum(frames for frames, _, _ in self.timeline)
+
+    def current_segment(self):
+        if not self.timeline:
+            return (), 0
+
+        frame = self.frame
+        if self.loop and self.total_frames:
+            frame %= self.total_frames
+
+        for frames, keys, mods in self.timeline:
+            if frame < frames:
+                return keys, mods
+            frame -= frames
+        return (), 0
+
+    def get_pressed(self):
+        keys, _ = self.current_segment()
+        return KeyState(keys)
+
+    def get_mods(self):
+        _, mods = self.current_segment()
+        return mods
+
+    def advance(self):
+        """Переходить до наступного кадру сценарію."""
+        self.frame += 1
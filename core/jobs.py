@@ -0,0 +1,151 @@
+import os
+import time
+import inspect
+import logging
+import multiprocessing
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+logger = logging.getLogger("Jobs")
+
+
+class Job:
+    """Фонова робота і її завершення на головному потоці."""
+    def __init__(self, owner, on_done, on_error=None):
+        self.owner = owner
+        self.on_done = on_done
+        self.on_error = on_error
+        self.future = None
+        self.completion = None  # Генератор, якщо завершення розбите на кроки
+        self.finished = False
+        self.cancelled = False
+
+
+class JobSystem:
+    """
+    Пул робочих потоків для I/O і декодування (PIL, pygame.image.load без convert, звуки)
+    та черга завершень, які виконуються на головному потоці в межах бюджету кадру (pump).
+    Завершення on_done(результат) робить те, що потребує дисплея: convert_alpha, scale, приєднання до сцени.
+    Якщо on_done повертає генератор, pump просуває його по кроку, тож довге завершення
+    (наприклад, десятки кадрів GIF) розтягується на кілька кадрів.
+    Завдання, що впало з помилкою, завершується без on_done — замість нього pump викликає on_error(помилка).
+
+    CPU-важка робота (генерація шарів рівня на PIL/numpy) йде через submit_process у пул процесів:
+    у потоках вона ділила б з грою одне ядро через GIL.
+    """
+    DEFAULT_WORKERS = max(2, min(4, (os.cpu_count() or 2) - 1))
+    PROCESS_WORKERS = max(1, (os.cpu_count() or 1) - 1)  # Одне ядро лишається головному потоку гри
+
+    def __init__(self, workers=DEFAULT_WORKERS):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="job")
+        self.processes = None  # ProcessPoolExecutor, створюється під час першого submit_process
+        self.ready = deque()  # Завдання, чия фонова частина виконана (додають робочі потоки)
+        self.active = []      # Незавершені завдання (лише головний потік)
+
+    def submit(self, work, *args, owner=None, on_done=None, on_error=None):
+        """Запускає work(*args) у пулі; on_done(результат) буде викликано з pump() на головному потоці."""
+        return self.track(Job(owner, on_done, on_error), self.executor.submit(work, *args))
+
+    def submit_process(self, work, *args, owner=None, on_done=None, on_error=None):
+        """
+        Як submit, але work(*args) виконується в окремому процесі.
+        work — функція рівня модуля, аргументи і результат мають серіалізуватись (масиви numpy, шляхи; не Surface).
+        Процеси запускаються через spawn (fork не безпечний після ініціалізації SDL), тож main.py не запускає гру,
+        якщо його імпортує дочірній процес.
+        """
+        if self.processes is None:
+            self.processes = ProcessPoolExecutor(
+                max_workers=self.PROCESS_WORKERS, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self.track(Job(owner, on_done, on_error), self.processes.submit(work, *args))
+
+    def track(self, job, future):
+        self.active.append(job)
+        job.future = future
+        future.add_done_callback(lambda future: self.completed(job))
+        return job
+
+    def completed(self, job):
+        """Робочий потік: фонова частина виконана. Скасоване завдання не чекає на pump — його результат не потрібен."""
+        if not job.cancelled:
+            self.ready.append(job)
+
+    def pump(self, budget_ms):
+        """Виконує завершення готових завдань, поки не вичерпано бюджет (щонайменше один крок)."""
+        deadline = time.perf_counter() + budget_ms / 1000
+        while self.ready:
+            job = self.ready[0]
+            if not job.cancelled:
+                self.step(job)
+            if job.cancelled or job.finished:
+                self.ready.popleft()
+            if time.perf_counter() >= deadline:
+                break
+
+    def step(self, job):
+        try:
+            if job.completion is None:
+                outcome = job.on_done(job.future.result()) if job.on_done else job.future.result()
+                if not inspect.isgenerator(outcome):
+                    self.finish(job)
+                    return
+                job.completion = outcome
+            next(job.completion)
+        except StopIteration:
+            self.finish(job)
+        except Exception as e:
+            logger.warning(f"[Jobs] Завдання '{job.owner}' завершилось з помилкою: {e}")
+            self.finish(job)
+            if job.on_error:
+                job.on_error(e)
+
+    def finish(self, job):
+        job.finished = True
+        job.completion = None
+        if job in self.active:
+            self.active.remove(job)
+
+    def busy(self, owner):
+        """Чи є в owner незавершені завдання (фонова частина або завершення на головному потоці)."""
+        return any(job.owner == owner for job in self.active)
+
+    def cancel(self, owner):
+        """Скасовує завдання власника (сцену знищено): їхні завершення вже не виконуються."""
+        for job in [job for job in self.active if job.owner == owner]:
+            self.cancel_job(job)
+
+    def cancel_job(self, job):
+        """Скасовує одне завдання (його результат більше не потрібен)."""
+        if job.finished or job.cancelled:
+            return
+        job.cancelled = True
+        job.completion = None
+        job.future.cancel()
+        self.active.remove(job)
+        try:
+            self.ready.remove(job)  # Готовий результат (наприклад, декодована плитка) звільняється одразу
+        except ValueError as e:
+            pass
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        if self.processes is not None:
+            self.processes.shutdown(wait=False, cancel_futures=True)
+            self.processes = None
+        self.active.clear()
+        self.ready.clear()
+
+
+def advance_steps(steps, budget_ms, waiting=lambda: False):
+    """
+    Просуває генератор кроків завантаження сцени, поки не вичерпано бюджет кадру
+    або поки сцена чекає на свої фонові завдання (waiting). Повертає False, коли кроки закінчились.
+    """
+    deadline = time.perf_counter() + budget_ms / 1000
+    try:
+        while True:
+            next(steps)
+            if waiting() or time.perf_counter() >= deadline:
+                return True
+    except StopIteration:
+        return False
@@ -0,0 +1,97 @@
+import os
+import glob
+import shutil
+import json
+import hashlib
+import logging
+import threading
+
+from utils.resource_loader import get_cache_path, resource_path
+
+logger = logging.getLogger("LayerCache")
+
+# Збільшуйте, коли змінюється алгоритм генерації шарів — старі результати стануть недійсними
+LAYER_CACHE_VERSION = 5
+
+
+class LayerCache:
+    """
+    Кеш згенерованих шарів рівня в папці користувача, адресований вмістом:
+    ім'я файлу містить хеш параметрів генерації, seed світу і хешів вихідних зображень.
+    Якщо щось із цього змінилось — ключ інший, тож шар перебудовується; старі варіанти видаляються, щойно створено новий.
+    """
+    FOLDER = "layers"
+    SOURCES_INDEX = "sources.json"
+    EXTENSION = ""  # Шар — папка з заголовком і плитками (core.tiled_layer)
+
+    def __init__(self):
+        self.index_path = get_cache_path(self.FOLDER, self.SOURCES_INDEX)
+        self.lock = threading.Lock()
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                self.source_hashes = json.load(f)  # {шлях: [розмір, mtime, sha1]}
+        except Exception as e:
+            self.source_hashes = {}
+        self.index_changed = False
+
+    def source_hash(self, path):
+        """sha1 вмісту файлу; перераховується, лише якщо змінились розмір або час зміни."""
+        stat = os.stat(path)
+        stamp = [stat.st_size, int(stat.st_mtime)]
+        relative = os.path.relpath(path, resource_path("")).replace(os.sep, "/")
+        cached = self.source_hashes.get(relative)
+        if cached and cached[:2] == stamp:
+            return cached[2]
+
+        digest = hashlib.sha1()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        self.source_hashes[relative] = stamp + [digest.hexdigest()]
+        self.index_changed = True
+        return digest.hexdigest()
+
+    def key(self, params, seed, sources):
+        """Ключ результату генерації: параметри, seed і вміст кожного вихідного файлу."""
+        description = {
+            "version": LAYER_CACHE_VERSION,
+            "params": params,
+            "seed": seed,
+            "sources": sorted(
+                (os.path.relpath(path, resource_path("")).replace(os.sep, "/"), self.source_hash(path))
+                for path in sources
+            ),
+        }
+        self.save_index()
+        return hashlib.sha1(json.dumps(description, sort_keys=True).encode("utf-8")).hexdigest()[:20]
+
+    def path(self, layer_name, key):
+        return get_cache_path(self.FOLDER, f"{layer_name}-{key}{self.EXTENSION}")
+
+    def save_index(self):
+        if not self.index_changed:
+            return
+        try:
+            with open(self.index_path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(self.source_hashes, f)
+            os.replace(self.index_path + ".tmp", self.index_path)
+            self.index_changed = False
+        except Exception as e:
+            logger.warning(f"[LayerCache] Не вдалося зберегти індекс хешів: {e}")
+
+    def prune(self, path):
+        """
+        Видаляє застарілі варіанти того самого шару (з іншими ключами або в старому форматі —
+        файли .tiles і .png) і недописані .tmp, коли новий уже створено.
+        """
+        layer_name = os.path.basename(path).rsplit("-", 1)[0]
+        with self.lock:
+            for stale in glob.glob(get_cache_path(self.FOLDER, f"{layer_name}-*")):
+                if stale != path:
+                    try:
+                        if os.path.isdir(stale):
+                            shutil.rmtree(stale)
+                        else:
+                            os.remove(stale)
+                    except OSError as e:
+                        pass
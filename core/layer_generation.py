@@ -0,0 +1,282 @@
+import copy
+from abc import ABC, abstractmethod
+from fractions import Fraction
+
+import numpy as np
+from PIL import Image, ImageEnhance, ImageFilter, ImageStat
+
+from core.compositor import SpriteBank, alpha_paste, tree_variant, tree_variant_size, web_variant, web_variant_size
+from core.tiled_layer import TILE_WIDTH, write_tile
+
+# Генерація шарів Level1 для пулу процесів (JobSystem.submit_process).
+# Шар описує рецепт — невеликий об'єкт, що серіалізується (шляхи, розміщення, ефекти) і вміє побудувати
+# будь-який відрізок шару по X. Тож шар генерується плитками в міру того, як до них наближається камера,
+# а сусідні плитки стикуються без швів: кожна будується з тим самим запасом, що й цілий шар.
+
+MEAN_WIDTH = 2048  # Середня яскравість для контрасту міряється на початку шару — одна для всіх плиток
+RESIZE_MARGIN = 4  # Запас навколо відрізка для фільтра масштабування (BICUBIC)
+
+
+def contrast(image, factor, mean):
+    """ImageEnhance.Contrast із заданою середньою яскравістю (а не порахованою по зображенню)."""
+    degenerate = Image.new("L", image.size, mean).convert(image.mode)
+    if "A" in image.getbands():
+        degenerate.putalpha(image.getchannel("A"))
+    return Image.blend(degenerate, image, factor)
+
+
+EFFECTS = {
+    "brightness": lambda image, factor: ImageEnhance.Brightness(image).enhance(factor),
+    "contrast": contrast,
+    "blur": lambda image, radius: image.filter(ImageFilter.GaussianBlur(radius)),
+}
+
+
+def apply_effects(image, effects):
+    """Ефекти по черзі: [("brightness", 0.9), ("contrast", 0.6, середня), ("blur", 1.3), ...]."""
+    for name, *values in effects:
+        image = EFFECTS[name](image, *values)
+    return image
+
+
+def effects_margin(effects):
+    """Скільки пікселів навколо відрізка потрібно, щоб розмиття на його краях не відрізнялось від цілого шару."""
+    return sum(int(values[0] * 6) + 8 for name, *values in effects if name == "blur")
+
+
+def source_variant(image):
+    return image
+
+
+def source_variant_size(size):
+    return size
+
+
+# Банки спрайтів за видом: побудова варіанта і його розмір без побудови
+BUILDERS = {
+    "trees": (tree_variant, tree_variant_size),
+    "webs": (web_variant, web_variant_size),
+    "fogs": (source_variant, source_variant_size),
+}
+_banks = {}  # Банки процесу: варіанти спрайтів будуються один раз на процес, а не на кожну плитку
+
+
+def sprite_bank(kind, files, max_width=None):
+    key = (kind, tuple(files), max_width)
+    bank = _banks.get(key)
+    if bank is None:
+        build, measure = BUILDERS[kind]
+        bank = _banks[key] = SpriteBank(files, build, max_width=max_width, measure=measure)
+    return bank
+
+
+class LayerRecipe(ABC):
+    """Спільне для рецептів: width, height і запис плитки, яку будує render(left, right)."""
+    width = 0
+    height = 0
+    effects = ()
+
+    @abstractmethod
+    def render(self, left, right):
+        """Відрізок шару [left, right) по X на всю висоту (RGBA Image)."""
+
+    def write_tile(self, path, index):
+        left = index * TILE_WIDTH
+        write_tile(path, index, self.render(left, min(left + TILE_WIDTH, self.width)))
+
+    def contrast_mean(self):
+        """Середня яскравість (L) початку шару перед контрастом, або None, якщо контрасту немає."""
+        names = [effect[0] for effect in self.effects]
+        if "contrast" not in names:
+            return None
+        probe = copy.copy(self)
+        probe.effects = self.effects[:names.index("contrast")]
+        image = probe.render(0, min(self.width, MEAN_WIDTH))
+        return int(ImageStat.Stat(image.convert("L")).mean[0] + 0.5)
+
+    def set_contrast_mean(self, mean):
+        self.effects = [(name, values[0], mean) if name == "contrast" else (name, *values)
+                        for name, *values in self.effects]
+
+
+class GroundRecipe(LayerRecipe):
+    """Земля: тайл ground.png на всю довжину рівня з чергуванням дзеркалення."""
+    def __init__(self, image_path, size, width):
+        self.image_path = image_path
+        self.tile_size = size
+        self.width = width
+        self.height = size[1]
+
+    def render(self, left, right):
+        ground_img = Image.open(self.image_path)
+        tile_width = self.tile_size[0]
+        image = Image.new("RGBA", (right - left, self.height), (0, 0, 0, 0))
+        for index in range(left // tile_width, -(-right // tile_width)):
+            tile = ground_img.transpose(Image.FLIP_LEFT_RIGHT) if index % 2 else ground_img
+            tile = tile.crop((0, 0, min(tile_width, self.width - index * tile_width), self.height))
+            image.paste(tile, (index * tile_width - left, 0))
+        return image
+
+
+class CompositeRecipe(LayerRecipe):
+    """
+    Шар, накладений зі спрайтів (ліс, туман). placements — [(банк, індекс, варіант, x, y, ширина), ...]
+    у порядку накладання; banks — {банк: (файли, max_width)}. Відрізок накладає лише спрайти, що його перетинають,
+    у тому самому порядку, тож кожен піксель такий самий, як на цілому полотні.
+    """
+    def __init__(self, width, height, banks, placements, effects=()):
+        self.width = width
+        self.height = height
+        self.banks = banks
+        self.placements = placements
+        self.effects = list(effects)
+
+    def render(self, left, right):
+        margin = effects_margin(self.effects)
+        start, end = max(0, left - margin), min(self.width, right + margin)
+        canvas = np.zeros((self.height, end - start, 4), dtype=np.uint8)
+        for bank, index, variant, x, y, width in self.placements:
+            if x < end and x + width > start:
+                sprite = sprite_bank(bank, *self.banks[bank]).get(index, *variant)
+                alpha_paste(canvas, sprite, x - start, y)
+        image = apply_effects(Image.fromarray(canvas), self.effects)
+        return image.crop((left - start, 0, right - start, self.height))
+
+
+class DerivedRecipe(LayerRecipe):
+    """
+    Шар — перетворення іншого: дзеркалення, масштаб і власні ефекти (другий шар лісу й туману).
+    Масштабується відрізок, вирівняний на період масштабу (для 0.9 — 9 пікселів шару на 10 вихідного):
+    тоді коефіцієнти фільтра ті самі, що й під час масштабування цілого шару, і плитки стикуються без швів.
+    """
+    def __init__(self, source, scale, effects=()):
+        self.source = source
+        self.width = int(source.width * scale)
+        self.height = int(source.height * scale)
+        self.effects = list(effects)
+
+    def render(self, left, right):
+        margin = effects_margin(self.effects)
+        start, end = max(0, left - margin), min(self.width, right + margin)
+
+        # Вирівняний відрізок шару із запасом для фільтра і відповідний йому відрізок дзеркального вихідного шару
+        ratio = Fraction(self.source.width, self.width)
+        period = ratio.denominator
+        part_start = max(0, (start - RESIZE_MARGIN) // period * period)
+        part_end = min(self.width, -(-(end + RESIZE_MARGIN) // period) * period)
+        flipped_start, flipped_end = int(part_start * ratio), int(part_end * ratio)
+        part = self.source.render(self.source.width - flipped_end, self.source.width - flipped_start)
+        part = part.transpose(Image.FLIP_LEFT_RIGHT)
+
+        if part.size != (part_end - part_start, self.height):
+            part = part.resize((part_end - part_start, self.height))
+        image = apply_effects(part.crop((start - part_start, 0, end - part_start, self.height)), self.effects)
+        return image.crop((left - start, 0, right - start, self.height))
+
+
+def bake_sprites(recipes):
+    """Зменшує під час збирання вихідні зображення банків, які цього потребують (павутина). Повертає кількість."""
+    count = 0
+    for recipe in recipes:
+        for kind, (files, *options) in getattr(recipe, "banks", {}).items():
+            count += sprite_bank(kind, files, *options).bake()
+    return count
+
+
+def measure_contrast(recipe):
+    """Завдання для пулу процесів: середня яскравість для контрасту (рецепт повертається в головний процес)."""
+    return recipe.contrast_mean()
+
+
+def plan_fog(bank, long, count, rng):
+    """Розміщення туману: count випадкових текстур внизу полотна. Повертає висоту полотна і розміщення."""
+    sizes = [bank.source_size(index) for index in range(len(bank))]
+    max_height = max(height for _, height in sizes) + 200
+    placements = []
+    for _ in range(count):
+        index = rng.randrange(len(bank))
+        width, height = sizes[index]
+        x = rng.randint(0, long - width)
+        placements.append(("fogs", index, (), x, max_height - height, width))
+    return max_height, placements
+
+
+def plan_forest(tree_bank, web_bank, long, trees, min_distance, max_distance, rng):
+    """
+    Розміщення лісу: послідовне (кожне дерево — від попереднього), але дешеве — потрібні лише розміри варіантів.
+    Повертає висоту полотна і список [(банк, індекс, варіант, x, y, ширина), ...] у порядку накладання.
+    """
+    max_height = max(tree_bank.source_size(index)[1] for index in range(len(tree_bank))) + 200
+    placements = []
+
+    min_scale, max_scale = 0.95, 1.05
+
+    def pick_tree(index):
+        # Можлива трансформація; масштаб округлюється до сотих, щоб варіанти повторювались
+        flip = rng.random() < 0.5
+        scale = round(rng.uniform(min_scale, max_scale), 2)
+        return index, (flip, scale), tree_bank.size(index, flip, scale)
+
+    def fits(x, width):
+        """Чи може дерево шириною width стати хоча б з найменшим відступом від дерева в x."""
+        return x + min_distance - width // 2 < long - width
+
+    narrowest = min(tree_bank.size(index, False, min_scale)[0] for index in range(len(tree_bank)))
+
+    tree_positions = []  # Центри дерев по X
+    tree_bases = []  # Бази дерев для розміщення павутин
+
+    # === Перше дерево — на початку полотна ===
+    index, variant, (tree_width, tree_height) = pick_tree(0)
+    y = max_height - tree_height
+    tree_positions.append(tree_width // 2)
+    tree_bases.append((tree_width // 2, y))
+    placements.append(("trees", index, variant, 0, y, tree_width))
+
+    # === Решта дерев ===
+    for _ in range(trees - 1):
+        # Жоден варіант уже не поміститься: решта дерев нічого б не додала
+        if not fits(tree_positions[-1], narrowest):
+            break
+
+        index, variant, (tree_width, tree_height) = pick_tree(rng.randrange(len(tree_bank)))
+
+        # Це дерево не влазить навіть з найменшим відступом — пропускаємо його без 10000 марних спроб;
+        # вужчі дерева далі ще можуть поміститися
+        if not fits(tree_positions[-1], tree_width):
+            continue
+
+        valid_position = False
+        attempts = 0
+
+        # Пошук валідної позиції для дерева
+        while not valid_position and attempts < 10000:
+            new_x = tree_positions[-1] + rng.randint(min_distance, max_distance)
+            if 0 <= new_x - tree_width // 2 < long - tree_width:
+                valid_position = True
+                tree_positions.append(new_x)
+            attempts += 1
+
+        if not valid_position:
+            continue
+
+        x = new_x - tree_width // 2
+        y = max_height - tree_height
+        placements.append(("trees", index, variant, x, y, tree_width))
+        tree_bases.append((x + tree_width // 2, y))
+
+        # === Павутина між деревами ===
+        if web_bank:
+            web_index = rng.randrange(len(web_bank))
+            prev_x, prev_y = tree_bases[-2]
+            curr_x, curr_y = tree_bases[-1]
+
+            distance = max(abs(curr_x - prev_x), 40)
+            web_variant_key = (max(distance // 16 * 16, 40),)  # Ширина з кроком 16 px
+            web_width, web_height = web_bank.size(web_index, *web_variant_key)
+
+            web_x = (prev_x + curr_x) // 2 - web_width // 2
+            web_y = max_height - int(web_height * rng.randint(5, 15) // 10)
+            placements.append(("webs", web_index, web_variant_key, web_x, web_y, web_width))
+
+    return max_height, placements
@@ -0,0 +1,34 @@
+import time
+import logging
+
+logger = logging.getLogger("LazyScene")
+
+
+class LazyScene:
+    """
+    Фабрика сцени, яка імпортує модуль сцени лише під час першого створення.
+    Так модулі рівнів (разом з numpy, PIL, surfarray) не сповільнюють появу меню.
+    build(cls) створює екземпляр з потрібними аргументами: lambda cls: cls(scene_manager, audio_manager).
+    """
+    def __init__(self, module, class_name, build):
+        self.module = module
+        self.class_name = class_name
+        self.build = build
+        self.scene_class = None
+
+    def load(self):
+        if self.scene_class is None:
+            start = time.perf_counter()
+            module = __import__(self.module, fromlist=[self.class_name])
+            self.scene_class = getattr(module, self.class_name)
+            logger.info(f"[LazyScene] {self.module} імпортовано за {(time.perf_counter() - start) * 1000:.1f} мс")
+        return self.scene_class
+
+    def method(self, name):
+        """Відкладене посилання на статичний метод сцени (наприклад, preload_assets)."""
+        def call(*args, **kwargs):
+            return getattr(self.load(), name)(*args, **kwargs)
+        return call
+
+    def __call__(self):
+        return self.build(self.load())
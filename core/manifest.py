@@ -0,0 +1,126 @@
+import os
+import json
+import logging
+import threading
+
+from utils.resource_loader import resource_path
+
+logger = logging.getLogger("Manifest")
+
+MANIFEST_VERSION = 2
+MANIFEST_PATH = "assets/manifest.json"
+ASSETS_ROOT = "assets"
+IMAGE_EXTENSIONS = (".png", ".gif", ".jpg", ".jpeg")
+SKIP_FOLDERS = ("assets/baked",)  # Результати збирання, а не ресурси
+
+
+def relative(path):
+    return os.path.relpath(path, resource_path("")).replace(os.sep, "/")
+
+
+def folder_stamp(folder):
+    """
+    {ім'я: розмір у байтах} файлів папки. Переживає копіювання ресурсів у збірку PyInstaller,
+    на відміну від mtime, який під час копіювання не зберігається.
+    """
+    with os.scandir(folder) as entries:
+        return {entry.name: entry.stat().st_size for entry in entries
+                if entry.is_file() and not entry.name.startswith(".")}
+
+
+def build_manifest(root=ASSETS_ROOT):
+    """
+    Опис усіх папок ресурсів: {папка: {"stamp": {ім'я: байти}, "files": [відсортовані імена], "sizes": {ім'я: [w, h]}}}.
+    Розміри зображень читаються із заголовків файлів (PIL не декодує пікселі).
+    """
+    from PIL import Image  # Лише для `main.py --manifest`: гра читає готовий manifest.json
+
+    folders = {}
+    for folder, dirs, files in os.walk(resource_path(root)):
+        dirs[:] = sorted(d for d in dirs if relative(os.path.join(folder, d)) not in SKIP_FOLDERS)
+        names = sorted(f for f in files if not f.startswith("."))
+        sizes = {}
+        for name in names:
+            if name.lower().endswith(IMAGE_EXTENSIONS):
+                try:
+                    with Image.open(os.path.join(folder, name)) as image:
+                        sizes[name] = list(image.size)
+                except Exception as e:
+                    pass
+        folders[relative(folder)] = {"stamp": folder_stamp(folder), "files": names, "sizes": sizes}
+    return {"version": MANIFEST_VERSION, "folders": folders}
+
+
+def write_manifest():
+    """Генерує assets/manifest.json (див. `main.py --manifest`). Повертає кількість папок."""
+    path = resource_path(MANIFEST_PATH)
+    data = build_manifest()
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(path + ".tmp", path)
+    manifest.folders = None  # Перечитати під час наступного запиту
+    return len(data["folders"])
+
+
+class AssetManifest:
+    """
+    Списки файлів у папках ресурсів, завантажені один раз і доступні з пам'яті,
+    щоб завантажувачі та ігрові шляхи (звуки ворон, атаки павуків) не зверталися до файлової системи.
+    Запис маніфесту перевіряється під час першого запиту до папки (імена і розміри файлів, folder_stamp):
+    папки, яких немає в маніфесті або які змінились після генерації, читаються з диска і теж запам'ятовуються.
+    """
+    def __init__(self):
+        self.folders = None  # {відносна папка: {"files": [...], "sizes": {...}}} — перевірені записи
+        self.listed = {}     # Записи manifest.json, ще не перевірені
+        self.lock = threading.Lock()  # Запити бувають і з робочих потоків (передзавантаження)
+
+    def load(self):
+        self.folders = {}
+        self.listed = {}
+        try:
+            with open(resource_path(MANIFEST_PATH), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == MANIFEST_VERSION:
+                self.listed = data["folders"]
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"[Manifest] Не вдалося прочитати {MANIFEST_PATH}: {e}")
+
+    def entry(self, folder):
+        with self.lock:
+            if self.folders is None:
+                self.load()
+        key = relative(folder)
+        entry = self.folders.get(key)
+        if entry is None:
+            entry = self.listed.pop(key, None)
+            try:
+                if entry is not None and folder_stamp(folder) == entry["stamp"]:
+                    self.folders[key] = entry
+                    return entry
+            except OSError as e:
+                pass
+            files = sorted(f for f in os.listdir(folder) if not f.startswith(".")) if os.path.isdir(folder) else []
+            entry = self.folders[key] = {"files": files, "sizes": {}}
+        return entry
+
+    def names(self, folder, extensions=None):
+        """Відсортовані імена файлів папки (з потрібними розширеннями, без урахування регістру)."""
+        files = self.entry(folder)["files"]
+        if extensions is None:
+            return list(files)
+        return [name for name in files if name.lower().endswith(extensions)]
+
+    def files(self, folder, extensions=None):
+        """Повні шляхи файлів папки, відсортовані за іменем."""
+        return [os.path.join(folder, name) for name in self.names(folder, extensions)]
+
+    def image_size(self, path):
+        """Розмір зображення (w, h) з маніфесту без відкриття файлу, або None."""
+        size = self.entry(os.path.dirname(path))["sizes"].get(os.path.basename(path))
+        return tuple(size) if size else None
+
+
+# Спільний маніфест ресурсів гри
+manifest = AssetManifest()
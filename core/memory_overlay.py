@@ -0,0 +1,71 @@
+import pygame
+
+from utils.memory import memory_report, format_bytes
+
+
+class MemoryOverlay:
+    """
+    Оверлей пам'яті (F5): скільки байтів пікселів і звуку утримують сцени (поточна, під паузою, у кеші),
+    кеші кадрів Player/Spider і AudioManager.sounds. Звіт перераховується раз на REFRESH_FRAMES кадрів —
+    обхід усіх Surface надто дорогий, щоб робити його щокадру.
+    """
+    REFRESH_FRAMES = 30
+
+    def __init__(self, scene_manager):
+        self.scene_manager = scene_manager
+        self.enabled = False
+        self.frames_left = 0
+        self.rows = []
+        self.total = 0
+        self.font = None
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.frames_left = 0
+
+    def refresh(self):
+        self.rows, self.total = memory_report(self.scene_manager)
+        self.frames_left = self.REFRESH_FRAMES
+
+    def print_report(self):
+        """Друкує поточний звіт у консоль (для порівняння до/після змін без оверлею)."""
+        self.refresh()
+        lines = [f"🧠 Пам'ять: {format_bytes(self.total)}"]
+        lines += [f"{'  ' * (level + 1)}{label}: {format_bytes(size)}" for label, size, level in self.rows]
+        print("\n".join(lines))
+        return self.rows, self.total
+
+    def draw(self, screen):
+        if not self.enabled:
+            return
+
+        if self.frames_left <= 0:
+            self.refresh()
+        self.frames_left -= 1
+
+        if self.font is None:
+            self.font = pygame.font.Font(None, 20)
+
+        line_h = self.font.get_linesize()
+        panel_w = 380
+        panel_h = 20 + line_h * (len(self.rows) + 2)
+        panel = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+
+        cache = self.scene_manager
+        y = 10
+        header = f"пам'ять: {format_bytes(self.total)}   кеш сцен: {format_bytes(cache.scene_cache_bytes())}"
+        panel.blit(self.font.render(header, True, (255, 255, 255)), (10, y))
+        y += line_h
+        panel.blit(self.font.render(f"бюджет кешу: {format_bytes(cache.scene_cache_budget)}", True, (170, 170, 170)), (10, y))
+
+        # 🧾 Власники ресурсів; вкладені рядки — найбільші атрибути сцени
+        for label, size, level in self.rows:
+            y += line_h
+            color = (210, 210, 210) if level == 0 else (160, 160, 160)
+            text = self.font.render(f"{'   ' * level}{label}", True, color)
+            panel.blit(text, (10, y))
+            value = self.font.render(format_bytes(size), True, color)
+            panel.blit(value, (panel_w - 10 - value.get_width(), y))
+
+        screen.blit(panel, (screen.get_width() - panel_w - 10, 10))
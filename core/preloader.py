@@ -0,0 +1,144 @@
+import os
+import logging
+
+import pygame
+
+from core.manifest import manifest
+
+logger = logging.getLogger("Preloader")
+
+
+def decode_gif_frames(path, composite=False, size=None):
+    """
+    Декодує кадри GIF через PIL у сирі RGBA-дані [(bytes, size, mode), ...].
+    composite=True накладає кожен кадр на попередній (повна картинка кадру),
+    size — масштабування (LANCZOS) ще на етапі декодування.
+    Не звертається до дисплея, тому безпечна для фонового потоку.
+    """
+    from PIL import Image, ImageSequence  # PIL потрібен лише для GIF: не вантажимо його разом із SceneManager
+
+    frames = []
+    previous = None
+    with Image.open(path) as gif:
+        for frame in ImageSequence.Iterator(gif):
+            frame = frame.convert("RGBA")
+            if composite:
+                frame = Image.alpha_composite(previous, frame) if previous is not None else frame.copy()
+                previous = frame
+            if size is not None:
+                frame = frame.resize(size, Image.Resampling.LANCZOS)
+            frames.append((frame.tobytes(), frame.size, frame.mode))
+    return frames
+
+
+def list_files(folder, extensions):
+    """Відсортований список файлів з потрібними розширеннями (порожній, якщо папки немає)."""
+    return manifest.files(folder, extensions)
+
+
+class AssetBundle:
+    """
+    Заздалегідь декодовані ресурси сцени: зображення (ще без convert), звуки та кадри GIF.
+    Заповнюється у фоновому потоці методами add_*; сцена бере ресурси методами image/sound/gif_frames
+    і викликає clear(), коли завантаження завершено.
+    Якщо ресурсу в наборі немає — він завантажується одразу (синхронно), тож сцена працює і без передзавантаження.
+    """
+    def __init__(self):
+        self.images = {}
+        self.sounds = {}
+        self.gifs = {}
+
+    # --- Фоновий потік ---
+    def add_image(self, path):
+        try:
+            self.images[path] = pygame.image.load(path)
+        except Exception as e:
+            logger.warning(f"[Preloader] Не вдалося декодувати {path}: {e}")
+
+    def add_images(self, folder, extensions=(".png",)):
+        for path in list_files(folder, extensions):
+            self.add_image(path)
+
+    def add_sound(self, path):
+        try:
+            self.sounds[path] = pygame.mixer.Sound(path)
+        except Exception as e:
+            logger.warning(f"[Preloader] Не вдалося декодувати звук {path}: {e}")
+
+    def add_gif(self, path, composite=False, size=None):
+        try:
+            self.gifs[(path, composite, size)] = decode_gif_frames(path, composite, size)
+        except Exception as e:
+            logger.warning(f"[Preloader] Не вдалося декодувати GIF {path}: {e}")
+
+    # --- Головний потік ---
+    def image(self, path):
+        """Декодоване зображення (без convert). Сцена сама робить convert/масштабування."""
+        image = self.images.get(path)
+        return image if image is not None else pygame.image.load(path)
+
+    def sound(self, path):
+        sound = self.sounds.get(path)
+        return sound if sound is not None else pygame.mixer.Sound(path)
+
+    def gif_frames(self, path, composite=False, size=None):
+        frames = self.gifs.get((path, composite, size))
+        return frames if frames is not None else decode_gif_frames(path, composite, size)
+
+    def clear(self):
+        """Звільняє все, що сцена так і не забрала."""
+        self.images.clear()
+        self.sounds.clear()
+        self.gifs.clear()
+
+
+class ScenePreloader:
+    """
+    Запускає функції передзавантаження сцен у пулі робочих потоків (JobSystem).
+    preloader(bundle, screen_size) наповнює AssetBundle важкими, але потокобезпечними операціями.
+    """
+    OWNER = "preload"
+
+    def __init__(self, job_system):
+        self.job_system = job_system
+        self.jobs = {}
+
+    def start(self, name, preloader, screen_size):
+        if name in self.jobs:
+            return
+        bundle = AssetBundle()
+        self.jobs[name] = self.job_system.submit(
+            self._run, name, preloader, bundle, screen_size, owner=self.OWNER
+        )
+
+    @staticmethod
+    def _run(name, preloader, bundle, screen_size):
+        preloader(bundle, screen_size)
+        logger.info(f"[Preloader] Сцену '{name}' передзавантажено")
+        return bundle
+
+    def take(self, name):
+        """Повертає набір ресурсів сцени (чекає завершення, якщо ще вантажиться) або порожній набір."""
+        job = self.jobs.pop(name, None)
+        if job is None:
+            return AssetBundle()
+        try:
+            return job.future.result()
+        except Exception as e:
+            logger.error(f"[Preloader] Помилка передзавантаження '{name}': {e}")
+            return AssetBundle()
+
+    def discard(self):
+        """Скасовує передзавантаження, які так ніхто й не забрав (гравець пішов в іншу сцену), і звільняє їхні набори."""
+        for name, job in self.jobs.items():
+            self.job_system.cancel_job(job)
+            if job.future.done() and not job.future.cancelled():
+                try:
+                    job.future.result().clear()
+                except Exception as e:
+                    pass
+        self.jobs.clear()
+
+    def shutdown(self):
+        self.job_system.cancel(self.OWNER)
+        self.jobs.clear()
@@ -0,0 +1,145 @@
+import csv
+import time
+import logging
+from collections import deque
+
+import pygame
+
+logger = logging.getLogger("Profiler")
+
+
+class _NullSection:
+    """Порожня секція: використовується, коли профайлер вимкнено (без накладних витрат)."""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class _Section:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, (time.perf_counter() - self.start) * 1000)
+        return False
+
+
+class FrameProfiler:
+    """
+    Профайлер кадру: збирає час окремих етапів (події, оновлення об'єктів, шари, flip),
+    малює оверлей з графіком часу кадрів і зберігає історію у CSV.
+    Збір даних відбувається лише тоді, коли профайлер увімкнено.
+    """
+    HISTORY_SIZE = 180      # Скільки останніх кадрів зберігати
+    AVERAGE_WINDOW = 60     # За скільки кадрів усереднювати таблицю етапів
+    FRAME_BUDGET_MS = 1000 / 30
+
+    def __init__(self):
+        self.enabled = False
+        self.history = deque(maxlen=self.HISTORY_SIZE)  # [(frame_ms, {етап: мс}), ...]
+        self.stage_order = []  # Порядок етапів, у якому вони вперше з'явились
+        self.captures = []  # Додаткові списки кадрів (бенчмарк) — history оверлея F3 від них не залежить
+        self.current = {}
+        self.frame_start = None
+        self.font = None
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        if not self.enabled:
+            self.current = {}
+            self.frame_start = None
+
+    def section(self, name):
+        """Контекстний менеджер, що додає час блоку до етапу name поточного кадру."""
+        if not self.enabled:
+            return _NULL_SECTION
+        return _Section(self, name)
+
+    def add(self, name, ms):
+        if name not in self.current and name not in self.stage_order:
+            self.stage_order.append(name)
+        self.current[name] = self.current.get(name, 0.0) + ms
+
+    def begin_frame(self):
+        if self.enabled:
+            self.current = {}
+            self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        if not self.enabled or self.frame_start is None:
+            return
+        frame_ms = (time.perf_counter() - self.frame_start) * 1000
+        self.history.append((frame_ms, self.current))
+        for capture in self.captures:
+            capture.append((frame_ms, self.current))
+        self.current = {}
+        self.frame_start = None
+
+    def stage_averages(self):
+        recent = list(self.history)[-self.AVERAGE_WINDOW:]
+        if not recent:
+            return []
+        return [
+            (name, sum(stages.get(name, 0.0) for _, stages in recent) / len(recent))
+            for name in self.stage_order
+        ]
+
+    def dump_csv(self, path):
+        """Зберігає історію кадрів у CSV: один рядок на кадр, одна колонка на етап."""
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", "frame_ms"] + self.stage_order)
+            for index, (frame_ms, stages) in enumerate(self.history):
+                writer.writerow(
+                    [index, f"{frame_ms:.3f}"] + [f"{stages.get(name, 0.0):.3f}" for name in self.stage_order]
+                )
+        logger.info(f"[Profiler] Збережено {len(self.history)} кадрів у {path}")
+
+    def draw(self, screen):
+        if not self.enabled:
+            return
+
+        if self.font is None:
+            self.font = pygame.font.Font(None, 20)
+
+        averages = self.stage_averages()
+        graph_w, graph_h = 360, 90
+        line_h = self.font.get_linesize()
+        panel_w = graph_w + 20
+        panel_h = graph_h + 30 + line_h * (len(averages) + 1)
+
+        panel = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+
+        # 📈 Графік часу кадрів; верх графіка — два бюджети кадру
+        scale = graph_h / (self.FRAME_BUDGET_MS * 2)
+        bar_w = graph_w / self.HISTORY_SIZE
+        for i, (frame_ms, _) in enumerate(self.history):
+            bar_h = min(graph_h, frame_ms * scale)
+            color = (90, 200, 90) if frame_ms <= self.FRAME_BUDGET_MS else (220, 80, 60)
+            pygame.draw.rect(panel, color, (10 + i * bar_w, 10 + graph_h - bar_h, max(1, int(bar_w)), bar_h))
+        budget_y = 10 + graph_h - self.FRAME_BUDGET_MS * scale
+        pygame.draw.line(panel, (230, 230, 230), (10, budget_y), (10 + graph_w, budget_y))
+
+        # 🧾 Середній час етапів
+        last_frame = self.history[-1][0] if self.history else 0.0
+        y = graph_h + 20
+        header = self.font.render(f"кадр: {last_frame:5.1f} мс   F4 — CSV", True, (255, 255, 255))
+        panel.blit(header, (10, y))
+        for name, avg in averages:
+            y += line_h
+            text = self.font.render(f"{name:<18} {avg:6.2f} мс", True, (210, 210, 210))
+            panel.blit(text, (10, y))
+
+        screen.blit(panel, (10, 10))
@@ -0,0 +1,203 @@
+import json
+import logging
+import random
+import time
+
+import pygame
+
+from core.input_source import KeyState
+from utils.resource_loader import load_hero_stats
+
+logger = logging.getLogger("Replay")
+
+REPLAY_VERSION = 2  # 2: генератор фіксується на першому тіку сцени, а не під час запуску
+
+# Клавіші, стан яких зберігається щотіку (все, що читає Player.handle_input)
+TRACKED_KEYS = (
+    pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN,
+    pygame.K_SPACE, pygame.K_f, pygame.K_k,
+)
+TRACKED_MODS = pygame.KMOD_SHIFT | pygame.KMOD_CTRL | pygame.KMOD_ALT
+
+# Події, які сцена отримує через handle_events
+TRACKED_EVENTS = (pygame.KEYDOWN, pygame.KEYUP)
+
+
+def new_seed():
+    return int(time.time() * 1000) & 0xFFFFFFFF
+
+
+class InputRecorder:
+    """
+    Записує сесію: seed генератора випадкових чисел, seed світу (генерація рівня), героя (HP, витривалість, спрайти),
+    знімок клавіш на кожному тіку симуляції та події клавіатури з номером тіку, перед яким їх отримала сцена.
+    Підставляється в SceneManager.input_source і віддає Player живе введення.
+    """
+    def __init__(self, source, scene_name, seed, world_seed=None, hero_data=None):
+        self.source = source
+        self.scene_name = scene_name
+        self.seed = seed
+        self.world_seed = world_seed
+        self.hero_data = hero_data
+        self.tick = 0
+        self.seeded = False
+        self.snapshot_tick = None
+        self.snapshot = ((), 0)
+        self.inputs = []   # [[тік, [клавіші], модифікатори], ...] — лише тіки, що змінили стан
+        self.events = []   # [[тік, тип, клавіша, модифікатори, unicode], ...]
+
+    def poll(self):
+        """Один знімок клавіш на тік (Player читає get_pressed і get_mods окремо)."""
+        if self.snapshot_tick != self.tick:
+            pressed = self.source.get_pressed()
+            keys = tuple(key for key in TRACKED_KEYS if pressed[key])
+            snapshot = (keys, self.source.get_mods() & TRACKED_MODS)
+            if snapshot != self.snapshot or not self.inputs:
+                self.inputs.append([self.tick, list(keys), snapshot[1]])
+            self.snapshot = snapshot
+            self.snapshot_tick = self.tick
+        return self.snapshot
+
+    def get_pressed(self):
+        keys, _ = self.poll()
+        return KeyState(keys)
+
+    def get_mods(self):
+        _, mods = self.poll()
+        return mods
+
+    def begin_tick(self):
+        begin_session(self)
+
+    def advance(self):
+        self.tick += 1
+        advance = getattr(self.source, "advance", None)
+        if advance:
+            advance()
+
+    def filter_events(self, events):
+        """Запам'ятовує події клавіатури, які отримає сцена, і передає їх далі без змін."""
+        for event in events:
+            if event.type in TRACKED_EVENTS:
+                self.events.append([
+                    self.tick, event.type, event.key, event.mod, getattr(event, "unicode", "")
+                ])
+        return events
+
+    def save(self, path, final_state=None):
+        screen = pygame.display.get_surface()
+        data = {
+            "version": REPLAY_VERSION,
+            "scene": self.scene_name,
+            "seed": self.seed,
+            "world_seed": self.world_seed,  # Рівень генерується з нього, а не з progress.json того, хто відтворює
+            # Так само і герой: його характеристики та спрайти впливають на симуляцію. Береться наприкінці сесії,
+            # тож це той герой, з яким грали, навіть якщо його створено під час запису (HeroCreator)
+            "hero": self.hero_data if self.hero_data is not None else load_hero_stats(),
+            "screen_size": list(screen.get_size()) if screen else None,  # Масштаб світу залежить від екрана
+            "ticks": self.tick,
+            "inputs": self.inputs,
+            "events": self.events,
+            "final_state": final_state,
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        logger.info(f"[Replay] Записано {self.tick} тіків у {path}")
+
+
+class ReplayInput:
+    """
+    Відтворення запису: ті самі seed, seed світу і герой, ті самі знімки клавіш на тих самих тіках
+    і ті самі події перед тими самими тіками. Живе введення ігнорується.
+    """
+    def __init__(self, data):
+        if data.get("version") != REPLAY_VERSION:
+            raise ValueError(f"Непідтримувана версія запису: {data.get('version')}")
+        self.scene_name = data["scene"]
+        self.seed = data["seed"]
+        self.world_seed = data.get("world_seed")  # Старі записи його не мають — береться з progress.json
+        self.hero_data = data.get("hero")  # Так само і герой
+        self.ticks = data["ticks"]
+        self.screen_size = tuple(data["screen_size"]) if data.get("screen_size") else None
+        self.final_state = data.get("final_state")
+        self.inputs = [(tick, tuple(keys), mods) for tick, keys, mods in data["inputs"]]
+        self.events = {}
+        for tick, event_type, key, mod, unicode in data["events"]:
+            self.events.setdefault(tick, []).append(
+                pygame.event.Event(event_type, key=key, mod=mod, unicode=unicode)
+            )
+        self.tick = 0
+        self.seeded = False
+        self.input_index = 0
+        self.snapshot = ((), 0)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    @property
+    def finished(self):
+        return self.tick >= self.ticks
+
+    def current(self):
+        while self.input_index < len(self.inputs) and self.inputs[self.input_index][0] <= self.tick:
+            _, keys, mods = self.inputs[self.input_index]
+            self.snapshot = (keys, mods)
+            self.input_index += 1
+        return self.snapshot
+
+    def get_pressed(self):
+        keys, _ = self.current()
+        return KeyState(keys)
+
+    def get_mods(self):
+        _, mods = self.current()
+        return mods
+
+    def begin_tick(self):
+        begin_session(self)
+
+    def advance(self):
+        self.tick += 1
+
+    def filter_events(self, events):
+        """Живі події клавіатури відкидаються — сцена отримує записані через tick_events()."""
+        return [event for event in events if event.type not in TRACKED_EVENTS]
+
+    def tick_events(self):
+        """Події, які в записі сцена отримала перед поточним тіком."""
+        return self.events.pop(self.tick, [])
+
+
+def seed_session(seed):
+    """Фіксує глобальний генератор випадкових чисел, з якого беруть значення всі об'єкти гри."""
+    random.seed(seed)
+
+
+def begin_session(source):
+    """
+    Перший тік сцени: генератор фіксується ще раз. Скільки випадкових чисел з'їло завантаження,
+    залежить від того, що вже є в кеші (шари, спрайти), тож симуляція починається з того самого стану
+    незалежно від першого чи повторного запуску.
+    """
+    if not source.seeded:
+        seed_session(source.seed)
+        source.seeded = True
+
+
+def state_digest(scene):
+    return scene.state_digest() if scene is not None and hasattr(scene, "state_digest") else None
+
+
+def verify_replay(replay, scene):
+    """Порівнює стан сцени після відтворення зі станом, збереженим під час запису."""
+    digest = state_digest(scene)
+    if replay.final_state is None or digest is None:
+        print("🎥 Відтворено запис (немає відбитку стану для перевірки)")
+        return None
+    if digest == replay.final_state:
+        print(f"🎥 Відтворення збіглося із записом ({replay.ticks} тіків)")
+        return True
+    logger.warning(f"[Replay] Стан розійшовся із записом: {digest} != {replay.final_state}")
+    return False
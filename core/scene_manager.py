@@ -1,17 +1,105 @@
+import time
+import logging
+from collections import OrderedDict
+
+import pygame
+
+from core.input_source import KeyboardInput
+from core.profiler import FrameProfiler
+from core.memory_overlay import MemoryOverlay
+from core.preloader import ScenePreloader
+from core.jobs import JobSystem
+from utils.memory import estimate_bytes
+from utils.asset_manager import asset_manager
+
+logger = logging.getLogger("SceneManager")
+
+
 class SceneManager:
     """
     Керує сценами гри: дозволяє перемикатися між ними, повертатися назад, знищувати старі сцени та зберігати стан.
     """
+    TICK_RATE = 30  # Частота симуляції (тіків на секунду), на неї розраховані покадрові константи об'єктів
+    MAX_FRAME_MS = 250  # Обмеження, щоб після довгого завантаження не наздоганяти сотні тіків
+    SCENE_CACHE_BUDGET = 128 * 1024 * 1024  # Скільки байтів Surface можуть займати збережені сцени
+
     def __init__(self, audio_manager):
         self.scenes = {}              # {"menu": lambda: MainMenu(...)}
         self.current_scene = None
         self.previous_scene = None    # Зберігає попередню сцену для "повернення"
         self.audio_manager = audio_manager
+        self.input_source = KeyboardInput()  # Джерело стану клавіш (можна підмінити сценарієм)
+        self.tick_ms = 1000 / self.TICK_RATE  # Тривалість одного тіку симуляції (мс)
+        self.render_alpha = 1.0       # Частка тіку між попереднім і поточним станом для інтерполяції
+        self.profiler = FrameProfiler()  # Оверлей з часом етапів кадру (F3)
+        self.memory_overlay = MemoryOverlay(self)  # Оверлей пам'яті сцен і кешів (F5, F6 — звіт у консоль)
+        self.preloaders = {}          # {"level_1": Level1.preload_assets}
+        self.jobs = JobSystem()       # Фонові завдання сцен; завершення виконуються в advance_loading()
+        self.preloader = ScenePreloader(self.jobs)
+        self.cacheable = set()        # Сцени, які після виходу зберігаються, а не знищуються
+        self.scene_cache = OrderedDict()  # {"settings": (сцена, байти)} — від найдавнішої до останньої
+        self.scene_cache_budget = self.SCENE_CACHE_BUDGET
         self.running = True
 
-    def add_scene(self, name, scene_factory):
-        """Додає сцену (як функцію створення) до менеджера."""
+    def add_scene(self, name, scene_factory, preloader=None, cacheable=False):
+        """
+        Додає сцену (як функцію створення) до менеджера.
+        preloader(bundle, screen_size) — необов'язкова функція фонового передзавантаження ресурсів сцени.
+        cacheable=True — після виходу екземпляр сцени зберігається (LRU у межах scene_cache_budget)
+        і використовується повторно замість створення нового.
+        """
         self.scenes[name] = scene_factory
+        if preloader:
+            self.preloaders[name] = preloader
+        if cacheable:
+            self.cacheable.add(name)
+
+    def release_scene(self, scene):
+        """Звільняє сцену, з якої виходимо: кешовану зберігає, решту знищує."""
+        name = getattr(scene, "name", None)
+        if name in self.cacheable:
+            self.scene_cache.pop(name, None)
+            self.scene_cache[name] = (scene, estimate_bytes(scene))
+            self.evict_scenes()
+        else:
+            self.destroy_scene(scene)
+
+    def destroy_scene(self, scene):
+        """
+        Знищує сцену: скасовує її фонові завдання і знімає її посилання на спільні ресурси asset_manager
+        (далі їх витісняє LRU).
+        """
+        name = getattr(scene, "name", None)
+        self.jobs.cancel(name)
+        if hasattr(scene, "destroy"):
+            scene.destroy()
+        asset_manager.release(name)
+
+    def evict_scenes(self):
+        """Знищує найдавніше використані сцени, доки кеш не вкладеться в бюджет."""
+        while self.scene_cache and self.scene_cache_bytes() > self.scene_cache_budget:
+            name, (scene, size) = self.scene_cache.popitem(last=False)
+            logger.info(f"[SceneManager] Сцену '{name}' витіснено з кешу ({size / 1024 / 1024:.1f} МБ)")
+            self.destroy_scene(scene)
+
+    def scene_cache_bytes(self):
+        return sum(size for _, size in self.scene_cache.values())
+
+    def clear_scene_cache(self):
+        for scene, _ in self.scene_cache.values():
+            self.destroy_scene(scene)
+        self.scene_cache.clear()
+
+    def preload(self, name):
+        """Починає у фоновому потоці декодувати ресурси сцени, поки поточна сцена продовжує працювати."""
+        preloader = self.preloaders.get(name)
+        screen = pygame.display.get_surface()
+        if preloader and screen:
+            self.preloader.start(name, preloader, screen.get_size())
+
+    def take_preloaded(self, name):
+        """Віддає сцені передзавантажені ресурси (AssetBundle). Викликається з конструктора сцени."""
+        return self.preloader.take(name)
 
     def change_scene(self, name):
         """Перемикається на нову сцену, створюючи її динамічно."""
@@ -23,41 +111,54 @@ class SceneManager:
                 if self.previous_scene is None:
                     self.previous_scene = self.current_scene
             else:
-                # Знищуємо стару сцену (повне очищення ресурсів)
-                if hasattr(self.current_scene, "destroy"):
-                    self.current_scene.destroy()
+                # Знищуємо стару сцену (повне очищення ресурсів) або залишаємо її в кеші
+                self.release_scene(self.current_scene)
                 self.current_scene = None
 
                 # Якщо починається нова гра — обнуляємо попередню сцену
                 if name == "scene_1":
                     self.previous_scene = None
 
-        # Створюємо нову сцену через фабрику
-        factory = self.scenes.get(name)
-        self.current_scene = factory() if callable(factory) else factory
+        # Ресурси, які сцена бере з asset_manager під час створення і завантаження, належать їй
+        asset_manager.owner = name
+
+        # Беремо сцену з кешу або створюємо нову через фабрику
+        cached = self.scene_cache.pop(name, None)
+        if cached is not None:
+            self.current_scene = cached[0]
+        else:
+            factory = self.scenes.get(name)
+            self.current_scene = factory() if callable(factory) else factory
 
         if self.previous_scene and name == self.previous_scene.name:
             self.current_scene.resume()
             self.previous_scene = None
         else:
+            if name != "pause":
+                # Нова сцена вже забрала свій набір; решта передзавантажень належала сценам, куди гравець не пішов
+                self.preloader.discard()
             self.current_scene.start()
 
     def return_to_previous_scene(self):
         if self.previous_scene:
-            if hasattr(self.current_scene, "destroy"):
-                self.current_scene.destroy()
+            self.release_scene(self.current_scene)
             self.current_scene = self.previous_scene
             self.previous_scene = None  # ← ЦЕ ВАЖЛИВО
+            asset_manager.owner = self.current_scene.name
             self.current_scene.resume()
 
     def reset(self):
         """
         Закриває всі сцени, очищає попередню та поточну.
+        Призупинена під паузою сцена теж звільняється (знищується або йде в кеш), а не просто відкидається.
         """
-        if self.current_scene:
-            self.current_scene.stop()
+        for scene in (self.current_scene, self.previous_scene):
+            if scene:
+                scene.stop()
+                self.release_scene(scene)
         self.previous_scene = None
         self.current_scene = None
+        asset_manager.owner = None
 
     def get_current_scene_name(self):
         """Повертає ім’я поточної сцени."""
@@ -66,21 +167,81 @@ class SceneManager:
                 return name
         return None
 
+    def find_scene(self, name):
+        """Поточна або призупинена (під паузою) сцена з таким ім'ям."""
+        for scene in (self.current_scene, self.previous_scene):
+            if scene is not None and getattr(scene, "name", None) == name:
+                return scene
+        return None
+
+    def input_active(self):
+        """
+        Чи читає поточна сцена введення з input_source: сцена запущена (завантаження завершено)
+        і саме її записуємо/відтворюємо. Лише тоді рахуються тіки введення.
+        """
+        scene = self.current_scene
+        if scene is None or not getattr(scene, "started", True):
+            return False
+        target = getattr(self.input_source, "scene_name", None)
+        return target is None or scene.name == target
+
     def handle_events(self, events):
         """Передає обробку подій поточній сцені."""
         if self.current_scene:
+            filter_events = getattr(self.input_source, "filter_events", None)
+            if filter_events and self.input_active():
+                events = filter_events(events)
             self.current_scene.handle_events(events)
 
+    def advance_loading(self, budget_ms):
+        """
+        Виконує завершення фонових завдань і просуває покрокове завантаження поточної сцени,
+        разом не довше budget_ms. Повертає True, поки сцена ще вантажиться.
+        """
+        start = time.perf_counter()
+        self.jobs.pump(budget_ms)
+
+        scene = self.current_scene
+        if scene and hasattr(scene, "advance_loading"):
+            remaining = budget_ms - (time.perf_counter() - start) * 1000
+            return scene.advance_loading(max(remaining, 0))
+        return False
+
     def update(self):
-        """Оновлює логіку поточної сцени."""
-        if self.current_scene:
+        """Оновлює логіку поточної сцени (один тік симуляції)."""
+        if not self.current_scene:
+            return
+
+        if not self.input_active():
+            self.current_scene.update()
+            return
+
+        begin_tick = getattr(self.input_source, "begin_tick", None)
+        if begin_tick:
+            begin_tick()
+
+        # Під час відтворення запису події клавіатури подаються точно перед тим тіком, що й у записі
+        tick_events = getattr(self.input_source, "tick_events", None)
+        if tick_events:
+            events = tick_events()
+            if events:
+                self.current_scene.handle_events(events)
+
+        if self.current_scene and self.input_active():
             self.current_scene.update()
+            advance = getattr(self.input_source, "advance", None)
+            if advance:
+                advance()
 
-    def render(self, screen):
-        """Відмальовує поточну сцену."""
+    def render(self, screen, alpha=1.0):
+        """Відмальовує поточну сцену. alpha — частка тіку для інтерполяції (0..1)."""
+        self.render_alpha = alpha
         if self.current_scene:
             self.current_scene.render(screen)
 
     def quit_game(self):
         """Завершує гру."""
-        self.running = False
\ No newline at end of file
+        self.running = False
+        self.preloader.shutdown()
+        self.jobs.shutdown()
+        self.clear_scene_cache()
\ No newline at end of file
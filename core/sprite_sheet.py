@@ -0,0 +1,82 @@
+import pygame
+
+ATLAS_MAX_WIDTH = 2048
+ATLAS_PADDING = 1  # Прозорий проміжок, щоб сусідні кадри не «протікали» при масштабуванні
+
+
+def pack_atlas(frames, max_width=ATLAS_MAX_WIDTH, padding=ATLAS_PADDING):
+    """
+    Пакує кадри в один атлас полицями (рядками): кадри сортуються за висотою
+    і ставляться зліва направо, поки рядок не перевищить max_width.
+    Повертає (атлас, [Rect кадру, ...] у початковому порядку кадрів).
+    """
+    if not frames:
+        return None, []
+
+    order = sorted(range(len(frames)), key=lambda i: frames[i].get_height(), reverse=True)
+    rects = [None] * len(frames)
+    x = y = shelf_height = width = 0
+    for i in order:
+        w, h = frames[i].get_size()
+        if x and x + w > max_width:
+            y += shelf_height + padding
+            x = shelf_height = 0
+        rects[i] = pygame.Rect(x, y, w, h)
+        x += w + padding
+        shelf_height = max(shelf_height, h)
+        width = max(width, x - padding)
+
+    atlas = pygame.Surface((max(width, 1), max(y + shelf_height, 1)), pygame.SRCALPHA).convert_alpha()
+    for frame, rect in zip(frames, rects):
+        atlas.blit(frame, rect)  # На повністю прозорий атлас пікселі копіюються без змішування
+    return atlas, rects
+
+
+class FrameStrip(list):
+    """Список кадрів-субповерхонь атласу; flipped() — ті самі кадри, віддзеркалені (один спільний варіант)."""
+    def __init__(self, frames, sheet, mirrored):
+        super().__init__(frames)
+        self.sheet = sheet
+        self.mirrored = mirrored
+
+    def flipped(self):
+        return self.sheet.strip(not self.mirrored)
+
+
+class SpriteSheet:
+    """
+    Анімація як один атлас: кадри — subsurface атласу (без окремого буфера пікселів на кадр).
+    Віддзеркалений варіант будується один раз (flip усього атласу) і спільний для всіх екземплярів,
+    тож об'єктам не потрібно копіювати та фліпати кадри самостійно.
+    """
+    def __init__(self, frames, max_width=ATLAS_MAX_WIDTH):
+        self.atlas, self.rects = pack_atlas(frames, max_width)
+        self.frames = FrameStrip([self.atlas.subsurface(rect) for rect in self.rects], self, False)
+        self.mirrored_atlas = None
+        self.mirrored_frames = None
+
+    def strip(self, mirrored=False):
+        if not mirrored:
+            return self.frames
+        if self.mirrored_frames is None:
+            frames = []
+            if self.atlas is not None:
+                self.mirrored_atlas = pygame.transform.flip(self.atlas, True, False)
+                width = self.atlas.get_width()
+                frames = [
+                    self.mirrored_atlas.subsurface((width - rect.right, rect.y, rect.width, rect.height))
+                    for rect in self.rects
+                ]
+            self.mirrored_frames = FrameStrip(frames, self, True)
+        return self.mirrored_frames
+
+    def __len__(self):
+        return len(self.rects)
+
+
+def flip_frames(frames):
+    """Віддзеркалені кадри: для кадрів атласу — готовий спільний варіант, для звичайного списку — flip кожного."""
+    flipped = getattr(frames, "flipped", None)
+    if flipped is not None:
+        return flipped()
+    return [pygame.transform.flip(frame, True, False) for frame in frames]
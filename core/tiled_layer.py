@@ -0,0 +1,236 @@
+import os
+import json
+import zlib
+import math
+import bisect
+import logging
+from collections import OrderedDict
+
+import pygame
+
+logger = logging.getLogger("TiledLayer")
+
+TILES_VERSION = 2
+TILE_WIDTH = 512       # Ширина плитки у пікселях вихідного шару
+COMPRESS_LEVEL = 1     # Плитка розпаковується під час гри — швидкість важливіша за розмір
+HEADER_NAME = "layer.json"
+
+
+def tile_path(path, index):
+    return os.path.join(path, f"{index}.tile")
+
+
+def create_layer(path, size, params=None):
+    """
+    Папка шару: заголовок (розмір, ширина плитки, параметри генерації) і плитки {індекс}.tile —
+    смуги по TILE_WIDTH пікселів, стиснені zlib. Плитки дописуються по одній, коли їх згенеровано,
+    тож шар можна читати, поки решта ще не існує.
+    """
+    os.makedirs(path, exist_ok=True)
+    header = {"version": TILES_VERSION, "size": list(size), "tile": TILE_WIDTH, "params": params or {}}
+    header_path = os.path.join(path, HEADER_NAME)
+    with open(header_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(header, f)
+    os.replace(header_path + ".tmp", header_path)
+
+
+def read_header(path):
+    with open(os.path.join(path, HEADER_NAME), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_tile(path, index, image):
+    """Записує плитку (RGBA-зображення PIL) через .tmp, щоб перерваний запис не лишив биту плитку."""
+    data = zlib.compress(image.tobytes("raw", "RGBA"), COMPRESS_LEVEL)
+    temporary = f"{tile_path(path, index)}.{os.getpid()}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(data)
+    os.replace(temporary, tile_path(path, index))
+
+
+class TiledLayer:
+    """
+    Паралакс-шар рівня, розбитий на вертикальні плитки.
+    Плитка читається з диска, розпаковується і масштабується (у фоновому завданні JobSystem), лише коли
+    потрапляє в межі екрана плюс lookahead попереду; convert_alpha — у завершенні на головному потоці.
+    Плитки, що лишились позаду, витісняються (LRU), тож у пам'яті тримається стільки плиток,
+    скільки вміщує ширина екрана з запасом, а не весь шар довжиною в рівень.
+
+    Плитки, яких ще немає на диску, будує recipe (core.layer_generation) у пулі процесів:
+    generate_ahead замовляє їх заздалегідь, а поки плитка не готова, на її місці нічого не малюється.
+    """
+    MAX_ATTEMPTS = 3  # Скільки разів генерувати плитку, що падає з помилкою, перш ніж здатися
+
+    def __init__(self, path, scale, jobs=None, owner=None, lookahead=0, recipe=None):
+        header = read_header(path)
+        self.path = path
+        self.source_size = tuple(header["size"])
+        self.tile_width = header["tile"]
+
+        scale_x, scale_y = scale
+        count = -(-self.source_size[0] // self.tile_width)
+        self.width = int(self.source_size[0] * scale_x)
+        self.height = int(self.source_size[1] * scale_y)
+        # Межі плиток у масштабованому шарі: плитка i займає [edges[i], edges[i + 1])
+        self.edges = [int(i * self.tile_width * scale_x) for i in range(count)] + [self.width]
+
+        self.jobs = jobs
+        self.owner = owner
+        self.lookahead = lookahead
+        self.capacity = count
+        self.tiles = OrderedDict()  # {індекс: Surface} — від найдавніше використаної
+        self.pending = {}           # {індекс: Job} — декодування
+        self.window = []            # Плитки, замовлені останнім prefetch
+
+        self.recipe = recipe
+        self.generated = {index for index in range(count) if os.path.exists(tile_path(path, index))}
+        self.generating = {}        # {індекс: Job} — генерація в пулі процесів
+        self.failures = {}          # {індекс: скільки генерацій плитки впало з помилкою}
+
+    def __len__(self):
+        return len(self.edges) - 1
+
+    @property
+    def complete(self):
+        return len(self.generated) == len(self)
+
+    def decode(self, index):
+        """Фонова частина: читання, розпаковка і масштабування плитки (без дисплея)."""
+        with open(tile_path(self.path, index), "rb") as f:
+            data = zlib.decompress(f.read())
+        source_width = min(self.tile_width, self.source_size[0] - index * self.tile_width)
+        tile = pygame.image.frombuffer(data, (source_width, self.source_size[1]), "RGBA")
+        return pygame.transform.scale(tile, (self.edges[index + 1] - self.edges[index], self.height))
+
+    def attach(self, index, surface):
+        """Завершення на головному потоці: convert_alpha і додавання плитки в LRU."""
+        self.pending.pop(index, None)
+        self.tiles[index] = surface.convert_alpha()
+        self.evict()
+
+    def tile(self, index):
+        """
+        Плитка для відмальовки; якщо фонове завдання не встигло — декодується одразу.
+        None — плитку ще генерують (камера обігнала генерацію).
+        """
+        if index not in self.generated:
+            self.generate(index)
+            return None
+        surface = self.tiles.get(index)
+        if surface is None:
+            job = self.pending.pop(index, None)
+            if job is not None:
+                self.jobs.cancel_job(job)
+            self.attach(index, self.decode(index))
+            surface = self.tiles[index]
+        self.tiles.move_to_end(index)
+        return surface
+
+    def tile_range(self, left, right):
+        """Індекси плиток, що перетинають [left, right) у координатах шару."""
+        left, right = max(left, 0), min(right, self.width)
+        if left >= right:
+            return range(0)
+        return range(bisect.bisect_right(self.edges, left) - 1, bisect.bisect_left(self.edges, right))
+
+    def request(self, index):
+        if index in self.tiles or index in self.pending or self.jobs is None:
+            return
+        if index not in self.generated:
+            self.generate(index)
+            return
+        self.pending[index] = self.jobs.submit(
+            self.decode, index, owner=self.owner,
+            on_done=lambda surface, index=index: self.attach(index, surface),
+            on_error=lambda e, index=index: self.pending.pop(index, None)  # tile() декодує плитку сам
+        )
+
+    def generate(self, index):
+        """Замовляє генерацію плитки в пулі процесів (не більше завдань, ніж процесів, — ближчі йдуть першими)."""
+        if self.recipe is None or self.jobs is None or index in self.generating:
+            return
+        if self.failures.get(index, 0) >= self.MAX_ATTEMPTS or len(self.generating) >= self.jobs.PROCESS_WORKERS:
+            return
+        self.generating[index] = self.jobs.submit_process(
+            self.recipe.write_tile, self.path, index, owner=self.owner,
+            on_done=lambda _, index=index: self.generated_tile(index),
+            on_error=lambda e, index=index: self.failed_tile(index)
+        )
+
+    def generated_tile(self, index):
+        self.generating.pop(index, None)
+        self.generated.add(index)
+        for index in self.window:  # Декодування готової плитки і генерація тих, що чекали на вільний процес
+            self.request(index)
+
+    def failed_tile(self, index):
+        """
+        Генерація плитки впала з помилкою. Її можна замовити знову, але не більше MAX_ATTEMPTS разів:
+        інакше tile() щокадру засипав би пул процесів тим самим завданням.
+        """
+        self.generating.pop(index, None)
+        self.failures[index] = self.failures.get(index, 0) + 1
+        if self.failures[index] >= self.MAX_ATTEMPTS:
+            logger.error(f"[TiledLayer] Плитку {index} шару {self.path} не вдалося згенерувати")
+
+    def generate_ahead(self, x, screen_width, distance):
+        """Замовляє генерацію відсутніх плиток від позиції x на екран і distance пікселів попереду."""
+        if self.complete:
+            return
+        for index in self.tile_range(-x, -x + screen_width + distance):
+            if index not in self.generated:
+                self.generate(index)
+
+    def visible(self, positions, screen_width, lookahead):
+        """Індекси плиток, видимих хоча б з однієї позиції (копії шару) і в межах lookahead попереду, — без повторів."""
+        return sorted({index for x in positions for index in self.tile_range(-x, -x + screen_width + lookahead)})
+
+    def prefetch(self, positions, screen_width, lookahead=None):
+        """
+        Запускає декодування плиток, видимих з позицій positions (копії шару для паралаксу), і тих,
+        що в межах lookahead попереду. Вікно — одне на всі копії, тож плитки однієї копії не витісняють іншу.
+        """
+        window = self.visible(positions, screen_width, self.lookahead)
+        self.capacity = len(window) + 2
+        if lookahead is not None and lookahead != self.lookahead:
+            window = self.visible(positions, screen_width, lookahead)
+        self.window = window
+        for index in self.window:
+            self.request(index)
+
+    def ready(self):
+        """
+        Чи всі плитки, замовлені останнім prefetch, згенеровано, а запущені декодування приєднано.
+        Плитку, генерація якої впала, замовляє знову; не чекає лише на ті, що впали MAX_ATTEMPTS разів.
+        """
+        missing = [index for index in self.window if index not in self.generated]
+        for index in missing:
+            self.generate(index)
+        return not self.pending and not self.generating and all(
+            self.failures.get(index, 0) >= self.MAX_ATTEMPTS for index in missing
+        )
+
+    def draw(self, screen, positions, y):
+        """Малює видимі плитки копій шару, чиї ліві краї в positions, і замовляє наступні — один prefetch на кадр."""
+        screen_width = screen.get_width()
+        # Цілі позиції: інакше сусідні плитки округлюються по-різному і між ними з'являється шов
+        positions = [math.floor(x) for x in positions]
+        for x in positions:
+            for index in self.tile_range(-x, -x + screen_width):
+                surface = self.tile(index)
+                if surface is not None:
+                    screen.blit(surface, (x + self.edges[index], y))
+        self.prefetch(positions, screen_width)
+
+    def evict(self):
+        """LRU: плитки, що найдовше не малювались (лишились позаду), звільняються понад capacity."""
+        while len(self.tiles) > self.capacity:
+            self.tiles.popitem(last=False)
+
+    def clear(self):
+        if self.jobs is not None:
+            for job in list(self.pending.values()) + list(self.generating.values()):
+                self.jobs.cancel_job(job)
+        self.pending.clear()
+        self.generating.clear()
+        self.tiles.clear()
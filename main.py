@@ -1,21 +1,25 @@
+import sys
+
+# 📦 --import-times: таймер імпортів вмикається до імпорту pygame та решти модулів
+from core.import_timer import ImportTimer
+import_timer = ImportTimer.from_argv(sys.argv)
+
 import pygame
+import argparse
 import logging
+import multiprocessing
 import time
 import traceback
-import sys
 import os
 
 from core.scene_manager import SceneManager
+from core.lazy_scene import LazyScene
 from core.audio_manager import AudioManager
-from utils.resource_loader import load_settings, load_progress
-from scenes.menu import MainMenu
-from scenes.pause import PauseMenu
-from scenes.settings import SettingsMenu
-from scenes.confirm_new_game import ConfirmNewGame
-from scenes.confirm_out import ConfirmOut
-from scenes.scene_1 import Scene1
-from scenes.hero_creator import HeroCreator
-from scenes.level_1 import Level1
+from core.input_source import KeyboardInput
+from core.baked import baked
+from utils.asset_manager import asset_manager
+from core.replay import InputRecorder, ReplayInput, new_seed, seed_session, state_digest, verify_replay
+from utils.resource_loader import load_settings, load_progress, load_world_seed
 
 
 def get_save_path(filename):
@@ -35,78 +39,247 @@ def log_uncaught_exceptions(ex_cls, ex, tb):
 sys.excepthook = log_uncaught_exceptions
 
 
-# ⏯️ Завантаження налаштувань
-settings = load_settings()
-
-# 🔊 Ініціалізація Pygame
-pygame.init()
-pygame.mixer.init()
-
-# 🖱️ Приховати курсор
-last_mouse_move_time = time.time()
-mouse_visible = True
-HIDE_DELAY = 3  # секунд
-
-# 📺 Створення екрану
-if settings["fullscreen"]:
-    screen = pygame.display.set_mode((settings["screen_width"], settings["screen_height"]), pygame.FULLSCREEN)
-else:
-    screen = pygame.display.set_mode((settings["screen_width"], settings["screen_height"]))
-pygame.display.set_caption("White Castle")
-
-# 🎧 Менеджер звуку
-audio_manager = AudioManager(
-    music_volume=settings["music_volume"] / 10,
-    sound_volume=settings["sound_volume"] / 10
-)
-
-# 🎮 Менеджер сцен
-scene_manager = SceneManager(audio_manager)
-
-# 🔗 Додавання сцен як функцій-фабрик
-scene_manager.add_scene("menu", lambda: MainMenu(scene_manager, audio_manager, load_progress()))
-scene_manager.add_scene("settings", lambda: SettingsMenu(scene_manager, audio_manager, settings))
-scene_manager.add_scene("ConfirmNewGame", lambda: ConfirmNewGame(scene_manager, audio_manager))
-scene_manager.add_scene("ConfirmOut", lambda: ConfirmOut(scene_manager, audio_manager))
-scene_manager.add_scene("pause", lambda: PauseMenu(scene_manager, audio_manager))
-scene_manager.add_scene("scene_1", lambda: Scene1(scene_manager, audio_manager))
-scene_manager.add_scene("HeroCreator", lambda: HeroCreator(scene_manager, audio_manager))
-scene_manager.add_scene("level_1", lambda: Level1(scene_manager, audio_manager))
-
-# ▶️ Стартова сцена
-scene_manager.change_scene("menu")
-
-# 🔁 Головний цикл гри
-clock = pygame.time.Clock()
-while scene_manager.running:
-    events = pygame.event.get()
-    for event in events:
-        if event.type == pygame.QUIT:
-            scene_manager.quit_game()
+def parse_args():
+    parser = argparse.ArgumentParser(description="White Castle")
+    parser.add_argument("--bench", metavar="SCENE",
+                        help="запустити сцену без вікна зі сценарним введенням і вивести час кадрів")
+    parser.add_argument("--frames", type=int, default=600, help="кількість тіків симуляції бенчмарку")
+    parser.add_argument("--fps", type=int,
+                        help="обмеження FPS бенчмарку (0 — без обмеження; за замовчуванням — як у налаштуваннях)")
+    parser.add_argument("--record", metavar="FILE",
+                        help="записати сесію рівня (seed, введення щотіку) у файл")
+    parser.add_argument("--replay", metavar="FILE",
+                        help="відтворити запис; разом з --bench вимірює час кадрів на записаній сесії")
+    parser.add_argument("--seed", type=int, help="seed для --record (за замовчуванням — випадковий)")
+    parser.add_argument("--scene", default="level_1", help="сцена для --record")
+    parser.add_argument("--churn", type=int, metavar="CYCLES",
+                        help="без вікна прогнати сцени по колу задану кількість разів і перевірити, чи не росте пам'ять")
+    parser.add_argument("--bake", nargs="*", metavar="WxH",
+                        help="запекти масштабовані кадри для роздільностей (за замовчуванням — усі з налаштувань)")
+    parser.add_argument("--manifest", action="store_true",
+                        help="згенерувати assets/manifest.json (списки файлів у папках ресурсів і розміри зображень)")
+    parser.add_argument(ImportTimer.FLAG, action="store_true",
+                        help="вивести час імпорту модулів і час до першого кадру")
+    args, _ = parser.parse_known_args()
+    return args
+
+
+def main():
+    global import_timer
+    args = parse_args()
+
+    # 🧪 Бенчмарк і перевірка витоків працюють без вікна і звуку (SDL dummy-драйвери)
+    if args.bench or args.churn or args.bake is not None:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    # 📒 Маніфест ресурсів генерується під час збирання; у грі списки файлів беруться з нього, а не з диска
+    if args.manifest:
+        from core.manifest import write_manifest, MANIFEST_PATH
+        print(f"📒 {MANIFEST_PATH}: {write_manifest()} папок")
+        sys.exit(0)
+
+    # ⏯️ Завантаження налаштувань
+    settings = load_settings()
+
+    # 🔊 Ініціалізація Pygame
+    pygame.init()
+    pygame.mixer.init()
+
+    # 🖱️ Приховати курсор
+    last_mouse_move_time = time.time()
+    mouse_visible = True
+    HIDE_DELAY = 3  # секунд
+
+    # ⏱️ Частота відмальовки (симуляція завжди йде фіксованим кроком SceneManager.tick_ms)
+    DISPLAY_FPS = settings.get("fps", 60)
+    LOADING_BUDGET_MS = 12  # Скільки часу кадру можна віддати завершенням фонових завдань і завантаженню сцени
+
+    # 🎥 Запис відтворюється з тим самим розміром екрана, з яким його зроблено
+    replay = ReplayInput.load(args.replay) if args.replay else None
+    screen_size = (settings["screen_width"], settings["screen_height"])
+    if replay and replay.screen_size:
+        screen_size = replay.screen_size
+
+    # 📺 Створення екрану
+    if settings["fullscreen"] and not (args.bench or args.churn or args.bake is not None):
+        screen = pygame.display.set_mode(screen_size, pygame.FULLSCREEN)
+    else:
+        screen = pygame.display.set_mode(screen_size)
+    pygame.display.set_caption("White Castle")
+
+    # 🍞 Запечені під цю роздільність кадри (main.py --bake), якщо вони є
+    baked.open(screen.get_size())
+
+    # 🎧 Менеджер звуку
+    audio_manager = AudioManager(
+        music_volume=settings["music_volume"] / 10,
+        sound_volume=settings["sound_volume"] / 10
+    )
+
+    # 🎮 Менеджер сцен
+    scene_manager = SceneManager(audio_manager)
+    scene_manager.scene_cache_budget = settings.get("scene_cache_mb", 128) * 1024 * 1024
+    asset_manager.budget = settings.get("asset_cache_mb", 128) * 1024 * 1024
+
+    # 🔗 Додавання сцен як фабрик. Модуль сцени імпортується під час першого change_scene
+    # (нові модулі сцен треба також додати в --hidden-import у publisher/build_app.sh).
+    # Меню кешуються, щоб не декодувати GIF-фони щоразу.
+    menu = LazyScene("scenes.menu", "MainMenu", lambda cls: cls(scene_manager, audio_manager, load_progress()))
+    settings_menu = LazyScene("scenes.settings", "SettingsMenu", lambda cls: cls(scene_manager, audio_manager, settings))
+    confirm_new_game = LazyScene("scenes.confirm_new_game", "ConfirmNewGame", lambda cls: cls(scene_manager, audio_manager))
+    confirm_out = LazyScene("scenes.confirm_out", "ConfirmOut", lambda cls: cls(scene_manager, audio_manager))
+    pause_menu = LazyScene("scenes.pause", "PauseMenu", lambda cls: cls(scene_manager, audio_manager))
+    scene_1 = LazyScene("scenes.scene_1", "Scene1", lambda cls: cls(scene_manager, audio_manager))
+    hero_creator = LazyScene("scenes.hero_creator", "HeroCreator", lambda cls: cls(scene_manager, audio_manager))
+    level_1 = LazyScene("scenes.level_1", "Level1", lambda cls: cls(scene_manager, audio_manager))
 
-        # 📎 Сполучення клавіш: Command + Esc
-        if event.type == pygame.KEYDOWN:
-            keys = pygame.key.get_pressed()
-            if (keys[pygame.K_LMETA] or keys[pygame.K_RMETA]) and keys[pygame.K_ESCAPE]:
+    scene_manager.add_scene("menu", menu, cacheable=True)
+    scene_manager.add_scene("settings", settings_menu, cacheable=True)
+    scene_manager.add_scene("ConfirmNewGame", confirm_new_game, cacheable=True)
+    scene_manager.add_scene("ConfirmOut", confirm_out, cacheable=True)
+    scene_manager.add_scene("pause", pause_menu, cacheable=True)
+    scene_manager.add_scene("scene_1", scene_1, scene_1.method("preload_assets"))
+    scene_manager.add_scene("HeroCreator", hero_creator, hero_creator.method("preload_assets"))
+    scene_manager.add_scene("level_1", level_1, level_1.method("preload_assets"))
+
+    # 🧪 Режим бенчмарку: проганяємо сцену і виходимо
+    if args.bench:
+        from core.benchmark import run_benchmark
+        bench_fps = DISPLAY_FPS if args.fps is None else args.fps
+        if replay:
+            seed_session(replay.seed)
+            run_benchmark(scene_manager, screen, replay.scene_name, frames=replay.ticks, fps=bench_fps,
+                          input_source=replay)
+            verify_replay(replay, scene_manager.find_scene(replay.scene_name))
+        else:
+            run_benchmark(scene_manager, screen, args.bench, frames=args.frames, fps=bench_fps)
+        pygame.quit()
+        sys.exit(0)
+
+    # 🍞 Запікання масштабованих кадрів для кожної роздільності
+    if args.bake is not None:
+        from core.bake import run_bake, parse_size
+        from scenes.settings import SettingsMenu
+        sizes = [parse_size(size) for size in args.bake] or SettingsMenu.SCREEN_SIZES
+        run_bake(scene_manager, sizes)
+        scene_manager.quit_game()
+        pygame.quit()
+        sys.exit(0)
+
+    # 🔁 Перевірка витоків: menu → scene_1 → HeroCreator → level_1 → pause → menu по колу
+    if args.churn:
+        from core.churn import run_churn
+        ok = run_churn(scene_manager, screen, cycles=args.churn)
+        scene_manager.quit_game()
+        pygame.quit()
+        sys.exit(0 if ok else 1)
+
+    # 🎥 Запис / відтворення сесії: фіксований seed і введення по тіках
+    recorder = None
+    if args.record:
+        seed = args.seed if args.seed is not None else new_seed()
+        recorder = InputRecorder(KeyboardInput(), args.scene, seed, load_world_seed())
+        scene_manager.input_source = recorder
+        seed_session(seed)
+        scene_manager.change_scene(args.scene)
+    elif replay:
+        scene_manager.input_source = replay
+        seed_session(replay.seed)
+        scene_manager.change_scene(replay.scene_name)
+    else:
+        # ▶️ Стартова сцена
+        scene_manager.change_scene("menu")
+
+    # 🔁 Головний цикл гри
+    clock = pygame.time.Clock()
+    accumulator = 0.0
+    profiler = scene_manager.profiler
+    while scene_manager.running:
+        accumulator += min(clock.tick(DISPLAY_FPS), SceneManager.MAX_FRAME_MS)
+        profiler.begin_frame()
+
+        with profiler.section("events"):
+            events = pygame.event.get()
+        for event in events:
+            if event.type == pygame.QUIT:
                 scene_manager.quit_game()
 
-        # 🖱️ Відстеження руху миші
-        if event.type == pygame.MOUSEMOTION:
-            last_mouse_move_time = time.time()
-            if not mouse_visible:
-                pygame.mouse.set_visible(True)
-                mouse_visible = True
+            # 📎 Сполучення клавіш: Command + Esc
+            if event.type == pygame.KEYDOWN:
+                keys = pygame.key.get_pressed()
+                if (keys[pygame.K_LMETA] or keys[pygame.K_RMETA]) and keys[pygame.K_ESCAPE]:
+                    scene_manager.quit_game()
+
+                # 📊 F3 — оверлей профайлера, F4 — збереження історії кадрів у CSV
+                if event.key == pygame.K_F3:
+                    profiler.toggle()
+                elif event.key == pygame.K_F4 and profiler.history:
+                    profiler.dump_csv(get_save_path(f"profile_{time.strftime('%Y%m%d_%H%M%S')}.csv"))
+
+                # 🧠 F5 — оверлей пам'яті сцен і кешів, F6 — той самий звіт у консоль
+                elif event.key == pygame.K_F5:
+                    scene_manager.memory_overlay.toggle()
+                elif event.key == pygame.K_F6:
+                    scene_manager.memory_overlay.print_report()
+
+            # 🖱️ Відстеження руху миші
+            if event.type == pygame.MOUSEMOTION:
+                last_mouse_move_time = time.time()
+                if not mouse_visible:
+                    pygame.mouse.set_visible(True)
+                    mouse_visible = True
+
+        # 🕶️ Приховати мишу, якщо не рухалась понад HIDE_DELAY
+        if mouse_visible and time.time() - last_mouse_move_time > HIDE_DELAY:
+            pygame.mouse.set_visible(False)
+            mouse_visible = False
+
+        with profiler.section("events"):
+            scene_manager.handle_events(events)
+
+        # ⏳ Завершення фонових завдань (JobSystem) і покрокове завантаження сцени: трохи роботи щокадру,
+        # вікно лишається чуйним
+        with profiler.section("loading"):
+            if scene_manager.advance_loading(LOADING_BUDGET_MS):
+                accumulator = 0.0
+
+        # 🧮 Фіксований крок симуляції: скільки тіків накопичилось — стільки оновлень
+        while accumulator >= scene_manager.tick_ms:
+            if replay and replay.finished:
+                break
+            with profiler.section("update"):
+                scene_manager.update()
+            accumulator -= scene_manager.tick_ms
+
+        if replay and replay.finished:
+            verify_replay(replay, scene_manager.find_scene(replay.scene_name))
+            scene_manager.quit_game()
+
+        # 🎨 Відмальовка з інтерполяцією між двома останніми тіками
+        with profiler.section("render"):
+            scene_manager.render(screen, accumulator / scene_manager.tick_ms)
+        profiler.draw(screen)
+        scene_manager.memory_overlay.draw(screen)
+
+        with profiler.section("flip"):
+            pygame.display.flip()
+        profiler.end_frame()
+
+        # 📦 Звіт про імпорти — одразу після першого показаного кадру
+        if import_timer:
+            import_timer.uninstall()
+            import_timer.report((time.perf_counter() - import_timer.started_at) * 1000)
+            import_timer = None
 
-    # 🕶️ Приховати мишу, якщо не рухалась понад HIDE_DELAY
-    if mouse_visible and time.time() - last_mouse_move_time > HIDE_DELAY:
-        pygame.mouse.set_visible(False)
-        mouse_visible = False
+    if recorder:
+        recorder.save(args.record, state_digest(scene_manager.find_scene(recorder.scene_name)))
 
-    scene_manager.handle_events(events)
-    scene_manager.update()
-    scene_manager.render(screen)
+    pygame.quit()
 
-    pygame.display.flip()
-    clock.tick(30)
 
-pygame.quit()
\ No newline at end of file
+if __name__ == "__main__":
+    # 🧵 Процеси генерації шарів (JobSystem.submit_process) запускаються через spawn і імпортують цей файл заново:
+    # гра стартує лише в головному процесі; freeze_support — для зібраного PyInstaller застосунку
+    multiprocessing.freeze_support()
+    main()
@@ -5,6 +5,10 @@ import re
 import os
 import logging
 from utils.resource_loader import resource_path
+from core.baked import baked
+from core.sprite_sheet import SpriteSheet, flip_frames
+from utils.asset_manager import asset_manager
+from core.manifest import manifest
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -33,6 +37,7 @@ class Crow:
     def __init__(self, x, y, idle_frames, fly_frames, walk_frames, audio_manager, start_frame=0):
         self.x_world = x  # Світова позиція
         self.y = y
+        self.previous_pos = (x, y)  # Позиція попереднього тіку (для інтерполяції відмальовки)
         self.audio_manager = audio_manager
         self.manager = None
 
@@ -47,11 +52,12 @@ class Crow:
         self.speed = self.INITIAL_SPEED
         self.flipped = random.choice([True, False])
 
-        idle = [f.copy() for f in idle_frames]
-        fly = [f.copy() for f in fly_frames]
+        # Кадри атласу спільні для всіх ворон; віддзеркалений варіант теж спільний (flip_frames)
+        idle = idle_frames
+        fly = fly_frames
         if self.flipped:
-            idle = [pygame.transform.flip(f, True, False) for f in idle]
-            fly = [pygame.transform.flip(f, True, False) for f in fly]
+            idle = flip_frames(idle)
+            fly = flip_frames(fly)
         self.idle_frames = idle
         # Картання (caw)
         self.cawing = False
@@ -68,15 +74,15 @@ class Crow:
         self.flight_sound_timer = 0
         self.sound_played = False
 
-        self.flight_started_at = None
+        self.flight_elapsed = 0  # Скільки мс симуляції триває політ
         self.flight_start_delay = 0
         self.flight_delay_timer = 0
 
         # Ходьба
-        self.walk_frames_original = [f.copy() for f in walk_frames]
+        self.walk_frames_original = walk_frames
         self.walk_frames = (
             self.walk_frames_original if not self.flipped
-            else [pygame.transform.flip(f, True, False) for f in self.walk_frames_original]
+            else flip_frames(self.walk_frames_original)
         )
         self.walking = False
         self.walk_direction = 0
@@ -95,7 +101,7 @@ class Crow:
             if self.flight_delay_timer >= self.flight_start_delay:
                 self.pending_flight = False
                 self.is_flying = True
-                self.flight_started_at = pygame.time.get_ticks()
+                self.flight_elapsed = 0
                 self.current_frame = 0
                 self.frame_timer = 0
             else:
@@ -109,9 +115,10 @@ class Crow:
             dy = -self.speed * math.sin(math.radians(self.flight_angle))
             self.x_world += dx
             self.y += dy
+            self.flight_elapsed += dt
 
             screen = pygame.display.get_surface()
-            if pygame.time.get_ticks() - self.flight_started_at > self.OFFSCREEN_DELAY:
+            if self.flight_elapsed > self.OFFSCREEN_DELAY:
                 if (
                     self.x_world  < -self.SCREEN_MARGIN or self.x_world  > screen.get_width() + self.SCREEN_MARGIN or
                     self.y < -self.SCREEN_MARGIN or self.y > screen.get_height() + self.SCREEN_MARGIN
@@ -138,7 +145,7 @@ class Crow:
                     self.current_frame = 0
                     self.flipped = self.walk_direction == -1
                     self.walk_frames = (
-                        [pygame.transform.flip(f, True, False) for f in self.walk_frames_original]
+                        flip_frames(self.walk_frames_original)
                         if self.flipped else self.walk_frames_original
                     )
                 else:
@@ -156,7 +163,7 @@ class Crow:
                 self.walking = self.walk_direction != 0
                 self.flipped = self.walk_direction == -1
                 self.walk_frames = (
-                    [pygame.transform.flip(f, True, False) for f in self.walk_frames_original]
+                    flip_frames(self.walk_frames_original)
                     if self.flipped else self.walk_frames_original
                 )
 
@@ -191,16 +198,18 @@ class Crow:
             if frames:
                 self.current_frame = (self.current_frame + 1) % len(frames)
 
-    def draw(self, screen, world_x):
+    def draw(self, screen, world_x, alpha=1.0):
         if self.off_screen:
             return
         current_image = self.get_current_frames()[self.current_frame]
-        screen_x = int(self.x_world - world_x)
-        screen.blit(current_image, (screen_x, self.y))
+        previous_x, previous_y = self.previous_pos
+        screen_x = int(previous_x + (self.x_world - previous_x) * alpha - world_x)
+        screen_y = int(previous_y + (self.y - previous_y) * alpha)
+        screen.blit(current_image, (screen_x, screen_y))
 
     def play_caw_sound(self):
         folder = resource_path("assets/level_1/crow")
-        sound_files = [f for f in os.listdir(folder) if f.endswith((".mp3", ".wav", ".ogg"))]
+        sound_files = manifest.names(folder, (".mp3", ".wav", ".ogg"))
         if sound_files:
             sound_path = os.path.join(folder, random.choice(sound_files))
             self.audio_manager.play_sound(sound_path)
@@ -224,58 +233,76 @@ class Crow:
 
 
 class CrowManager:
-    def __init__(self, audio_manager, screen, scale_x, scale_y):
+    ANIMATION_FOLDERS = (
+        "assets/level_1/crow/idle",
+        "assets/level_1/crow/fly",
+        "assets/level_1/crow/walk",
+        "assets/level_1/crow/idle/caw",
+    )
+
+    def __init__(self, audio_manager, screen, scale_x, scale_y, assets=None, rng=None):
         self.audio_manager = audio_manager
+        self.assets = assets  # Передзавантажені ресурси сцени (AssetBundle) або None
+        self.rng = rng if rng is not None else random  # Розміщення зграй: random.Random з seed світу
         self.active_sounds = []
         self.screen = screen
         self.scale_x = scale_x
         self.scale_y = scale_y
         self.crows = []
         self.next_crow_x = 3500
-        self.crow_spacing = random.randint(100000, 100000)
+        self.crow_spacing = self.rng.randint(100000, 100000)
 
         self.idle_frames = []
         self.fly_frames = []
         self.walk_frames = []
 
     def load_animations(self):
+        def build_frame(path):
+            if self.assets is not None:
+                frame = self.assets.image(path).convert_alpha()
+            else:
+                frame = pygame.image.load(path).convert_alpha()
+            return pygame.transform.scale(
+                frame,
+                (int(frame.get_width() * self.scale_x), int(frame.get_height() * self.scale_y))
+            )
+
         def load_frames(folder):
+            return asset_manager.get((folder, (self.scale_x, self.scale_y), "frames"), lambda: build_frames(folder))
+
+        def build_frames(folder):
             frames = []
             try:
                 def extract_number(filename):
                     match = re.match(r"(\d+)\.png", filename)
                     return int(match.group(1)) if match else float('inf')
 
-                for filename in sorted(os.listdir(folder), key=extract_number):
-                    if filename.endswith(".png"):
-                        frame = pygame.image.load(os.path.join(folder, filename)).convert_alpha()
-                        scaled = pygame.transform.scale(
-                            frame,
-                            (int(frame.get_width() * self.scale_x), int(frame.get_height() * self.scale_y))
-                        )
-                        frames.append(scaled)
+                for filename in sorted(manifest.names(folder, (".png",)), key=extract_number):
+                    path = os.path.join(folder, filename)
+                    frames.append(baked.load(path, (self.scale_x, self.scale_y), lambda: build_frame(path)))
             except Exception as e:
                 logger.error(f"[CrowManager] Помилка завантаження анімації з {folder}: {e}")
-            return frames
+            return SpriteSheet(frames).frames
 
-        self.idle_frames = load_frames(resource_path("assets/level_1/crow/idle"))
-        self.fly_frames = load_frames(resource_path("assets/level_1/crow/fly"))
-        self.walk_frames = load_frames(resource_path("assets/level_1/crow/walk"))
-        self.caw_frames = load_frames(resource_path("assets/level_1/crow/idle/caw"))
+        idle_folder, fly_folder, walk_folder, caw_folder = self.ANIMATION_FOLDERS
+        self.idle_frames = load_frames(resource_path(idle_folder))
+        self.fly_frames = load_frames(resource_path(fly_folder))
+        self.walk_frames = load_frames(resource_path(walk_folder))
+        self.caw_frames = load_frames(resource_path(caw_folder))
 
     def spawn_group(self, x):
-        group_size = random.randint(2, 4)
-        spacing = int(random.randint(80, 130) * self.scale_x)
-        group_id = random.randint(10000, 99999)
+        group_size = self.rng.randint(2, 4)
+        spacing = int(self.rng.randint(80, 130) * self.scale_x)
+        group_id = self.rng.randint(10000, 99999)
 
         for i in range(group_size):
-            idle = [frame.copy() for frame in self.idle_frames]
-            fly = [frame.copy() for frame in self.fly_frames]
-            walk = [frame.copy() for frame in self.walk_frames]
+            idle = self.idle_frames
+            fly = self.fly_frames
+            walk = self.walk_frames
 
-            y = int(random.randint(650, 730) * self.scale_y) + random.randint(-20, 20)
+            y = int(self.rng.randint(650, 730) * self.scale_y) + self.rng.randint(-20, 20)
             crow_x = x + i * spacing
-            start_frame = random.randint(0, len(idle) - 1)
+            start_frame = self.rng.randint(0, len(idle) - 1)
 
             crow = Crow(
                 x=crow_x,
@@ -286,9 +313,9 @@ class CrowManager:
                 audio_manager=self.audio_manager,
                 start_frame=start_frame
             )
-            crow.caw_frames = [f.copy() for f in self.caw_frames]  # ⬅️ нове
+            crow.caw_frames = self.caw_frames  # ⬅️ нове
             crow.group_id = group_id
-            crow.trigger_distance = random.randint(300, 500)
+            crow.trigger_distance = self.rng.randint(300, 500)
             crow.manager = self
             self.crows.append(crow)
 
@@ -297,7 +324,7 @@ class CrowManager:
     def update(self, hero_world_x, world_x, scroll_velocity, screen_width, dt):
         if world_x + screen_width > self.next_crow_x:
             self.spawn_group(self.next_crow_x)
-            self.next_crow_x += random.randint(self.crow_spacing - 300, self.crow_spacing + 300)
+            self.next_crow_x += self.rng.randint(self.crow_spacing - 300, self.crow_spacing + 300)
 
         triggered_groups = set()
         for crow in self.crows:
@@ -316,14 +343,19 @@ class CrowManager:
 
         self.crows = [c for c in self.crows if not c.off_screen]
 
-    def draw(self, screen, world_x):
+    def save_previous_state(self):
+        """Запам'ятовує позиції ворон попереднього тіку для інтерполяції під час відмальовки."""
+        for crow in self.crows:
+            crow.previous_pos = (crow.x_world, crow.y)
+
+    def draw(self, screen, world_x, alpha=1.0):
         for crow in self.crows:
-            crow.draw(screen, world_x)
+            crow.draw(screen, world_x, alpha)
 
     def reset(self):
         self.crows.clear()
         self.next_crow_x = 2000
-        self.crow_spacing = random.randint(2500, 4000)
+        self.crow_spacing = self.rng.randint(2500, 4000)
 
     def stop_all_sounds(self):
         for sound_or_channel in self.active_sounds:
@@ -1,20 +1,36 @@
 import pygame
 import logging
 from utils.resource_loader import resource_path
+from core.baked import baked
 
 class HomeTree:
-    def __init__(self, position_x, scale_x, scale_y, screen_height):
+    IMAGE_PATH = "assets/level_1/home_tree/home_tree.png"
+
+    def __init__(self, position_x, scale_x, scale_y, screen_height, assets=None):
         self.x_world = position_x
         logging.info("[HomeTree] Ініціалізація Дерева лісовика")
 
         # Координата X у світі
         self.position_x_world = position_x
 
-        # Завантаження текстури
-        original_image = pygame.image.load(resource_path("assets/level_1/home_tree/home_tree.png")).convert_alpha()
+        # Завантаження текстури (масштабована вже запечена — див. core/baked.py)
+        image_path = resource_path(self.IMAGE_PATH)
+        self.image = baked.load(image_path, (scale_x, scale_y), lambda: self.build_image(image_path, scale_x, scale_y, assets))
+
+        self.rect = self.image.get_rect()
+        self.rect.bottom = screen_height - int(screen_height * 0.065)  # Вирівнювання по шару ближніх дерев
+
+        self.player_near = False
+
+    @staticmethod
+    def build_image(image_path, scale_x, scale_y, assets=None):
+        if assets is not None:
+            original_image = assets.image(image_path).convert_alpha()
+        else:
+            original_image = pygame.image.load(image_path).convert_alpha()
 
         # Масштабування зображення
-        self.image = pygame.transform.scale(
+        return pygame.transform.scale(
             original_image,
             (
                 int(original_image.get_width() * scale_x),
@@ -22,11 +38,6 @@ class HomeTree:
             )
         )
 
-        self.rect = self.image.get_rect()
-        self.rect.bottom = screen_height - int(screen_height * 0.065)  # Вирівнювання по шару ближніх дерев
-
-        self.player_near = False
-
     def update(self, hero_world_x):
         # Розрахунок дистанції між героєм та деревом
         distance_to_player = abs(self.position_x_world - hero_world_x)
@@ -5,14 +5,24 @@ import pygame.surfarray
 import numpy as np
 
 from utils.resource_loader import resource_path
+from core.input_source import KeyboardInput
+from core.baked import baked
+from core.sprite_sheet import SpriteSheet
+from core.manifest import manifest
+from utils.asset_manager import asset_manager
 
 class Player:
-    _frame_cache = {}
+    # Папки анімацій героя (assets/characters/раса/стать/зовнішність) за значеннями зі збереження
+    RACE_FOLDERS = {"людина": "human", "ельф": "elf", "гном": "dwarf", "звіролюд": "beast"}
+    GENDER_FOLDERS = {"чоловіча": "man", "жіноча": "girl"}
+    APPEARANCE_FOLDERS = {"світла": "white", "темна": "black"}
 
-    def __init__(self, screen, scale_x, scale_y, hero_data):
+    def __init__(self, screen, scale_x, scale_y, hero_data, input_source=None, assets=None):
         self.screen = screen
         self.scale_x = scale_x
         self.scale_y = scale_y
+        self.input_source = input_source or KeyboardInput()
+        self.assets = assets  # Передзавантажені ресурси сцени (AssetBundle) або None
 
         self.hero_scale = 2
         base_height = int(screen.get_height() * 0.15)
@@ -34,7 +44,8 @@ class Player:
         self.stamina_run_cost = 20
         self.stamina_jump_cost = 15
         self.stamina_delay = 1000
-        self.last_stamina_use = pygame.time.get_ticks()
+        self.clock_ms = 0  # Час симуляції (сума dt), щоб запис і відтворення гри збігались
+        self.last_stamina_use = self.clock_ms
 
         # Physics
         self.speed = 3
@@ -84,76 +95,79 @@ class Player:
 
     def load_animations(self, hero_data, target_height):
 
-        walk_path, cache_key, _ = self.get_animation_path_and_key(self.screen, hero_data, self.hero_scale, self.scale_x, self.scale_y)
-        self.walk_frames_right, self.walk_frames_left = self.load_animation_set(walk_path, cache_key, target_height)
+        walk_path, _, _ = self.get_animation_path_and_key(self.screen, hero_data, self.hero_scale, self.scale_x, self.scale_y)
+        self.walk_frames_right, self.walk_frames_left = self.load_animation_set(walk_path, target_height)
 
         base_path = os.path.dirname(walk_path)
 
         # Потім явно додаємо папки
         jump_path = os.path.join(base_path, "jump")
-        jump_cache_key = (jump_path, self.hero_scale, self.scale_x, self.scale_y)
-        self.jump_frames_right, self.jump_frames_left = self.load_animation_set(jump_path, jump_cache_key,
-                                                                                target_height)
+        self.jump_frames_right, self.jump_frames_left = self.load_animation_set(jump_path, target_height)
 
         death_path = os.path.join(base_path, "dead")
-        death_cache_key = (death_path, self.hero_scale, self.scale_x, self.scale_y)
-        self.death_frames_right, self.death_frames_left = self.load_animation_set(death_path, death_cache_key,
-                                                                                  target_height)
+        self.death_frames_right, self.death_frames_left = self.load_animation_set(death_path, target_height)
 
         stun_path = os.path.join(base_path, "stan")
-        stun_cache_key = (stun_path, self.hero_scale, self.scale_x, self.scale_y)
-        self.stun_frames_right, self.stun_frames_left = self.load_animation_set(stun_path, stun_cache_key,
-                                                                                target_height)
+        self.stun_frames_right, self.stun_frames_left = self.load_animation_set(stun_path, target_height)
 
         attack_path = os.path.join(base_path, "attack")
-        attack_cache_key = (attack_path, self.hero_scale, self.scale_x, self.scale_y)
-        self.attack_frames_right, self.attack_frames_left = self.load_animation_set(attack_path, attack_cache_key,
-                                                                                    target_height)
+        self.attack_frames_right, self.attack_frames_left = self.load_animation_set(attack_path, target_height)
 
-    def load_animation_set(self, path, cache_key, target_height):
+    def load_animation_set(self, path, target_height):
+        """Кадри анімації праворуч і ліворуч зі спільного кешу ресурсів (однакові для всіх екземплярів гравця)."""
+        return asset_manager.get(
+            (path, target_height, "night"), lambda: self.build_animation_set(path, target_height)
+        )
+
+    def build_animation_set(self, path, target_height):
 
         frames_right = []
         frames_left = []
 
-        if not os.path.isdir(path):
-            return frames_right, frames_left
-
-        files = sorted(os.listdir(path))
-        for filename in files:
-            if not filename.lower().endswith(".png") or filename.startswith("."):
-                continue
+        for filename in manifest.names(path, (".png",)):
 
             full_path = os.path.join(path, filename)
             try:
-                image = pygame.image.load(full_path).convert_alpha()
-
-                orig_width, orig_height = image.get_size()
-                aspect_ratio = orig_width / orig_height
-                target_width = int(target_height * aspect_ratio)
-                scaled_image = pygame.transform.scale(image, (target_width, target_height))
-
-                night_image = self.apply_night_filter(scaled_image.copy())
+                night_image = baked.load(
+                    full_path, (target_height, "night"), lambda: self.build_frame(full_path, target_height)
+                )
                 frames_right.append(night_image)
-                frames_left.append(pygame.transform.flip(night_image.copy(), True, False))
 
             except Exception as e:
                 pass
 
 
-        Player._frame_cache[cache_key] = (frames_right, frames_left)
+        # Кадри анімації — один атлас; ліворуч — його віддзеркалений варіант
+        frames_right = SpriteSheet(frames_right).frames
+        frames_left = frames_right.flipped()
         return frames_right, frames_left
 
+    def build_frame(self, full_path, target_height):
+        """Кадр героя з PNG: масштабування до target_height зі збереженням пропорцій і нічний фільтр."""
+        if self.assets is not None:
+            image = self.assets.image(full_path).convert_alpha()
+        else:
+            image = pygame.image.load(full_path).convert_alpha()
+
+        orig_width, orig_height = image.get_size()
+        aspect_ratio = orig_width / orig_height
+        target_width = int(target_height * aspect_ratio)
+        scaled_image = pygame.transform.scale(image, (target_width, target_height))
+
+        return self.apply_night_filter(scaled_image.copy())
+
     @staticmethod
-    def get_animation_path_and_key(screen, hero_data, hero_scale, scale_x, scale_y):
-        race_map = {"людина": "human", "ельф": "elf", "гном": "dwarf", "звіролюд": "beast"}
-        gender_map = {"чоловіча": "man", "жіноча": "girl"}
-        appearance_map = {"світла": "white", "темна": "black"}
+    def get_base_path(hero_data):
+        """Відносний шлях до папки анімацій героя за расою, статтю та зовнішністю."""
+        race = Player.RACE_FOLDERS.get(hero_data.get("Раса", "людина").lower(), "human")
+        gender = Player.GENDER_FOLDERS.get(hero_data.get("Стать", "чоловіча").lower(), "man")
+        appearance = Player.APPEARANCE_FOLDERS.get(hero_data.get("Зовнішність", "темна").lower(), "black")
 
-        race = race_map.get(hero_data.get("Раса", "людина").lower(), "human")
-        gender = gender_map.get(hero_data.get("Стать", "чоловіча").lower(), "man")
-        appearance = appearance_map.get(hero_data.get("Зовнішність", "темна").lower(), "black")
+        return os.path.join("assets", "characters", race, gender, appearance)
 
-        base_path = os.path.join("assets", "characters", race, gender, appearance)
+    @staticmethod
+    def get_animation_path_and_key(screen, hero_data, hero_scale, scale_x, scale_y):
+        base_path = Player.get_base_path(hero_data)
         walk_path = resource_path(os.path.join(base_path, "walk"))
         base_height = int(screen.get_height() * 0.15)
         target_height = int(base_height * hero_scale)
@@ -176,11 +190,11 @@ class Player:
         if self.is_dead:
             return
 
-        keys = pygame.key.get_pressed()
-        mods = pygame.key.get_mods()
+        keys = self.input_source.get_pressed()
+        mods = self.input_source.get_mods()
         direction = 0
 
-        now = pygame.time.get_ticks()
+        now = self.clock_ms
 
         # Атака — дозволено лише якщо гравець стоїть на землі та не атакує
         if keys[pygame.K_f] and not self.attacking and self.on_ground and now - self.last_attack_time >= self.attack_cooldown:
@@ -216,7 +230,7 @@ class Player:
         # Витрати стаміни на біг
         if is_running and direction != 0:
             self.stamina -= self.stamina_run_cost * dt / 1000
-            self.last_stamina_use = pygame.time.get_ticks()
+            self.last_stamina_use = self.clock_ms
 
         # Рух
         target_speed = self.speed * speed_multiplier * direction
@@ -237,9 +251,11 @@ class Player:
             self.velocity_y = self.jump_power
             self.on_ground = False
             self.stamina -= self.stamina_jump_cost
-            self.last_stamina_use = pygame.time.get_ticks()
+            self.last_stamina_use = self.clock_ms
 
     def update(self, dt):
+        self.clock_ms += dt
+
         # 💀 Якщо помер — запускаємо анімацію смерті і більше нічого
         if self.hp <= 0:
             if not self.is_dead:
@@ -380,7 +396,7 @@ class Player:
             self.current_animation = "idle"
 
         # Регенерація стаміни
-        now = pygame.time.get_ticks()
+        now = self.clock_ms
         if now - self.last_stamina_use > self.stamina_delay and self.stamina < self.max_stamina:
             self.stamina += self.stamina_regen_rate * dt / 1000
             if self.stamina > self.max_stamina:
@@ -401,12 +417,14 @@ class Player:
         self.attack_frame_index = 0
         self.attack_animation_done = True
 
-    def draw(self, screen):
+    def draw(self, screen, offset=(0, 0)):
+        # offset — зсув для інтерполяції між тіками симуляції
+        draw_rect = self.rect.move(offset)
         if self.image:
-            img_rect = self.image.get_rect(midbottom=self.rect.midbottom)
+            img_rect = self.image.get_rect(midbottom=draw_rect.midbottom)
             screen.blit(self.image, img_rect)
         else:
-            pygame.draw.rect(screen, (255, 0, 0), self.rect)
+            pygame.draw.rect(screen, (255, 0, 0), draw_rect)
 
         # === Стилізовані прогресбари (напівпрозорі) ===
         bar_width = int(self.rect.width * 0.5)
@@ -414,8 +432,8 @@ class Player:
         spacing = 3
         corner_radius = 3
 
-        start_x = self.rect.centerx - bar_width // 2
-        start_y = self.rect.y - 45*self.scale_y  # вище
+        start_x = draw_rect.centerx - bar_width // 2
+        start_y = draw_rect.y - 45*self.scale_y  # вище
 
         def draw_bar(value, max_value, color_fn, y_offset):
             ratio = max(0.0, min(1.0, value / max_value))
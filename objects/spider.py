@@ -3,14 +3,23 @@ import os
 import random
 import logging
 from utils.resource_loader import resource_path
+from core.baked import baked
+from core.sprite_sheet import SpriteSheet, flip_frames
+from utils.asset_manager import asset_manager
+from core.manifest import manifest
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 class Spider:
 
-    _frame_cache = {}  # Ключ: (animation, scale, scale_x, scale_y) => value: [Surface, ...]
-    _sound_cache = {}
+    ANIMATION_NAMES = ("stay", "walk", "atack", "jump", "dead")
+    SOUND_PATHS = (
+        os.path.join("assets", "level_1", "spider", "walk", "Spider_walk.mp3"),
+        os.path.join("assets", "level_1", "spider", "jump", "spider_jump.mp3"),
+        os.path.join("assets", "level_1", "spider", "dead", "dead.mp3"),
+    )
+    ATTACK_SOUND_FOLDER = os.path.join("assets", "level_1", "spider", "atack")
 
     # 🔧 Основні параметри анімації та поведінки
     FRAME_DELAY = 50  # ⏱️ Затримка між кадрами анімації в мілісекундах (загальна швидкість анімацій)
@@ -33,31 +42,35 @@ class Spider:
     AGGRO_STOP_MAX_DURATION = 1000  # 🛑 Максимальна тривалість зупинки (мс)
 
     # 🦘 Стрибок
-    JUMP_PAUSE_DURATION = random.randint(300, 600)  # ⏱️ Пауза після завершення стрибка перед новими діями (мс)
+    JUMP_PAUSE_RANGE = (300, 600)  # ⏱️ Пауза після завершення стрибка перед новими діями (мс)
     JUMP_GRAVITY = 1700  # 🌍 Гравітація під час стрибка — наскільки швидко павук "падає" (пікс/с²)
 
     # 🦘 Поведінка при великій дистанції (іноді стрибає, іноді просто йде)
     FAR_JUMP_PROBABILITY = 0.1  # Ймовірність стрибка, якщо гравець далеко
     FAR_JUMP_CHECK_INTERVAL = (2000, 3500)  # Інтервал між перевірками стрибка
 
-    def __init__(self, x, y, audio_manager, scale_x=1.0, scale_y=1.0, scale=None):
+    def __init__(self, x, y, audio_manager, scale_x=1.0, scale_y=1.0, scale=None, assets=None, rng=None):
         self.audio_manager = audio_manager
+        self.assets = assets  # Передзавантажені ресурси сцени (AssetBundle) або None
+        self.rng = rng if rng is not None else random  # Розмір і поведінка: random.Random з seed світу
         self.scale_x = scale_x
         self.scale_y = scale_y
         self.x = x
         self.y = y
-        self.scale = scale if scale is not None else random.uniform(0.5, 1.3)
-        self.flipped = random.choice([True, False])
+        self.previous_pos = (x, y)  # Позиція попереднього тіку (для інтерполяції відмальовки)
+        self.scale = scale if scale is not None else self.rng.uniform(0.5, 1.3)
+        self.flipped = self.rng.choice([True, False])
+        self.jump_pause_duration = self.rng.randint(*Spider.JUMP_PAUSE_RANGE)
         self.manager = None
 
         # 🎞️ Завантаження анімацій
         self.stay_frames = self.load_frames("stay")
         self.walk_frames_original = self.load_frames("walk")
-        self.walk_frames = self.walk_frames_original.copy()
+        self.walk_frames = self.walk_frames_original
         self.attack_frames_original = self.load_frames("atack")
-        self.attack_frames = self.attack_frames_original.copy()
+        self.attack_frames = self.attack_frames_original
         self.jump_frames_original = self.load_frames("jump")
-        self.jump_frames = self.jump_frames_original.copy()
+        self.jump_frames = self.jump_frames_original
         self.dead_frames = self.load_frames("dead")
 
         # 🧠 Стани анімації
@@ -71,7 +84,7 @@ class Spider:
         self.walk_elapsed = 0
         self.walk_duration = 0
         self.walk_timer = 0
-        self.next_walk_decision = random.randint(*self.WALK_DECISION_INTERVAL)
+        self.next_walk_decision = self.rng.randint(*self.WALK_DECISION_INTERVAL)
         self.walk_speed = self.WALK_SPEED / (0.5 + self.scale / 2)
 
         # 😡 Агресія
@@ -104,7 +117,7 @@ class Spider:
         self.attack_count = 0
 
         self.far_jump_check_timer = 0
-        self.far_jump_check_cooldown = random.randint(*Spider.FAR_JUMP_CHECK_INTERVAL)
+        self.far_jump_check_cooldown = self.rng.randint(*Spider.FAR_JUMP_CHECK_INTERVAL)
 
         # Смерть
         self.dead = False
@@ -123,24 +136,21 @@ class Spider:
         # 🎵 Аудіо
         vol = self.audio_manager.sound_volume
 
-        walk_sound_file = os.path.join("assets", "level_1", "spider", "walk", "Spider_walk.mp3")
-        self.walk_sound = Spider.load_sound_cached(resource_path(walk_sound_file), vol)
+        walk_sound_file, jump_sound_file, death_sound_path = Spider.SOUND_PATHS
+        self.walk_sound = Spider.load_sound_cached(resource_path(walk_sound_file), vol, self.assets)
 
-        self.jump_sound_path = resource_path(os.path.join("assets", "level_1", "spider", "jump", "spider_jump.mp3"))
-        self.jump_sound = Spider.load_sound_cached(self.jump_sound_path, vol)
+        self.jump_sound_path = resource_path(jump_sound_file)
+        self.jump_sound = Spider.load_sound_cached(self.jump_sound_path, vol, self.assets)
 
         # 🪦 Звук смерті
-        death_sound_path = os.path.join("assets", "level_1", "spider", "dead", "dead.mp3")
-        self.death_sound = Spider.load_sound_cached(resource_path(death_sound_path), vol)
+        self.death_sound = Spider.load_sound_cached(resource_path(death_sound_path), vol, self.assets)
 
         self.attack_sounds = []
-        attack_sound_folder = resource_path(os.path.join("assets", "level_1", "spider", "atack"))
-        for file in os.listdir(attack_sound_folder):
-            if file.endswith((".mp3", ".wav", ".ogg")):
-                path = os.path.join(attack_sound_folder, file)
-                sound = Spider.load_sound_cached(path, volume=vol)
-                if sound:
-                    self.attack_sounds.append(sound)
+        attack_sound_folder = resource_path(Spider.ATTACK_SOUND_FOLDER)
+        for path in manifest.files(attack_sound_folder, (".mp3", ".wav", ".ogg")):
+            sound = Spider.load_sound_cached(path, volume=vol, assets=self.assets)
+            if sound:
+                self.attack_sounds.append(sound)
 
         # 🖋️ Шрифт
         self.font = pygame.font.SysFont("Arial", int(20 * self.scale))
@@ -150,35 +160,41 @@ class Spider:
             self.flip_images()
 
     def load_frames(self, animation_name):
-        key = (animation_name, round(self.scale, 2), round(self.scale_x, 2), round(self.scale_y, 2))
-
-        if key in Spider._frame_cache:
-            return Spider._frame_cache[key]
-
         folder = resource_path(os.path.join("assets", "level_1", "spider", animation_name))
-        files = sorted(f for f in os.listdir(folder) if f.endswith(".png"))
+        scale = (round(self.scale, 2), round(self.scale_x, 2), round(self.scale_y, 2))
+        return asset_manager.get((folder, scale, "frames"), lambda: self.build_frames(folder))
+
+    def build_frames(self, folder):
+        files = manifest.names(folder, (".png",))
         frames = []
 
         for filename in files:
-            image = pygame.image.load(os.path.join(folder, filename)).convert_alpha()
-            width = int(image.get_width() * self.scale * self.scale_x)
-            height = int(image.get_height() * self.scale * self.scale_y)
-            scaled = pygame.transform.scale(image, (width, height))
-            frames.append(scaled)
+            path = os.path.join(folder, filename)
+            frames.append(baked.load(path, (self.scale, self.scale_x, self.scale_y), lambda: self.build_frame(path)))
+
+        # Кадри анімації — один атлас; віддзеркалення (flip_frames) спільне для всіх павуків
+        return SpriteSheet(frames).frames
 
-        Spider._frame_cache[key] = frames  # Кешуємо
-        return frames
+    def build_frame(self, path):
+        """Кадр павука з PNG, масштабований під розмір павука та екрана."""
+        if self.assets is not None:
+            image = self.assets.image(path).convert_alpha()
+        else:
+            image = pygame.image.load(path).convert_alpha()
+        width = int(image.get_width() * self.scale * self.scale_x)
+        height = int(image.get_height() * self.scale * self.scale_y)
+        return pygame.transform.scale(image, (width, height))
 
     @staticmethod
-    def load_sound_cached(path, volume):
+    def load_sound_cached(path, volume, assets=None):
         """
         Завантажує звук із кешем, щоб не створювати кілька Sound-обʼєктів для однакового файлу.
         """
-        if path in Spider._sound_cache:
-            return Spider._sound_cache[path]
         try:
-            sound = pygame.mixer.Sound(path)
-            Spider._sound_cache[path] = sound
+            sound = asset_manager.get(
+                (path, None, "sound"),
+                lambda: assets.sound(path) if assets is not None else pygame.mixer.Sound(path),
+            )
             sound.set_volume(volume)
             return sound
         except Exception as e:
@@ -189,21 +205,11 @@ class Spider:
         Віддзеркалює всі основні анімації павука по горизонталі, якщо обрано випадкову орієнтацію.
         Це робить ворога "дивлячись ліворуч" замість праворуч.
         """
-        self.stay_frames = [
-            pygame.transform.flip(frame, True, False) for frame in self.stay_frames
-        ]
-        self.walk_frames = [
-            pygame.transform.flip(frame, True, False) for frame in self.walk_frames_original
-        ]
-        self.attack_frames = [
-            pygame.transform.flip(frame, True, False) for frame in self.attack_frames_original
-        ]
-        self.jump_frames = [
-            pygame.transform.flip(frame, True, False) for frame in self.jump_frames_original
-        ]
-        self.dead_frames = [
-            pygame.transform.flip(frame, True, False) for frame in self.dead_frames
-        ]
+        self.stay_frames = flip_frames(self.stay_frames)
+        self.walk_frames = flip_frames(self.walk_frames_original)
+        self.attack_frames = flip_frames(self.attack_frames_original)
+        self.jump_frames = flip_frames(self.jump_frames_original)
+        self.dead_frames = flip_frames(self.dead_frames)
 
     def reload_scaled_frames(self):
         """
@@ -218,15 +224,15 @@ class Spider:
 
         # 🚶 Ходьба
         self.walk_frames_original = self.load_frames("walk")
-        self.walk_frames = self.walk_frames_original.copy()
+        self.walk_frames = self.walk_frames_original
 
         # 🕷️ Атака
         self.attack_frames_original = self.load_frames("atack")
-        self.attack_frames = self.attack_frames_original.copy()
+        self.attack_frames = self.attack_frames_original
 
         # 🦘 Стрибок
         self.jump_frames_original = self.load_frames("jump")
-        self.jump_frames = self.jump_frames_original.copy()
+        self.jump_frames = self.jump_frames_original
 
         # 🔁 Якщо павук має бути віддзеркалена — фліпаємо кадри
         if self.flipped:
@@ -299,9 +305,9 @@ class Spider:
                 self.far_jump_check_timer += dt
                 if self.far_jump_check_timer >= self.far_jump_check_cooldown:
                     self.far_jump_check_timer = 0
-                    self.far_jump_check_cooldown = random.randint(*Spider.FAR_JUMP_CHECK_INTERVAL)
+                    self.far_jump_check_cooldown = self.rng.randint(*Spider.FAR_JUMP_CHECK_INTERVAL)
 
-                    if random.random() < Spider.FAR_JUMP_PROBABILITY:
+                    if self.rng.random() < Spider.FAR_JUMP_PROBABILITY:
                         self.set_walking(False)
                         self.walk_direction = 0
                         self.start_directional_jump(player_x)
@@ -316,7 +322,7 @@ class Spider:
         # 🕒 Пауза після стрибка — чекаємо, не рухаємось
         if self.after_jump_pause:
             self.after_jump_timer += dt
-            if self.after_jump_timer >= self.JUMP_PAUSE_DURATION:
+            if self.after_jump_timer >= self.jump_pause_duration:
                 self.after_jump_pause = False
             return
 
@@ -357,27 +363,25 @@ class Spider:
                 self.walk_timer = 0
                 self.walk_direction = 0
                 # Встановлюємо, коли наступного разу буде прийнято рішення про рух
-                self.next_walk_decision = random.randint(*self.WALK_DECISION_INTERVAL)
+                self.next_walk_decision = self.rng.randint(*self.WALK_DECISION_INTERVAL)
 
         else:
             # 🧠 Час ухвалювати нове рішення?
             if self.walk_timer >= self.next_walk_decision:
-                if random.random() < self.WALK_PROBABILITY:
+                if self.rng.random() < self.WALK_PROBABILITY:
                     # ✅ Починаємо нову прогулянку
                     self.set_walking(True)
                     self.walk_elapsed = 0
-                    self.walk_duration = random.randint(*self.WALK_DURATION_RANGE)
-                    self.walk_direction = random.choice([-1, 1])
+                    self.walk_duration = self.rng.randint(*self.WALK_DURATION_RANGE)
+                    self.walk_direction = self.rng.choice([-1, 1])
 
                     # 🔄 Фліпаємо зображення, якщо рухаємося вправо
                     self.flipped = self.walk_direction == 1
-                    self.walk_frames = [
-                        pygame.transform.flip(f, True, False) for f in self.walk_frames_original
-                    ] if self.flipped else self.walk_frames_original
+                    self.walk_frames = flip_frames(self.walk_frames_original) if self.flipped else self.walk_frames_original
 
                 # Перезапускаємо таймер незалежно від того, вирішили йти чи ні
                 self.walk_timer = 0
-                self.next_walk_decision = random.randint(*self.WALK_DECISION_INTERVAL)
+                self.next_walk_decision = self.rng.randint(*self.WALK_DECISION_INTERVAL)
 
         # 🎞️ Оновлюємо кадр анімації
         self.animate(dt)
@@ -431,9 +435,9 @@ class Spider:
             self.x += direction * self.aggro_current_speed
 
         # 🐜 Випадкова зупинка — симуляція непередбачуваної поведінки
-        if random.random() < self.AGGRO_STOP_PROBABILITY:
+        if self.rng.random() < self.AGGRO_STOP_PROBABILITY:
             self.aggro_stopping = True
-            self.aggro_stop_duration = random.randint(
+            self.aggro_stop_duration = self.rng.randint(
                 self.AGGRO_STOP_MIN_DURATION,
                 self.AGGRO_STOP_MAX_DURATION
             )
@@ -498,15 +502,15 @@ class Spider:
         # 🔄 Встановлення напрямку та фліп кадрів стрибка
         self.flipped = dx > 0
         self.jump_frames = (
-            [pygame.transform.flip(f, True, False) for f in self.jump_frames_original]
-            if self.flipped else self.jump_frames_original.copy()
+            flip_frames(self.jump_frames_original)
+            if self.flipped else self.jump_frames_original
         )
 
         # 🔉 Відтворення звуків атаки зі зниженням гучності залежно від дистанції
         distance = abs(self.x - player_x)
         self.update_sound_volume_by_distance(self.jump_sound, distance)
         if self.attack_sounds:
-            attack_sound = random.choice(self.attack_sounds)
+            attack_sound = self.rng.choice(self.attack_sounds)
             self.update_sound_volume_by_distance(attack_sound, distance)
             attack_sound.play()
             if self.manager:
@@ -534,7 +538,7 @@ class Spider:
         dx = player_x - (self.x + self.walk_frames[0].get_width() // 2)
 
         # 🎯 Випадкова висота дуги стрибка (щоб виглядало природніше)
-        dy = random.randint(-130, -110)
+        dy = self.rng.randint(-130, -110)
 
         # 🔒 Обмеження максимальної відстані стрибка (вліво або вправо)
         total_distance = max(-600, min(dx, 600))
@@ -548,7 +552,7 @@ class Spider:
         # 🔄 Орієнтація павука
         self.flipped = dx > 0
         self.jump_frames = (
-            [pygame.transform.flip(f, True, False) for f in self.jump_frames_original]
+            flip_frames(self.jump_frames_original)
             if self.flipped else self.jump_frames_original
         )
 
@@ -668,7 +672,7 @@ class Spider:
             self.flee_target_x = world_x + screen_width * 2
             self.walk_direction = 1
             self.flipped = True
-            self.walk_frames = [pygame.transform.flip(f, True, False) for f in self.walk_frames_original]
+            self.walk_frames = flip_frames(self.walk_frames_original)
 
         self.set_walking(True)
 
@@ -726,8 +730,8 @@ class Spider:
 
                     if self._death_twitch_timer >= self._death_twitch_delay:
                         self._death_twitch_timer = 0
-                        self._death_twitch_delay = random.randint(adjusted_delay, adjusted_delay + 500)
-                        self.current_frame = random.choice([
+                        self._death_twitch_delay = self.rng.randint(adjusted_delay, adjusted_delay + 500)
+                        self.current_frame = self.rng.choice([
                             len(frames) - 1,
                             len(frames) - 2,
                             len(frames) - 3
@@ -760,7 +764,8 @@ class Spider:
                 else:
                     self.current_frame = (self.current_frame + 1) % len(frames)
 
-    def draw(self, screen, world_x):
+    def draw(self, screen, world_x, alpha=1.0):
+        """alpha — частка тіку між попередньою і поточною позицією (інтерполяція, як у Player)."""
         frames = self.get_current_frames()
         if not frames:
             return
@@ -769,8 +774,9 @@ class Spider:
             self.current_frame = 0
 
         current_image = frames[self.current_frame]
-        screen_x = int(self.x - world_x)
-        screen_y = int(self.y - current_image.get_height())
+        previous_x, previous_y = self.previous_pos
+        screen_x = int(previous_x + (self.x - previous_x) * alpha - world_x)
+        screen_y = int(previous_y + (self.y - previous_y) * alpha - current_image.get_height())
 
         image_with_alpha = current_image.copy()
         image_with_alpha.set_alpha(self.fade_alpha)
@@ -859,7 +865,9 @@ class SpiderManager:
     - промальовка
     - скидання
     """
-    def __init__(self, screen_height, scale_y, audio_manager, scale_x):
+    def __init__(self, screen_height, scale_y, audio_manager, scale_x, assets=None, rng=None):
+        self.assets = assets
+        self.rng = rng  # Спільний для всіх павуків рівня random.Random з seed світу (None — глобальний random)
         self.spiders = []
         self.active_sounds = []
         self.screen_height = screen_height
@@ -868,6 +876,11 @@ class SpiderManager:
         self.audio_manager = audio_manager
 
     def spawn_initial_spiders(self):
+        for _ in self.spawn_steps():
+            pass
+
+    def spawn_steps(self):
+        """Спавн павуків по одному за крок (для покрокового завантаження рівня). Повертає частку виконаного."""
         x_positions = [
             #(2000, 0.6),
             #(2050, 0.65),
@@ -893,10 +906,13 @@ class SpiderManager:
                 audio_manager=self.audio_manager,
                 scale_x=self.scale_x,
                 scale_y=self.scale_y,
-                scale=scale
+                scale=scale,
+                assets=self.assets,
+                rng=self.rng
             )
             spider.manager = self
             self.spiders.append(spider)
+            yield len(self.spiders) / len(x_positions)
 
     def update(self, dt, hero_world_x, player_width, scale_y, scale_x, player):
         """
@@ -950,12 +966,17 @@ class SpiderManager:
             if self.player.hp < 0:
                 self.player.hp = 0
 
-    def draw(self, screen, world_x):
+    def save_previous_state(self):
+        """Запам'ятовує позиції павуків попереднього тіку для інтерполяції під час відмальовки."""
+        for spider in self.spiders:
+            spider.previous_pos = (spider.x, spider.y)
+
+    def draw(self, screen, world_x, alpha=1.0):
         """
         Малює всіх павуків на екрані у правильному порядку по Y (для глибини).
         """
         for spider in sorted(self.spiders, key=lambda s: s.y):
-            spider.draw(screen, world_x)
+            spider.draw(screen, world_x, alpha)
 
     def reset(self):
         """
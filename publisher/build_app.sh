@@ -3,6 +3,7 @@
 # 📌 Отримуємо абсолютний шлях до кореня проєкту
 SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
 PROJECT_ROOT="$(dirname "$SCRIPT_DIR")"
+PYTHON="$PROJECT_ROOT/.venv/bin/python"
 PYINSTALLER="$PROJECT_ROOT/.venv/bin/pyinstaller"
 ICON_PATH="$PROJECT_ROOT/assets/icon.icns"
 
@@ -10,6 +11,14 @@ echo "⚙️  Збірка White Castle.app через PyInstaller..."
 
 cd "$PROJECT_ROOT"
 
+# 📒 Маніфест ресурсів і запечені кадри (assets/manifest.json, assets/baked) не зберігаються в git —
+# їх генеруємо перед кожною збіркою, щоб вони потрапили в .app разом з assets (--bake пише і маніфест)
+echo "🍞 Маніфест ресурсів і запікання кадрів..."
+if ! "$PYTHON" main.py --bake; then
+  echo "❌ Помилка: не вдалося згенерувати маніфест або запекти кадри"
+  exit 1
+fi
+
 "$PYINSTALLER" \
   --name "White Castle" \
   --windowed \
@@ -22,6 +31,14 @@ cd "$PROJECT_ROOT"
   --add-data "scenes:scenes" \
   --add-data "utils:utils" \
   --add-data "main.py:." \
+  --hidden-import scenes.menu \
+  --hidden-import scenes.settings \
+  --hidden-import scenes.confirm_new_game \
+  --hidden-import scenes.confirm_out \
+  --hidden-import scenes.pause \
+  --hidden-import scenes.scene_1 \
+  --hidden-import scenes.hero_creator \
+  --hidden-import scenes.level_1 \
   main.py > /dev/null 2>&1
 
 if [[ ! -d "dist/White Castle.app" ]]; then
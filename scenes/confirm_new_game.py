@@ -1,10 +1,10 @@
 import pygame
 import json
 import logging
-from PIL import Image, ImageSequence
 
 from core.audio_manager import play_random_menu_sound, play_return_sound
-from utils.resource_loader import resource_path, save_progress
+from core.animated_background import AnimatedBackground
+from utils.resource_loader import resource_path, save_progress, new_world_seed
 
 
 SAVE_FILE = "progress.json"
@@ -24,48 +24,17 @@ class ConfirmNewGame:
         self.font = pygame.font.Font(resource_path("assets/menu_font.otf"), 50)
 
         # Анімація фону
-        self.bg_frames = []
-        self.frame_index = 0
-        self.reverse = False
-        self.frame_delay = 2
-        self.current_delay = 0
+        self.bg_animation = AnimatedBackground("assets/menu/menu_bg/ConfirmNewGame.gif")
 
     def start(self):
         self.screen = pygame.display.get_surface()
-        self.load_gif_frames("assets/menu/menu_bg/ConfirmNewGame.gif")
+        self.bg_animation.load(self.screen.get_size())  # Сцена з кешу вже має кадри фону
 
     def stop(self):
         pass
     def destroy(self):
         self.background = None
-
-    def load_gif_frames(self, gif_path):
-        try:
-            pil_image = Image.open(resource_path(gif_path))
-            self.bg_frames = []
-            for frame in ImageSequence.Iterator(pil_image):
-                frame = frame.convert("RGBA")
-                data = frame.tobytes()
-                size = frame.size
-                mode = frame.mode
-                surface = pygame.image.fromstring(data, size, mode).convert_alpha()
-                self.bg_frames.append(surface)
-        except Exception as e:
-            pass
-
-    def update_background_animation(self):
-        if self.current_delay < self.frame_delay:
-            self.current_delay += 1
-            return
-        self.current_delay = 0
-        if not self.reverse:
-            self.frame_index += 1
-            if self.frame_index >= len(self.bg_frames) - 1:
-                self.reverse = True
-        else:
-            self.frame_index -= 1
-            if self.frame_index <= 0:
-                self.reverse = False
+        self.bg_animation.clear()
 
     def handle_events(self, events):
         for event in events:
@@ -82,8 +51,9 @@ class ConfirmNewGame:
                     else:  # Так — почати нову гру
                         self.audio_manager.stop_music()
 
-                        # Скидаємо прогрес
+                        # Скидаємо прогрес; нова гра — новий світ
                         save_progress("scene_1")
+                        new_world_seed()
 
                         self.scene_manager.change_scene("scene_1")
 
@@ -92,14 +62,11 @@ class ConfirmNewGame:
                     self.scene_manager.change_scene("menu")
 
     def update(self):
-        self.update_background_animation()
+        self.bg_animation.update()
 
     def render(self, screen):
         screen_width, screen_height = screen.get_size()
-        if self.bg_frames:
-            bg = self.bg_frames[self.frame_index]
-            bg_scaled = pygame.transform.smoothscale(bg, screen.get_size())
-            screen.blit(bg_scaled, (0, 0))
+        self.bg_animation.draw(screen)
 
         # Текст попередження
         question_texts = [
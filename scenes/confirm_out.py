@@ -1,9 +1,9 @@
 import pygame
 import logging
-from PIL import Image, ImageSequence
 
 from utils.resource_loader import resource_path
 from core.audio_manager import play_random_menu_sound, play_return_sound
+from core.animated_background import AnimatedBackground
 
 logger = logging.getLogger("ConfirmOut")
 
@@ -21,19 +21,15 @@ class ConfirmOut:
         self.selected_option = 1
 
         # Анімація фону
-        self.bg_frames = []
-        self.frame_index = 0
-        self.reverse = False
-        self.frame_delay = 2
-        self.current_delay = 0
+        self.bg_animation = AnimatedBackground("assets/menu/menu_bg/out_img.gif")
 
         self.font = pygame.font.Font(resource_path("assets/menu_font.otf"), 46)
 
     def start(self):
         logger.info("[ConfirmOut] Сцена активна")
         self.screen = pygame.display.get_surface()
-        self.load_gif_frames(resource_path("assets/menu/menu_bg/out_img.gif"))
-        self.frame_index = 0
+        self.bg_animation.load(self.screen.get_size())  # Сцена з кешу вже має кадри фону
+        self.bg_animation.frame_index = 0
 
     def stop(self):
         logger.info("[ConfirmOut] Сцена зупинена")
@@ -41,19 +37,6 @@ class ConfirmOut:
     def destroy(self):
         logger.info("[ConfirmOut] Звільнення ресурсів")
 
-    def load_gif_frames(self, gif_path):
-        try:
-            pil_image = Image.open(gif_path)
-            self.bg_frames = []
-
-            for frame in ImageSequence.Iterator(pil_image):
-                frame = frame.convert("RGBA")
-                surface = pygame.image.fromstring(frame.tobytes(), frame.size, frame.mode).convert_alpha()
-                self.bg_frames.append(surface)
-
-        except Exception as e:
-            logger.error(f"[ConfirmOut] Помилка завантаження GIF: {e}")
-
     def handle_events(self, events):
         for event in events:
             if event.type == pygame.KEYDOWN:
@@ -78,35 +61,14 @@ class ConfirmOut:
         self.update_background_animation()
 
     def update_background_animation(self):
-        if self.current_delay < self.frame_delay:
-            self.current_delay += 1
-            return
-        self.current_delay = 0
-        if not self.reverse:
-            self.frame_index += 1
-            if self.frame_index >= len(self.bg_frames) - 1:
-                self.reverse = True
-        else:
-            self.frame_index -= 1
-            if self.frame_index <= 0:
-                self.reverse = False
-
-        progress = self.frame_index / (len(self.bg_frames) - 1)
-        self.frame_delay = int(5 * (1 - abs(2 * progress - 1))) + 1
-
-        if self.current_delay < self.frame_delay:
-            self.current_delay += 1
-            return
-
-        self.current_delay = 0
-        if self.frame_index < len(self.bg_frames) - 1:
-            self.frame_index += 1
+        # Ближче до середини анімації кадри змінюються повільніше
+        if self.bg_animation.update():
+            progress = self.bg_animation.progress()
+            self.bg_animation.frame_delay = int(5 * (1 - abs(2 * progress - 1))) + 1
+            self.bg_animation.current_delay = 1  # Цей тік уже зараховано в нову затримку
 
     def render(self, screen):
-        if self.bg_frames:
-            frame = self.bg_frames[self.frame_index]
-            scaled = pygame.transform.smoothscale(frame, screen.get_size())
-            screen.blit(scaled, (0, 0))
+        self.bg_animation.draw(screen)
 
         # Питання
         text_surface = self.font.render("Завершити пригоду?", True, (255, 255, 255))
@@ -4,7 +4,9 @@ import json
 from utils.resource_loader import resource_path
 from utils.resource_loader import save_progress
 from core.audio_manager import play_random_menu_sound, play_return_sound
-from PIL import Image, ImageSequence
+from utils.asset_manager import asset_manager
+from core.jobs import advance_steps
+from core.delta_frames import DeltaFrames
 import math
 import textwrap
 import logging
@@ -14,12 +16,12 @@ class HeroCreator:
     """
     Перший рівень гри. Містить логіку старту, збереження, оновлення та обробки подій.
     """
+    GIF_PATH = "assets/scene/hero_creator/dark_wood.gif"
+
     def __init__(self, scene_manager, audio_manager):
         self.name = "HeroCreator"
         self.scene_manager = scene_manager
         self.audio_manager = audio_manager
-        self.character_cache = {}  # Кеш готових зображень персонажів
-        self.filtered_character_cache = {}
         self.old_character_key = None
         self.character_key = None
         self.screen = None
@@ -30,7 +32,13 @@ class HeroCreator:
         pygame.mouse.set_visible(False)
 
         # Завантаження анімації GIF
-        self.gif_file = resource_path("assets/scene/hero_creator/dark_wood.gif")
+        self.gif_file = resource_path(self.GIF_PATH)
+        self.assets = scene_manager.take_preloaded(self.name)  # Кадри фону, декодовані у фоні (або порожній набір)
+        self.frames = []
+        self.started = False
+        self.loading = None           # Генератор кроків завантаження (див. load_steps)
+        self.loading_index = 0
+        self.loading_text = ""
         self.current_frame = 0
         self.animation_direction = 1  # 1 - вперед, -1 - назад
         self.animation_speed = 5  # Кількість оновлень перед зміною кадру
@@ -59,41 +67,57 @@ class HeroCreator:
         self.old_character_x = 0  # Початкова позиція старого персонажа
         self.animation_in_progress = False  # Чи відбувається анімація
 
-    def load_resources_with_progress(self):
-        """Поступово завантажує ресурси з візуальним прогресбаром."""
-        screen = pygame.display.get_surface()
+    LOADING_STEPS = ("Завантаження фону...", "Завантаження музики...", "Генерація початкового героя...")
+
+    def load_steps(self):
+        """
+        Кроки завантаження сцени. Фон (GIF) декодується у фоновому завданні JobSystem,
+        і стискається в DeltaFrames, а на головному потоці (load_gif_frames) лише конвертується робочий кадр.
+        Прогресбар малює render(), поки сцена не запущена.
+        """
+        self.loading_index, self.loading_text = 0, self.LOADING_STEPS[0]
+        job = self.scene_manager.jobs.submit(
+            self.decode_gif_frames, self.gif_file, self.screen.get_size(), owner=self.name,
+            on_done=self.load_gif_frames
+        )
+        while not job.finished:
+            yield
+
+        self.loading_index, self.loading_text = 1, self.LOADING_STEPS[1]
+        yield
+        self.audio_manager.play_music(self.audio_file)
+
+        self.loading_index, self.loading_text = 2, self.LOADING_STEPS[2]
+        yield
+        self.update_character_image()
+        self.started = True
+
+    def advance_loading(self, budget_ms):
+        if self.loading is None:
+            return False
+        if not advance_steps(self.loading, budget_ms, lambda: self.scene_manager.jobs.busy(self.name)):
+            self.loading = None
+        return self.loading is not None
+
+    def draw_loading_screen(self, screen):
+        """Екран завантаження з прогресбаром за кроками LOADING_STEPS."""
         screen_width, screen_height = screen.get_size()
-
-        loading_steps = [
-            ("Завантаження фону...",
-             lambda: setattr(self, "frames", self.load_gif_frames(self.gif_file, screen.get_size()))),
-            ("Завантаження музики...", lambda: self.audio_manager.play_music(self.audio_file)),
-            ("Генерація початкового героя...", self.update_character_image),
-        ]
-
-        total_steps = len(loading_steps)
         progress_height = 30
         font = pygame.font.Font(resource_path("assets/menu_font.otf"), 36)
 
-        for i, (text, action) in enumerate(loading_steps):
-            action()
-
-            # Очистка екрану
-            screen.fill((0, 0, 0))
+        # Очистка екрану
+        screen.fill((0, 0, 0))
 
-            # Відображення тексту
-            loading_text = font.render(text, True, (200, 200, 200))
-            screen.blit(loading_text, (screen_width // 2 - loading_text.get_width() // 2, screen_height // 2 - 60))
+        # Відображення тексту
+        loading_text = font.render(self.loading_text, True, (200, 200, 200))
+        screen.blit(loading_text, (screen_width // 2 - loading_text.get_width() // 2, screen_height // 2 - 60))
 
-            # Прогресбар
-            pygame.draw.rect(screen, (60, 60, 60),
-                             (screen_width // 4, screen_height // 2, screen_width // 2, progress_height))
-            pygame.draw.rect(screen, (180, 180, 255), (
-                screen_width // 4, screen_height // 2,
-                int((i + 1) / total_steps * screen_width // 2), progress_height))
-
-            pygame.display.flip()
-            pygame.time.delay(400)  # Затримка для видимості, можна прибрати
+        # Прогресбар
+        pygame.draw.rect(screen, (60, 60, 60),
+                         (screen_width // 4, screen_height // 2, screen_width // 2, progress_height))
+        pygame.draw.rect(screen, (180, 180, 255), (
+            screen_width // 4, screen_height // 2,
+            int((self.loading_index + 1) / len(self.LOADING_STEPS) * screen_width // 2), progress_height))
 
     def get_character_description(self):
         """Повертає художній опис вибраного персонажа."""
@@ -123,10 +147,12 @@ class HeroCreator:
         return desc
 
     def apply_night_filter(self, image, key):
-        """Застосовує ефект нічного освітлення з кешуванням."""
-        if key in self.filtered_character_cache:
-            return self.filtered_character_cache[key]
+        """Застосовує ефект нічного освітлення з кешуванням (ключ — (шлях, висота екрана) персонажа)."""
+        if key is None:
+            return self.build_night_filter(image)
+        return asset_manager.get(key + ("night",), lambda: self.build_night_filter(image))
 
+    def build_night_filter(self, image):
         filtered_image = pygame.Surface(image.get_size(), pygame.SRCALPHA)
         for x in range(image.get_width()):
             for y in range(image.get_height()):
@@ -138,7 +164,6 @@ class HeroCreator:
                     b = int(b * 0.6)
                     filtered_image.set_at((x, y), (r, g, b, int(a * 0.95)))
 
-        self.filtered_character_cache[key] = filtered_image
         return filtered_image
 
     def update_character_image(self):
@@ -151,35 +176,32 @@ class HeroCreator:
         selected_gender = self.options["Стать"][self.current_selection["Стать"]]
         selected_appearance = self.options["Зовнішність"][self.current_selection["Зовнішність"]]
 
-        key = (selected_race, selected_gender, selected_appearance)
+        image_path = resource_path(
+            f"assets/characters/{race_map[selected_race]}/{gender_map[selected_gender]}/{appearance_map[selected_appearance]}"
+        )
+        screen_height = self.screen.get_height()
+        key = (image_path, screen_height)  # Масштаб залежить лише від файлу (раса, стать) і висоти екрана
         self.old_character_key = self.character_key  # Зберігаємо попередній ключ
         self.character_key = key  # Зберігаємо новий ключ
 
-        if key in self.character_cache:
-            new_character_image = self.character_cache[key]
-        else:
-            image_path = resource_path(
-                f"assets/characters/{race_map[selected_race]}/{gender_map[selected_gender]}/{appearance_map[selected_appearance]}"
-            )
-            try:
-                image = pygame.image.load(image_path).convert_alpha()
-                screen_width, screen_height = self.screen.get_size()
-                new_height = screen_height // 1.8
-                scale_factor = new_height / image.get_height()
-
-                if selected_gender == "Жіноча":
-                    scale_factor *= 0.9
-                if selected_race == "Гном":
-                    scale_factor *= 0.9
-
-                new_width = int(image.get_width() * scale_factor)
-                new_height = int(image.get_height() * scale_factor)
-                image = pygame.transform.scale(image, (new_width, new_height))
-
-                self.character_cache[key] = image  # Зберігаємо в кеш
-                new_character_image = image
-            except pygame.error:
-                return
+        def build():
+            image = pygame.image.load(image_path).convert_alpha()
+            new_height = screen_height // 1.8
+            scale_factor = new_height / image.get_height()
+
+            if selected_gender == "Жіноча":
+                scale_factor *= 0.9
+            if selected_race == "Гном":
+                scale_factor *= 0.9
+
+            new_width = int(image.get_width() * scale_factor)
+            new_height = int(image.get_height() * scale_factor)
+            return pygame.transform.scale(image, (new_width, new_height))
+
+        try:
+            new_character_image = asset_manager.get(key + ("character",), build)
+        except pygame.error:
+            return
 
         # Анімація як і раніше
         screen_width = self.screen.get_width()
@@ -196,19 +218,26 @@ class HeroCreator:
     def save(self):
         save_progress("HeroCreator")
 
-    def load_gif_frames(self, gif_path, screen_size):
-        """Завантажує та масштабує кадри GIF під розмір екрану."""
-        gif = Image.open(gif_path)
-        frames = []
-        for frame in ImageSequence.Iterator(gif):
-            frame = frame.convert("RGBA")  # Конвертація для коректного кольору
-            frame = frame.resize(screen_size, Image.Resampling.LANCZOS)  # Масштабування під екран
-
-            # Конвертація у pygame Surface
-            frame_surface = pygame.image.fromstring(frame.tobytes(), frame.size, frame.mode).convert()
-            frame_surface.set_colorkey((0, 0, 0))  # Встановлюємо чорний як прозорий, щоб уникнути білого мерехтіння
-            frames.append(frame_surface)
-        return frames
+    def decode_gif_frames(self, gif_path, screen_size):
+        """Фонова частина (робочий потік): кадри GIF, масштабовані під розмір екрану і стиснуті в DeltaFrames."""
+        # Декодування й масштабування (RGBA, LANCZOS) зазвичай уже зроблено під час передзавантаження
+        return DeltaFrames([
+            pygame.image.fromstring(data, size, mode)
+            for data, size, mode in self.assets.gif_frames(gif_path, size=screen_size)
+        ])
+
+    def load_gif_frames(self, decoded):
+        """Завершення на головному потоці: convert робочого кадру фону."""
+        # Конвертація у формат екрана
+        decoded.surface = decoded.surface.convert()
+        decoded.surface.set_colorkey((0, 0, 0))  # Встановлюємо чорний як прозорий, щоб уникнути білого мерехтіння
+        self.frames = decoded
+        self.assets.clear()
+
+    @staticmethod
+    def preload_assets(bundle, screen_size):
+        """Фонове передзавантаження: декодує та масштабує кадри фонового GIF під розмір екрану."""
+        bundle.add_gif(resource_path(HeroCreator.GIF_PATH), size=tuple(screen_size))
 
     def save_hero(self):
         from utils.resource_loader import get_save_path
@@ -265,7 +294,9 @@ class HeroCreator:
         pygame.mixer.music.stop()
         pygame.mixer.stop()
         save_progress("HeroCreator")
-        self.load_resources_with_progress()
+        self.started = False
+        self.loading = self.load_steps()
+        self.scene_manager.preload("level_1")  # Поки гравець створює героя, у фоні готуємо рівень
 
     def stop(self):
         """Зупиняє рівень 1."""
@@ -276,11 +307,8 @@ class HeroCreator:
         pygame.mixer.music.stop()
         pygame.mixer.stop()
 
-        if hasattr(self, "frames"):
-            del self.frames
+        self.frames = []
 
-        self.character_cache.clear()
-        self.filtered_character_cache.clear()
         self.character_image = None
         self.old_character_image = None
         self.screen = None
@@ -299,6 +327,9 @@ class HeroCreator:
 
     def handle_events(self, events):
         """Обробляє події користувача, перемикання параметрів героя."""
+        if not self.started:
+            return
+
         for event in events:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
@@ -332,6 +363,9 @@ class HeroCreator:
 
     def update(self):
         """Оновлення стану рівня, анімації зміни персонажа."""
+        if not self.started:
+            return
+
         self.animation_counter += 1
         if self.animation_counter >= self.animation_speed:
             self.animation_counter = 0
@@ -367,7 +401,12 @@ class HeroCreator:
 
     def render(self, screen):
         """Відображає рівень на екрані, малюючи фон, текст та кнопку переходу."""
-        screen.blit(self.frames[self.current_frame], (0, 0))  # Відображення анімованого фону
+        if not self.started:
+            self.draw_loading_screen(screen)
+            return
+
+        if self.frames:
+            screen.blit(self.frames.frame(self.current_frame), (0, 0))  # Відображення анімованого фону
         font = pygame.font.Font(resource_path("assets/menu_font.otf"), 50)
 
         # Заголовок
@@ -394,13 +433,13 @@ class HeroCreator:
             return filtered_image
 
         if self.old_character_image:
-            key_old = ("filtered",) + self.old_character_key if self.old_character_key else None
+            key_old = self.old_character_key
             old_char_copy = self.apply_night_filter(self.old_character_image.copy(), key_old)
             old_char_copy.set_alpha(self.old_character_alpha)
             screen.blit(old_char_copy, (self.old_character_x - 50, base_y - old_char_copy.get_height()))
 
         if self.character_image:
-            key_new = ("filtered",) + self.character_key if self.character_key else None
+            key_new = self.character_key
             char_copy = self.apply_night_filter(self.character_image.copy(), key_new)
             char_copy.set_alpha(self.character_alpha)
             screen.blit(char_copy, (self.character_x - 50, base_y - char_copy.get_height()))
@@ -1,19 +1,34 @@
 import pygame
 import os
+import time
+import hashlib
+import inspect
 import random
-from PIL import Image, ImageEnhance, ImageFilter
+from PIL import Image
 import logging
 
 from utils.resource_loader import resource_path, save_progress
 from objects.player_level1 import Player
 from objects.crow import CrowManager
-from objects.spider import SpiderManager
+from objects.spider import SpiderManager, Spider
 from objects.home_tree import HomeTree
 from objects.dialog_box import DialogBox
-from utils.resource_loader import load_hero_stats
+from utils.resource_loader import load_hero_stats, load_world_seed
+from core.preloader import list_files
+from core.jobs import advance_steps
+from core.baked import baked
+from core.layer_cache import LayerCache
+from core.tiled_layer import TiledLayer, create_layer, read_header
+from core import layer_generation
 
 
 class Level1:
+    # Списки позицій паралакс-шарів (інтерполюються під час відмальовки; земля малюється за bg_trees_positions)
+    LAYER_POSITION_ATTRS = ("bg_trees_positions", "bg_trees2_positions", "fog_positions", "fog2_positions")
+    SKY_PATH = "assets/level_1/bg/sky.png"
+    GENERATION_AHEAD = 3  # На скільки екранів попереду камери генеруються плитки шарів
+    WOLF_SOUNDS_FOLDER = "assets/level_1/wolf"
+
     def __init__(self, scene_manager, audio_manager):
 
         # === Основні менеджери та екран ===
@@ -22,7 +37,13 @@ class Level1:
         self.audio_manager = audio_manager
         self.screen = pygame.display.get_surface()
         self.started = False
+        self.stopped = False          # stop() уже звільнив рівень (SceneManager.reset зупиняє сцену перед destroy)
         self.current_progress = 0.0
+        self.loading = None           # Генератор кроків завантаження (див. load_steps)
+        self.loading_text = ""
+        self.loading_font = None
+        self.loading_subfont = None
+        self.assets = scene_manager.take_preloaded(self.name)  # Ресурси, декодовані у фоні (або порожній набір)
         self.dialog_box = DialogBox(self.screen, "assets/menu_font.otf")
 
         # === Масштаб екрана ===
@@ -48,50 +69,69 @@ class Level1:
         self.min_distance = 200
         self.max_distance = 450
 
+        # Згенеровані шари зберігаються в кеші користувача за ключем з параметрів, seed і вихідних файлів
+        self.layer_cache = LayerCache()
+        # Запис сесії приносить свій seed світу — відтворення генерує той самий рівень на будь-якій машині
+        self.world_seed = getattr(scene_manager.input_source, "world_seed", None)
+        # Шари світу сесії (відтворення, бенчмарк) не витісняють з кешу шари світу гравця
+        self.own_world = self.world_seed is None
+        if self.own_world:
+            self.world_seed = load_world_seed()
+        self.layer_files = {}  # {"bg_trees": папка шару в кеші, ...} — заповнює prepare_steps
+        self.layer_recipes = {}  # {"bg_trees": рецепт плиток шару, ...}
+
         # === Дерево лісовика ===
         self.home_tree = HomeTree(
             position_x=8000,
             scale_x=self.scale_x,
             scale_y=self.scale_y,
-            screen_height=self.screen.get_height()
+            screen_height=self.screen.get_height(),
+            assets=self.assets
         )
 
         # === Герой ===
-        hero_data = load_hero_stats()
-        self.player = Player(self.screen, self.scale_x, self.scale_y, hero_data)
+        # Бенчмарк і запис сесії приносять свого героя — інакше він береться зі збереження гравця
+        hero_data = getattr(scene_manager.input_source, "hero_data", None)
+        if hero_data is None:
+            hero_data = load_hero_stats()
+        self.player = Player(
+            self.screen, self.scale_x, self.scale_y, hero_data, scene_manager.input_source, self.assets
+        )
 
         # === Музика рівня ===
         self.audio_file = resource_path("assets/scene/hero_creator/dark_wood.mp3")
         self.music_paused = False
 
         # === Ворони ===
-        self.crows = []
-        self.next_crow_x = 2000
-        self.crow_spacing = random.randint(2500, 4000)
-        self.crow_manager = CrowManager(audio_manager, self.screen, self.scale_x, self.scale_y)
+        self.crow_manager = CrowManager(
+            audio_manager, self.screen, self.scale_x, self.scale_y, self.assets, rng=self.world_random("crows")
+        )
 
         # === Павуки ===
-        self.spider_manager = SpiderManager(self.screen.get_height(), self.scale_y, audio_manager, self.scale_x)
+        self.spider_manager = SpiderManager(
+            self.screen.get_height(), self.scale_y, audio_manager, self.scale_x, self.assets,
+            rng=self.world_random("spiders")
+        )
         self.spider_manager.player = self.player
 
         # === Дерево чарівника ===
         self.tree_dialog_shown = False
 
         # === Звуки вовків ===
+        self.howl_rng = self.world_random("howls")
         self.howl_checkpoints = [
-            random.randint(6000, 6000),
-            random.randint(8500, 8500),
+            self.howl_rng.randint(6000, 6000),
+            self.howl_rng.randint(8500, 8500),
         ]
         self.howl_played_flags = [False] * len(self.howl_checkpoints)
-        wolf_sounds_folder = resource_path("assets/level_1/wolf")
+        wolf_sounds_folder = resource_path(self.WOLF_SOUNDS_FOLDER)
         self.howl_sounds = []
-        for f in os.listdir(wolf_sounds_folder):
-            if f.endswith((".wav", ".ogg", ".mp3")):
-                sound = pygame.mixer.Sound(os.path.join(wolf_sounds_folder, f))
-                sound.set_volume(self.audio_manager.sound_volume)
-                self.howl_sounds.append(sound)
+        for path in list_files(wolf_sounds_folder, (".wav", ".ogg", ".mp3")):
+            sound = self.assets.sound(path)
+            sound.set_volume(self.audio_manager.sound_volume)
+            self.howl_sounds.append(sound)
 
-        # === Фонові текстури (будуть завантажуватись пізніше) ===
+        # === Фонові шари, TiledLayer (будуть завантажуватись пізніше) ===
         self.bg_trees_texture = None
         self.bg_trees2_texture = None
         self.fog_texture = None
@@ -113,40 +153,69 @@ class Level1:
         self.ground_positions = []
 
         # === Небо ===
-        original_sky = pygame.image.load(resource_path("assets/level_1/bg/sky.png")).convert()
-        sky_width = self.screen.get_width()
-        sky_height = int(original_sky.get_height() * self.scale_y)
-        self.sky_image = pygame.transform.scale(original_sky, (sky_width, sky_height))
+        sky_path = resource_path(self.SKY_PATH)
+        self.sky_image = baked.load(
+            sky_path, (self.screen.get_width(), self.scale_y), lambda: self.build_sky(sky_path), alpha=False
+        )
 
         # === Туман (змінна швидкість) ===
         self.fogs_on_layer = 80
         self.fog_scroll_base = 0.2
         self.fog_scroll_min = 0.1
         self.fog_scroll_max = 0.4
-        self.fog_scroll_target = random.uniform(self.fog_scroll_min, self.fog_scroll_max)
+        self.fog_rng = self.world_random("fog_drift")
+        self.fog_scroll_target = self.fog_rng.uniform(self.fog_scroll_min, self.fog_scroll_max)
         self.fog_scroll_change_speed = 0.0005
 
+        # === Стан попереднього тіку (для інтерполяції) ===
+        self.previous_positions = {}
+        self.previous_world_x = 0
+        self.previous_player_pos = self.player.rect.topleft
+
     def start(self):
         # === Перевірка повторного запуску ===
-        save_progress(self.name)
+        # Сесія за сценарієм (бенчмарк, запікання) не гра гравця — його збереження не змінюється
+        if getattr(self.scene_manager.input_source, "saves_progress", True):
+            save_progress(self.name)
 
         # === Оновлення surface (на випадок зміни екрану) ===
         self.screen = pygame.display.get_surface()
 
-        # === Кроки підготовки сцени (етапи завантаження) ===
-        steps = [
-            ("Генеруємо дерева...", 0.3, lambda: self.create_bg(self.level_long, self.trees_on_layer)),
-            ("Генеруємо туман...", 0.4, lambda: self.create_fog(self.level_long, self.fogs_on_layer)),
-            ("Генеруємо землю...", 0.5, lambda: self.create_ground(self.level_long)),
-            ("Завантажуємо шари...", 0.6, self.load_background_layers),
-            ("Завантажуємо ворон...", 0.7, self.crow_manager.load_animations),
-            ("Завантажуємо павуків...", 0.9 , self.spider_manager.spawn_initial_spiders)
+        # === Завантаження йде покроково: SceneManager.advance_loading() щокадру виконує частину роботи ===
+        self.started = False
+        self.stopped = False
+        self.current_progress = 0.0
+        self.loading_text = ""
+        self.loading = self.load_steps()
+
+    def load_steps(self):
+        """
+        Етапи підготовки рівня як генератор невеликих кроків.
+        Етап-генератор повертає частку виконаної роботи (0..1), звичайний етап виконується за один крок.
+        Прогрес зважується за вагою етапів, тож прогресбар показує реально виконану роботу.
+        """
+        stages = [
+            ("Плануємо ліс, туман і землю...", 2, self.prepare_steps),
+            ("Генеруємо шари...", 3, self.load_background_layers),
+            ("Завантажуємо ворон...", 1, self.crow_manager.load_animations),
+            ("Завантажуємо павуків...", 1, self.spider_manager.spawn_steps),
         ]
+        total_weight = sum(weight for _, weight, _ in stages)
+        done_weight = 0
+
+        for text, weight, action in stages:
+            self.loading_text = text
+            yield  # Спершу показуємо назву етапу
 
-        # === Відображення екрану завантаження поетапно ===
-        for text, progress, action in steps:
-            self.show_loading_screen(text, progress)
-            action()
+            result = action()
+            if inspect.isgenerator(result):
+                for fraction in result:
+                    self.current_progress = (done_weight + weight * fraction) / total_weight
+                    yield
+
+            done_weight += weight
+            self.current_progress = done_weight / total_weight
+            yield
 
         # === Початкове положення героя ===
         self.player.reset()
@@ -157,328 +226,247 @@ class Level1:
         self.started = True
         self.current_progress = 1.0
 
-        self.spider_manager.spawn_initial_spiders()
-
-    def show_loading_screen(self, stage_text, target_progress):
-        """Відображає екран завантаження з анімованим прогресбаром у стилі HeroCreator."""
-        screen_width, screen_height = self.screen.get_size()
-        font = pygame.font.Font(resource_path("assets/menu_font.otf"), 36)
-        subfont = pygame.font.Font(resource_path("assets/menu_font.otf"), 24)
+        # === Передзавантажені ресурси більше не потрібні ===
+        self.assets.clear()
+
+    def advance_loading(self, budget_ms):
+        """Виконує кроки завантаження, поки не вичерпано бюджет кадру. Повертає True, поки рівень вантажиться."""
+        if self.loading is None:
+            return False
+
+        if not advance_steps(self.loading, budget_ms, lambda: self.scene_manager.jobs.busy(self.name)):
+            self.loading = None
+        return self.loading is not None
+
+    @staticmethod
+    def preload_assets(bundle, screen_size):
+        """
+        Фонове передзавантаження: декодує кадри ворон і павуків, небо, дерево та звуки.
+        Викликається у робочому потоці, тому без convert() і без звернень до дисплея.
+        Кадрів героя тут немає: HeroCreator запускає передзавантаження ще до того, як героя обрано і збережено,
+        тож Player вантажить їх сам під час створення рівня.
+        """
+        for folder in CrowManager.ANIMATION_FOLDERS:
+            bundle.add_images(resource_path(folder))
+        for animation_name in Spider.ANIMATION_NAMES:
+            bundle.add_images(resource_path(os.path.join("assets", "level_1", "spider", animation_name)))
+
+        bundle.add_image(resource_path(Level1.SKY_PATH))
+        bundle.add_image(resource_path(HomeTree.IMAGE_PATH))
+
+        sound_extensions = (".wav", ".ogg", ".mp3")
+        for path in Spider.SOUND_PATHS:
+            bundle.add_sound(resource_path(path))
+        for path in list_files(resource_path(Spider.ATTACK_SOUND_FOLDER), sound_extensions):
+            bundle.add_sound(path)
+        for path in list_files(resource_path(Level1.WOLF_SOUNDS_FOLDER), sound_extensions):
+            bundle.add_sound(path)
+
+    def draw_loading_screen(self, screen):
+        """Відображає екран завантаження з прогресбаром у стилі HeroCreator."""
+        screen_width, screen_height = screen.get_size()
+        if self.loading_font is None:
+            self.loading_font = pygame.font.Font(resource_path("assets/menu_font.otf"), 36)
+            self.loading_subfont = pygame.font.Font(resource_path("assets/menu_font.otf"), 24)
 
         bar_width = screen_width // 2
         bar_height = 30
         bar_x = screen_width // 2 - bar_width // 2
         bar_y = screen_height // 2 + 20
 
-        duration_ms = 400
-        start_time = pygame.time.get_ticks()
-        start_progress = self.current_progress
-
-        while self.current_progress < target_progress:
-            now = pygame.time.get_ticks()
-            t = min((now - start_time) / duration_ms, 1.0)
-            self.current_progress = start_progress + (target_progress - start_progress) * t
-
-            # === Темне тло з легким шумом чи градієнтом (опційно) ===
-            self.screen.fill((0, 0, 0))
-
-            # === Заголовок і підпис ===
-            title_surface = font.render("Завантаження...", True, (220, 220, 220))
-            self.screen.blit(title_surface, (
-                screen_width // 2 - title_surface.get_width() // 2,
-                bar_y - 80
-            ))
-
-            subtitle_surface = subfont.render(stage_text, True, (180, 180, 180))
-            self.screen.blit(subtitle_surface, (
-                screen_width // 2 - subtitle_surface.get_width() // 2,
-                bar_y - 40
-            ))
-
-            # === Рамка прогресбару ===
-            pygame.draw.rect(self.screen, (60, 60, 60), (bar_x, bar_y, bar_width, bar_height), border_radius=8)
-
-            # === Заповнена частина ===
-            pygame.draw.rect(
-                self.screen,
-                (180, 180, 255),
-                (bar_x, bar_y, int(bar_width * self.current_progress), bar_height),
-                border_radius=8
-            )
+        # === Темне тло з легким шумом чи градієнтом (опційно) ===
+        screen.fill((0, 0, 0))
+
+        # === Заголовок і підпис ===
+        title_surface = self.loading_font.render("Завантаження...", True, (220, 220, 220))
+        screen.blit(title_surface, (
+            screen_width // 2 - title_surface.get_width() // 2,
+            bar_y - 80
+        ))
+
+        subtitle_surface = self.loading_subfont.render(self.loading_text, True, (180, 180, 180))
+        screen.blit(subtitle_surface, (
+            screen_width // 2 - subtitle_surface.get_width() // 2,
+            bar_y - 40
+        ))
+
+        # === Рамка прогресбару ===
+        pygame.draw.rect(screen, (60, 60, 60), (bar_x, bar_y, bar_width, bar_height), border_radius=8)
+
+        # === Заповнена частина ===
+        pygame.draw.rect(
+            screen,
+            (180, 180, 255),
+            (bar_x, bar_y, int(bar_width * self.current_progress), bar_height),
+            border_radius=8
+        )
 
-            # === Оновлення екрану ===
-            pygame.display.flip()
-            pygame.time.delay(16)
+    def build_sky(self, sky_path):
+        original_sky = self.assets.image(sky_path).convert()
+        sky_width = self.screen.get_width()
+        sky_height = int(original_sky.get_height() * self.scale_y)
+        return pygame.transform.scale(original_sky, (sky_width, sky_height))
 
-    def load_background_layers(self):
+    def world_random(self, stream):
+        """
+        Генератор випадкових чисел частини рівня (ліс, туман, ворони, павуки...), залежний лише від seed світу.
+        Окремий потік для кожної частини: зміна однієї (наприклад, кількості дерев) не зсуває інші.
+        """
+        return random.Random(f"{self.world_seed}:{stream}")
 
-        # === Внутрішня функція: завантаження, масштабування і розміщення текстур ===
-        def load_and_assign(path, attr, pos_attr):
+    def load_background_layers(self):
+        """
+        Відкриває шари як TiledLayer: у пам'ять потрапляють лише плитки біля камери.
+        Плитки, видимі на старті, генеруються (якщо їх ще немає в кеші) і декодуються у фонових завданнях;
+        рівень стартує, щойно готовий перший екран, — решту плиток stream_layers генерує вже під час гри.
+        """
+        screen_width = self.screen.get_width()
+        layer_offset_x = int(screen_width * 0.2930)  # Той самий зсув, що й у render()
+        layers = [
+            ("bg_trees", "bg_trees_texture", "bg_trees_positions", -layer_offset_x),
+            ("bg_trees2", "bg_trees2_texture", "bg_trees2_positions", -layer_offset_x),
+            ("fog", "fog_texture", "fog_positions", -layer_offset_x),
+            ("fog2", "fog2_texture", "fog2_positions", -layer_offset_x),
+            ("ground", "ground_texture", "ground_positions", -300),
+        ]
+        loaded = []
+        for i, (name, attr, pos_attr, start_x) in enumerate(layers):
             try:
-                # Завантаження зображення з прозорістю
-                texture = pygame.image.load(path).convert_alpha()
-
-                # Масштабування з урахуванням масштабу екрана
-                scaled_texture = pygame.transform.scale(
-                    texture,
-                    (int(texture.get_width() * self.scale_x), int(texture.get_height() * self.scale_y))
+                layer = TiledLayer(
+                    self.layer_files.get(name, ""), (self.scale_x, self.scale_y),
+                    self.scene_manager.jobs, self.name, lookahead=screen_width, recipe=self.layer_recipes.get(name)
                 )
-
-                # Зберігаємо текстуру
-                setattr(self, attr, scaled_texture)
-
-                # Зберігаємо ширину текстури (наприклад, bg_trees_width)
-                setattr(self, attr.replace("texture", "width"), scaled_texture.get_width())
-
-                # Генеруємо початкові позиції для шарів (повторюються 3 рази для паралаксу)
-                setattr(self, pos_attr, [i * scaled_texture.get_width() for i in range(3)])
-
             except Exception as e:
-                pass
-
-        # === Завантаження всіх необхідних фонових шарів ===
-        load_and_assign(resource_path("assets/level_1/bg_create/bg_trees.png"), "bg_trees_texture",
-                        "bg_trees_positions")
-        load_and_assign(resource_path("assets/level_1/bg_create/bg_trees2.png"), "bg_trees2_texture",
-                        "bg_trees2_positions")
-        load_and_assign(resource_path("assets/level_1/bg_create/fog.png"), "fog_texture", "fog_positions")
-        load_and_assign(resource_path("assets/level_1/bg_create/fog2.png"), "fog2_texture", "fog2_positions")
-        load_and_assign(resource_path("assets/level_1/bg_create/ground.png"), "ground_texture", "ground_positions")
-
-    def load_crow_animations(self):
-
-        # === Внутрішня функція: завантаження і масштабування кадрів з папки ===
-        def load_animation(folder_path):
-            frames = []
-            try:
-                for filename in sorted(os.listdir(folder_path)):
-                    if filename.endswith(".png"):
-                        frame = pygame.image.load(os.path.join(folder_path, filename)).convert_alpha()
-
-                        # Масштабування кадру відповідно до розміру екрана
-                        scaled_frame = pygame.transform.scale(
-                            frame,
-                            (int(frame.get_width() * self.scale_x), int(frame.get_height() * self.scale_y))
-                        )
-
-                        frames.append(scaled_frame)
+                yield (i + 1) / len(layers)
+                continue
+
+            # Зберігаємо шар, його ширину (наприклад, bg_trees_width)
+            # і початкові позиції (повторюються 3 рази для паралаксу)
+            setattr(self, attr, layer)
+            setattr(self, attr.replace("texture", "width"), layer.width)
+            setattr(self, pos_attr, [j * layer.width for j in range(3)])
+
+            layer.prefetch([start_x], screen_width, 0)  # Лише перший екран — решта генерується під час гри
+            loaded.append(layer)
+            yield 0.2 * (i + 1) / len(layers)
+
+        while not all(layer.ready() for layer in loaded):
+            yield 1 - 0.8 * sum(not layer.ready() for layer in loaded) / len(layers)
+
+    def prepare_steps(self):
+        """
+        Рецепти шарів (core.layer_generation) і папки шарів у кеші — без генерації самих пікселів.
+        Плитки генеруються в пулі процесів, коли до них наближається камера (stream_layers), тож час до старту
+        не залежить від довжини рівня. Тут лише розміщення (послідовне, але дешеве — потрібні самі розміри)
+        і середня яскравість шарів з контрастом — вона одна для всіх плиток, тож міряється заздалегідь
+        (у пулі процесів) і зберігається в заголовку шару.
+        """
+        jobs = self.scene_manager.jobs
+        long = self.level_long
+        progress = {"done": 0, "total": 5}  # Земля, два шари туману і два шари лісу
+        self.layer_recipes = {}
+
+        def prepare(name, key, recipe, then=None):
+            # Готовий шар бере середню з заголовка; новий — міряє її, створює папку і прибирає старі варіанти
+            path = self.layer_cache.path(name, key)
+            self.layer_files[name] = path
+            self.layer_recipes[name] = recipe
+
+            def created(mean):
+                if mean is not None:
+                    recipe.set_contrast_mean(mean)
+                if not os.path.exists(path):
+                    create_layer(path, (recipe.width, recipe.height), {"contrast": mean})
+                    if self.own_world:
+                        self.layer_cache.prune(path)
+                progress["done"] += 1
+                if then is not None:
+                    then()
 
+            try:
+                header = read_header(path)
             except Exception as e:
-                pass
-            return frames
-
-        # === Завантаження основних анімацій ворони ===
-        self.crows_idle_frames = load_animation(resource_path("assets/level_1/crow/idle"))
-        self.crows_fly_frames = load_animation(resource_path("assets/level_1/crow/fly"))
-
-        # === Завантаження анімації ходьби ворони ===
-        self.crows_walk_frames = load_animation(resource_path("assets/level_1/crow/walk"))
-
-    def create_ground(self, long):
-
-        # === Перевірка, чи зображення землі вже існує ===
-        output_path = resource_path("assets/level_1/bg_create/ground.png")
-        if os.path.exists(output_path):
-            ground_img = Image.open(output_path)
-            _, self.ground_height = ground_img.size  # Отримуємо лише висоту
-            return
-
-        # === Вихідна текстура землі для повторного заповнення ===
-        input_path = resource_path("assets/level_1/bg/ground.png")
-
-        try:
-            # Завантаження початкового тайла землі
-            ground_img = Image.open(input_path)
-            ground_width, self.ground_height = ground_img.size
-
-            # Створення нового зображення з повтором землі на всю довжину рівня
-            new_image = Image.new("RGBA", (long, self.ground_height), (0, 0, 0, 0))
-
-            # === Прокладка землі тайлами з чергуванням фліпу ===
-            x_offset = 0
-            flip = False
-            tile_count = 0
-
-            while x_offset < long:
-                tile = ground_img.transpose(Image.FLIP_LEFT_RIGHT) if flip else ground_img
-                tile_width = min(ground_width, long - x_offset)
-                new_image.paste(tile.crop((0, 0, tile_width, self.ground_height)), (x_offset, 0))
-                x_offset += tile_width
-                flip = not flip
-                tile_count += 1
-
-            # === Збереження фінального зображення землі ===
-            new_image.save(output_path)
-
-        except Exception as e:
-            pass
-
-    def create_fog(self, long, fog):
-
-        # === Шляхи до папки з текстурами та вихідних файлів ===
-        fog_folder = resource_path("assets/level_1/fog")
-        output_files = [
-            resource_path("assets/level_1/bg_create/fog.png"),
-            resource_path("assets/level_1/bg_create/fog2.png")
-        ]
-
-        # === Якщо обидва шари туману вже згенеровані — пропускаємо ===
-        if all(os.path.exists(f) for f in output_files):
-            return
-
-        try:
-            # === Завантаження всіх PNG-файлів туману з папки ===
-            fog_images = [Image.open(os.path.join(fog_folder, f))
-                          for f in os.listdir(fog_folder) if f.endswith(".png")]
-
-            # === Максимальна висота шару туману (з запасом для нижньої межі) ===
-            max_height = max(img.height for img in fog_images) + 200
-            fog_image_1 = Image.new("RGBA", (long, max_height), (0, 0, 0, 0))
-
-            # === Генерація першого шару туману ===
-            for i in range(fog):
-                fog = random.choice(fog_images)
-
-                # Позиціонування туману на випадкову X-координату
-                x = random.randint(0, long - fog.width)
-                y = max_height - fog.height
-                fog_image_1.paste(fog, (x, y), fog)
-
-                # Півпрозорий дубль для подальшого використання
-                fog = fog.copy()
-                alpha = fog.split()[3]
-                alpha = ImageEnhance.Brightness(alpha).enhance(0.5)
-                fog.putalpha(alpha)
-
-            fog_image_1.save(output_files[0])
-
-            # === Генерація другого шару туману (дзеркальний і стилізований) ===
-            fog_image_2 = fog_image_1.transpose(Image.FLIP_LEFT_RIGHT)
-            fog_image_2 = ImageEnhance.Brightness(fog_image_2).enhance(0.7)
-            fog_image_2 = ImageEnhance.Contrast(fog_image_2).enhance(0.7)
-            fog_image_2 = fog_image_2.filter(ImageFilter.GaussianBlur(2))
-
-            fog_image_2.save(output_files[1])
-
-        except Exception as e:
-            pass
-
-    def create_bg(self, long, trees):
-
-        # === Шляхи до ресурсів ===
-        tree_folder = resource_path("assets/level_1/trees")
-        web_folder = resource_path("assets/level_1/spider_web")
-        output_files = [
-            resource_path("assets/level_1/bg_create/bg_trees.png"),
-            resource_path("assets/level_1/bg_create/bg_trees2.png")
-        ]
+                header = None
+            if header is not None:
+                created(header["params"].get("contrast"))
+            elif not any(effect[0] == "contrast" for effect in recipe.effects):
+                created(None)
+            else:
+                jobs.submit_process(layer_generation.measure_contrast, recipe, owner=self.name, on_done=created)
+
+        # === Земля ===
+        ground_path = resource_path("assets/level_1/bg/ground.png")
+        ground_size = Image.open(ground_path).size
+        key = self.layer_cache.key({"layer": "ground", "long": long}, None, [ground_path])
+        prepare("ground", key, layer_generation.GroundRecipe(ground_path, ground_size, long))
+        self.ground_height = ground_size[1]
+
+        # === Туман: перший шар — випадкові текстури, другий — дзеркальний і стилізований ===
+        fog_files = list_files(resource_path("assets/level_1/fog"), (".png",))
+        params = {"layer": "fog", "long": long, "fog": self.fogs_on_layer}
+        key = self.layer_cache.key(params, self.world_seed, fog_files)
+        height, placements = layer_generation.plan_fog(
+            layer_generation.sprite_bank("fogs", fog_files), long, self.fogs_on_layer, self.world_random("fog")
+        )
+        fog = layer_generation.CompositeRecipe(long, height, {"fogs": (fog_files,)}, placements)
+        prepare("fog", key, fog)
+        prepare("fog2", key, layer_generation.DerivedRecipe(
+            fog, 1, [("brightness", 0.7), ("contrast", 0.7), ("blur", 2)]
+        ))
+
+        # === Ліс: перший шар — дерева й павутина, другий — дзеркальний, менший, темніший ===
+        tree_files = list_files(resource_path("assets/level_1/trees"), (".png",))
+        web_files = list_files(resource_path("assets/level_1/spider_web"), (".png",))
+        params = {
+            "layer": "trees", "long": long, "trees": self.trees_on_layer,
+            "min_distance": self.min_distance, "max_distance": self.max_distance,
+        }
+        key = self.layer_cache.key(params, self.world_seed, tree_files + web_files)
+        banks = {"trees": (tree_files,), "webs": (web_files, 2 * self.max_distance)}
+        height, placements = layer_generation.plan_forest(
+            layer_generation.sprite_bank("trees", *banks["trees"]),
+            layer_generation.sprite_bank("webs", *banks["webs"]), long,
+            self.trees_on_layer, self.min_distance, self.max_distance, self.world_random("trees")
+        )
+        trees = layer_generation.CompositeRecipe(
+            long, height, banks, placements, [("brightness", 0.9), ("contrast", 0.6), ("blur", 1.3)]
+        )
+        # Другий шар перетворює перший, тож його середня міряється вже з контрастом першого
+        prepare("bg_trees", key, trees, then=lambda: prepare("bg_trees2", key, layer_generation.DerivedRecipe(
+            trees, 0.9, [("brightness", 0.85), ("contrast", 0.7), ("blur", 2)]
+        )))
+
+        while progress["done"] < progress["total"] and jobs.busy(self.name):
+            yield progress["done"] / progress["total"]
+        yield 1.0
+
+    def stream_layers(self):
+        """Замовляє генерацію плиток шарів на GENERATION_AHEAD екранів попереду камери (у напрямку руху)."""
+        screen_width = self.screen.get_width()
+        distance = screen_width * self.GENERATION_AHEAD
+        layer_offset_x = int(screen_width * 0.2930)  # Той самий зсув, що й у render()
+        layers = (
+            (self.bg_trees_texture, self.bg_trees_positions, layer_offset_x),
+            (self.bg_trees2_texture, self.bg_trees2_positions, layer_offset_x),
+            (self.fog_texture, self.fog_positions, layer_offset_x),
+            (self.fog2_texture, self.fog2_positions, layer_offset_x),
+            (self.ground_texture, self.bg_trees_positions, 300),  # Земля рухається разом з першим шаром лісу
+        )
+        for layer, positions, offset_x in layers:
+            if layer is None or layer.complete:
+                continue
+            for pos_x in positions:
+                layer.generate_ahead(pos_x - offset_x, screen_width, distance)
 
-        # === Пропуск генерації, якщо фон вже існує ===
-        if all(os.path.exists(f) for f in output_files):
+    def update(self):
+        if not self.started:
             return
 
-        try:
-            # === Завантаження зображень дерев і павутин ===
-            tree_images = [Image.open(os.path.join(tree_folder, f)) for f in os.listdir(tree_folder) if
-                           f.endswith(".png")]
-            web_images = [Image.open(os.path.join(web_folder, f)) for f in os.listdir(web_folder) if f.endswith(".png")]
-
-            # === Підготовка основного полотна ===
-            max_height = max(img.height for img in tree_images) + 200
-            bg_image_1 = Image.new("RGBA", (long, max_height), (0, 0, 0, 0))
-
-            tree_positions = []  # Центри дерев по X
-            tree_bases = []  # Бази дерев для розміщення павутин
-
-            # === Додавання першого дерева вручну ===
-            x = 0
-            tree = tree_images[0].copy()
-
-            # Можлива трансформація
-            if random.random() < 0.5:
-                tree = tree.transpose(Image.FLIP_LEFT_RIGHT)
-            scale = random.uniform(0.95, 1.05)
-            tree = tree.resize((int(tree.width * scale), int(tree.height * scale)), Image.LANCZOS)
-
-            y = max_height - tree.height
-            tree_positions.append(x + tree.width // 2)
-            tree_bases.append((x + tree.width // 2, y))
-            bg_image_1.paste(tree, (x, y), tree)
-
-            # === Генерація решти дерев ===
-            for _ in range(trees - 1):
-                tree = random.choice(tree_images).copy()
-
-                # Трансформації
-                if random.random() < 0.5:
-                    tree = tree.transpose(Image.FLIP_LEFT_RIGHT)
-                scale = random.uniform(0.95, 1.05)
-                tree = tree.resize((int(tree.width * scale), int(tree.height * scale)), Image.LANCZOS)
-
-                tree_width, tree_height = tree.size
-                valid_position = False
-                attempts = 0
-
-                # Пошук валідної позиції для дерева
-                while not valid_position and attempts < 10000:
-                    last_x = tree_positions[-1]
-                    new_x = last_x + random.randint(self.min_distance, self.max_distance)
-                    if 0 <= new_x - tree_width // 2 < long - tree_width:
-                        valid_position = True
-                        tree_positions.append(new_x)
-                    attempts += 1
-
-                if valid_position:
-                    x = new_x - tree_width // 2
-                    y = max_height - tree_height
-                    bg_image_1.paste(tree, (x, y), tree)
-                    tree_bases.append((x + tree_width // 2, y))
-
-                    # === Павутина між деревами ===
-                    if web_images:
-                        web = random.choice(web_images).convert("RGBA")
-                        prev_x, prev_y = tree_bases[-2]
-                        curr_x, curr_y = tree_bases[-1]
-
-                        distance = abs(curr_x - prev_x)
-                        min_width = 40
-                        if distance < min_width:
-                            distance = min_width
-
-                        aspect_ratio = web.height / web.width
-                        new_width = distance
-                        new_height = int(new_width * aspect_ratio)
-
-                        web = web.resize((new_width, new_height), Image.LANCZOS)
-                        web = ImageEnhance.Brightness(web).enhance(1.8)  # Збільшити яскравість на 50%
-                        web = ImageEnhance.Contrast(web).enhance(1.5)  # Збільшити контраст
-                        mid_x = (prev_x + curr_x) // 2
-                        web_x = mid_x - web.width // 2
-                        web_y = max_height - int(web.height * random.randint(5, 15) // 10)
-                        bg_image_1.paste(web, (web_x, web_y), web)
-
-            # === Ефекти на основний шар дерев ===
-            bg_image_1 = ImageEnhance.Brightness(bg_image_1).enhance(0.9)
-            bg_image_1 = ImageEnhance.Contrast(bg_image_1).enhance(0.6)
-            bg_image_1 = bg_image_1.filter(ImageFilter.GaussianBlur(1.3))
-            bg_image_1.save(output_files[0])
-
-            # === Другий фоновий шар: дзеркалення, масштабування, стилізація ===
-            bg_image_2 = bg_image_1.transpose(Image.FLIP_LEFT_RIGHT)
-            new_size = (int(bg_image_2.width * 0.90), int(bg_image_2.height * 0.90))
-            bg_image_2 = bg_image_2.resize(new_size)
-            bg_image_2 = ImageEnhance.Brightness(bg_image_2).enhance(0.85)
-            bg_image_2 = ImageEnhance.Contrast(bg_image_2).enhance(0.7)
-            bg_image_2 = bg_image_2.filter(ImageFilter.GaussianBlur(2))
-            bg_image_2.save(output_files[1])
-
-        except Exception as e:
-            pass
+        # ⏱️ Фіксований крок симуляції від SceneManager
+        dt = self.scene_manager.tick_ms
+        self.save_previous_state()
 
-    def update(self):
         if self.dialog_box.active and self.dialog_box.pause_player:
-            now = pygame.time.get_ticks()
-            self.last_update_time = now  # ⏱️ оновлюємо таймер, щоб уникнути стрибка
             self.dialog_box.update(0)
             return
         # --- ОНОВЛЕННЯ ФОНУ ---
@@ -495,11 +483,8 @@ class Level1:
                 self.ground_positions[i] += self.ground_width * len(self.ground_positions)
 
         # --- ПЛАВНА ЗМІНА ШВИДКОСТІ ТУМАНУ ---
-        now = pygame.time.get_ticks()
-        dt = now - getattr(self, 'last_update_time', now)
-        self.last_update_time = now
         if abs(self.fog_scroll_base - self.fog_scroll_target) < 0.01:
-            self.fog_scroll_target = random.uniform(self.fog_scroll_min, self.fog_scroll_max)
+            self.fog_scroll_target = self.fog_rng.uniform(self.fog_scroll_min, self.fog_scroll_max)
         else:
             if self.fog_scroll_base < self.fog_scroll_target:
                 self.fog_scroll_base += self.fog_scroll_change_speed * dt
@@ -518,8 +503,10 @@ class Level1:
 
 
         # --- ОНОВЛЕННЯ ГЕРОЯ ---
-        self.player.handle_input(dt)
-        self.player.update(dt)
+        profiler = self.scene_manager.profiler
+        with profiler.section("Player.update"):
+            self.player.handle_input(dt)
+            self.player.update(dt)
 
         # --- ПРОКРУТКА ---
         if self.player.rect.x + self.player.velocity_x < 0:
@@ -552,10 +539,13 @@ class Level1:
 
             self.player.rect.x = self.player.left_boundary
 
+        # --- Генерація шарів попереду камери ---
+        self.stream_layers()
+
         # --- Звук вовків ---
         for i, checkpoint in enumerate(self.howl_checkpoints):
             if self.world_x >= checkpoint and not self.howl_played_flags[i]:
-                self.audio_manager.play_sound(random.choice(self.howl_sounds))
+                self.audio_manager.play_sound(self.howl_rng.choice(self.howl_sounds))
                 self.howl_played_flags[i] = True
 
         hero_world_x = self.player.rect.x + self.world_x
@@ -578,28 +568,67 @@ class Level1:
             )
 
         # Оновлення ворон
-        self.crow_manager.update(
-            hero_world_x=hero_world_x,
-            world_x=self.world_x,
-            scroll_velocity=self.scroll_velocity,
-            screen_width=self.screen.get_width(),
-            dt=dt
-        )
+        with profiler.section("CrowManager.update"):
+            self.crow_manager.update(
+                hero_world_x=hero_world_x,
+                world_x=self.world_x,
+                scroll_velocity=self.scroll_velocity,
+                screen_width=self.screen.get_width(),
+                dt=dt
+            )
 
         # --- Оновлення павуків ---
-        self.spider_manager.update(
-            dt,
-            hero_world_x,
-            self.player.width,
-            scale_x=self.scale_x,
-            scale_y=self.scale_y,
-            player = self.player
-        )
+        with profiler.section("SpiderManager.update"):
+            self.spider_manager.update(
+                dt,
+                hero_world_x,
+                self.player.width,
+                scale_x=self.scale_x,
+                scale_y=self.scale_y,
+                player = self.player
+            )
 
         # --- Оновлення глобального зсуву сцени ---
         self.world_x += self.scroll_velocity
 
+    def save_previous_state(self):
+        """Запам'ятовує стан попереднього тіку для інтерполяції під час відмальовки."""
+        self.previous_positions = {attr: list(getattr(self, attr)) for attr in self.LAYER_POSITION_ATTRS}
+        self.previous_world_x = self.world_x
+        self.previous_player_pos = self.player.rect.topleft
+        self.crow_manager.save_previous_state()
+        self.spider_manager.save_previous_state()
+
+    def interpolate_positions(self, attr, alpha):
+        """Повертає позиції шару між попереднім і поточним тіком (без інтерполяції через перенос шару)."""
+        current = getattr(self, attr)
+        previous = self.previous_positions.get(attr)
+        if not previous or len(previous) != len(current):
+            return current
+
+        wrap_limit = getattr(self, attr.replace("positions", "width")) / 2
+        return [
+            cur if abs(cur - prev) > wrap_limit else prev + (cur - prev) * alpha
+            for prev, cur in zip(previous, current)
+        ]
+
+    def state_digest(self):
+        """Відбиток стану симуляції: за ним перевіряється, що відтворення запису збіглося з оригіналом."""
+        state = (
+            self.world_x,
+            self.scroll_velocity,
+            self.player.rect.topleft,
+            self.player.hp,
+            self.player.stamina,
+            [(spider.x, spider.y) for spider in self.spider_manager.spiders],
+            [(crow.x_world, crow.y) for crow in self.crow_manager.crows],
+        )
+        return hashlib.sha1(repr(state).encode("utf-8")).hexdigest()
+
     def handle_events(self, events):
+        if not self.started:
+            return
+
         for event in events:
             # 🟢 Пауза працює завжди
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
@@ -616,56 +645,77 @@ class Level1:
             return
 
     def render(self, screen):
+        if not self.started:
+            self.draw_loading_screen(screen)
+            return
+
+        # --- Інтерполяція між тіками симуляції ---
+        alpha = self.scene_manager.render_alpha
+        fog2_positions = self.interpolate_positions("fog2_positions", alpha)
+        bg_trees_positions = self.interpolate_positions("bg_trees_positions", alpha)
+        bg_trees2_positions = self.interpolate_positions("bg_trees2_positions", alpha)
+        fog_positions = self.interpolate_positions("fog_positions", alpha)
+        world_x = self.previous_world_x + (self.world_x - self.previous_world_x) * alpha
+        player_offset = (
+            (self.previous_player_pos[0] - self.player.rect.x) * (1 - alpha),
+            (self.previous_player_pos[1] - self.player.rect.y) * (1 - alpha),
+        )
+
         # --- Темний базовйи фон ---
         pygame.draw.rect(screen, (0, 0, 0),
                          (0, 0, self.screen.get_width(), self.screen.get_height()))
         # --- Небо ---
         screen.blit(self.sky_image, (0, 0))  # Виводимо зображення неба
 
+        profiler = self.scene_manager.profiler
+
         # --- Допоміжна функція для промальовки шарів ---
-        def draw_layer(screen, texture, positions, y_percent):
-            y_offset = int(screen.get_height() * y_percent)  # Y-позиція шару в залежності від відсотка висоти
-            offset_x = int(screen.get_width() * 0.2930)  # Зсув по X (паралакс)
-            for pos_x in positions:
-                screen.blit(texture, (pos_x - offset_x, y_offset))  # Малюємо шар зі зсувом
+        def draw_layer(screen, layer, positions, y_percent, name):
+            with profiler.section(f"draw_layer {name}"):
+                y_offset = int(screen.get_height() * y_percent)  # Y-позиція шару в залежності від відсотка висоти
+                offset_x = int(screen.get_width() * 0.2930)  # Зсув по X (паралакс)
+                # Малюємо видимі плитки всіх копій шару зі зсувом
+                layer.draw(screen, [pos_x - offset_x for pos_x in positions], y_offset)
 
         # --- Промальовка фонових шарів у порядку глибини ---
-        draw_layer(screen, self.fog2_texture, self.fog2_positions, 0.0810)  # Далекий туман
-        draw_layer(screen, self.bg_trees2_texture, self.bg_trees2_positions, 0.0347)  # Далекі дерева
-        draw_layer(screen, self.fog_texture, self.fog_positions, 0.0810)  # Ближчий туман
+        draw_layer(screen, self.fog2_texture, fog2_positions, 0.0810, "fog2")  # Далекий туман
+        draw_layer(screen, self.bg_trees2_texture, bg_trees2_positions, 0.0347, "bg_trees2")  # Далекі дерева
+        draw_layer(screen, self.fog_texture, fog_positions, 0.0810, "fog")  # Ближчий туман
 
         # --- Шар землі ---
-        for pos_x in self.bg_trees_positions:
-            screen.blit(
-                self.ground_texture,
-                (pos_x - 300, self.screen.get_height() - self.ground_height * self.scale_y)
+        with profiler.section("draw_layer ground"):
+            self.ground_texture.draw(
+                screen, [pos_x - 300 for pos_x in bg_trees_positions],
+                self.screen.get_height() - self.ground_height * self.scale_y
             )
 
         # --- Ближчі дерева ---
-        draw_layer(screen, self.bg_trees_texture, self.bg_trees_positions, 0.0579)
+        draw_layer(screen, self.bg_trees_texture, bg_trees_positions, 0.0579, "bg_trees")
 
         # Дерево лісовика
-        self.home_tree.draw(screen, self.world_x)
+        self.home_tree.draw(screen, world_x)
 
         # --- Ворони ---
-        self.crow_manager.draw(screen, self.world_x)
+        self.crow_manager.draw(screen, world_x, alpha)
 
         # --- Герой (виклик метода класу Player) ---
-        self.player.draw(screen)
+        self.player.draw(screen, player_offset)
 
         # --- Павуки ---
-        self.spider_manager.draw(screen, self.world_x)
+        with profiler.section("SpiderManager.draw"):
+            self.spider_manager.draw(screen, world_x, alpha)
 
         # --- Завершальний шар туману для глибини ---
-        draw_layer(screen, self.fog2_texture, self.fog2_positions, 0.0810)
+        draw_layer(screen, self.fog2_texture, fog2_positions, 0.0810, "fog2 front")
 
         self.dialog_box.draw()
 
     def stop(self):
         self.started = False
-
-        # --- Скидання таймерів ---
-        self.last_update_time = 0
+        self.stopped = True
+        if self.loading is not None:
+            self.loading.close()
+            self.loading = None
 
         # --- Скидання стану гравця ---
         self.player.reset()
@@ -674,7 +724,7 @@ class Level1:
         self.world_x = 0
         self.scroll_velocity = 0
         self.fog_scroll_base = 0.2
-        self.fog_scroll_target = random.uniform(self.fog_scroll_min, self.fog_scroll_max)
+        self.fog_scroll_target = self.fog_rng.uniform(self.fog_scroll_min, self.fog_scroll_max)
 
         # --- Скидання позицій фонів до початкових значень ---
         self.bg_trees_positions = [i * self.bg_trees_width for i in range(3)]
@@ -698,6 +748,11 @@ class Level1:
         self.crow_manager.stop_all_sounds()
 
         # --- Очистка графічних ресурсів ---
+        # Плитки звільняються одразу: завдання генерації, що ще в пулі процесів, тримають шар до свого кінця
+        for layer in (self.bg_trees_texture, self.bg_trees2_texture, self.fog_texture, self.fog2_texture,
+                      self.ground_texture):
+            if layer is not None:
+                layer.clear()
         self.bg_trees_texture = None
         self.bg_trees2_texture = None
         self.fog_texture = None
@@ -714,6 +769,16 @@ class Level1:
         self.scene_manager = None
         self.audio_manager = None
 
+    def destroy(self):
+        """
+        Повністю звільняє рівень: окрім того, що робить stop(), віддає невикористані передзавантажені ресурси.
+        Спільні кадри/звуки Player і Spider живуть в asset_manager: SceneManager знімає посилання рівня
+        після destroy(), і далі їх витісняє LRU в межах бюджету.
+        """
+        if not self.stopped:
+            self.stop()
+        self.assets.clear()
+
     def pause(self):
         # --- Пауза музики і оновлення прапорця ---
         pygame.mixer.music.pause()
@@ -725,7 +790,6 @@ class Level1:
         # --- Відновлення музики та прапорця ---
         pygame.mixer.music.unpause()
         self.music_paused = False
-        self.last_update_time = pygame.time.get_ticks()
 
     def handle_tree_choice(self, index, option_text):
         if index == 0:
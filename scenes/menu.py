@@ -1,10 +1,10 @@
 import pygame
 import json
 import logging
-from PIL import Image, ImageSequence
 
-from utils.resource_loader import resource_path, load_settings, load_progress, save_progress, get_save_path
+from utils.resource_loader import resource_path, load_settings, load_progress, save_progress, get_save_path, new_world_seed
 from core.audio_manager import play_random_menu_sound, play_return_sound
+from core.animated_background import AnimatedBackground
 
 SAVE_FILE = "progress.json"
 
@@ -22,11 +22,7 @@ class MainMenu:
         self.settings = load_settings()
 
         # Анімація фону
-        self.bg_frames = []
-        self.frame_index = 0
-        self.reverse = False
-        self.frame_delay = 2
-        self.current_delay = 0
+        self.bg_animation = AnimatedBackground("assets/menu/menu_bg/image_menu.gif")
 
     def start(self):
         self.screen = pygame.display.get_surface()
@@ -35,41 +31,16 @@ class MainMenu:
             self.audio_manager.play_music("assets/menu/menu_ost/menu_ost.mp3")
 
         self.last_scene = load_progress()
-        self.load_gif_frames("assets/menu/menu_bg/image_menu.gif")
+        self.bg_animation.load(self.screen.get_size())  # Сцена з кешу вже має кадри фону
 
-    def load_gif_frames(self, gif_path):
-        try:
-            pil_image = Image.open(resource_path(gif_path))
-            self.bg_frames = []
-            for frame in ImageSequence.Iterator(pil_image):
-                frame = frame.convert("RGBA")
-                data = frame.tobytes()
-                size = frame.size
-                mode = frame.mode
-                surface = pygame.image.fromstring(data, size, mode).convert_alpha()
-                self.bg_frames.append(surface)
-        except Exception as e:
-            pass
-
-    def update_background_animation(self):
-        if self.current_delay < self.frame_delay:
-            self.current_delay += 1
-            return
-        self.current_delay = 0
-        if not self.reverse:
-            self.frame_index += 1
-            if self.frame_index >= len(self.bg_frames) - 1:
-                self.reverse = True
-        else:
-            self.frame_index -= 1
-            if self.frame_index <= 0:
-                self.reverse = False
+        # Поки гравець у меню, у фоні готуємо сцену, з якої найімовірніше продовжиться гра
+        self.scene_manager.preload(self.last_scene or "scene_1")
 
     def stop(self):
         pass
 
     def destroy(self):
-        self.bg_frames.clear()
+        self.bg_animation.clear()
 
     def handle_events(self, events):
         for event in events:
@@ -111,6 +82,7 @@ class MainMenu:
             else:
                 self.audio_manager.stop_music()
                 save_progress("scene_1")
+                new_world_seed()  # Нова гра — новий світ
                 self.scene_manager.change_scene("scene_1")
 
         elif self.selected_option == 1:  # Продовжити гру
@@ -127,13 +99,10 @@ class MainMenu:
             self.scene_manager.change_scene("ConfirmOut")
 
     def update(self):
-        self.update_background_animation()
+        self.bg_animation.update()
 
     def render(self, screen):
-        if self.bg_frames:
-            bg = self.bg_frames[self.frame_index]
-            bg_scaled = pygame.transform.smoothscale(bg, screen.get_size())
-            screen.blit(bg_scaled, (0, 0))
+        self.bg_animation.draw(screen)
 
         font = pygame.font.Font(resource_path("assets/menu_font.otf"), 50)
         padding_x, padding_y = 40, 20
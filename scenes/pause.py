@@ -1,9 +1,9 @@
 import pygame
 import logging
-from PIL import Image, ImageSequence
 
 from utils.resource_loader import resource_path, load_settings, save_progress
 from core.audio_manager import play_random_menu_sound, play_return_sound
+from core.animated_background import AnimatedBackground
 
 
 class PauseMenu:
@@ -23,11 +23,7 @@ class PauseMenu:
         self.settings = load_settings()
 
         # Анімація фону
-        self.bg_frames = []
-        self.frame_index = 0
-        self.reverse = False
-        self.frame_delay = 2
-        self.current_delay = 0
+        self.bg_animation = AnimatedBackground("assets/menu/menu_bg/pause_menu.gif")
 
         # Підтвердження виходу
         self.confirming = False
@@ -37,36 +33,9 @@ class PauseMenu:
 
     def start(self):
         self.screen = pygame.display.get_surface()
-        self.background = pygame.image.load(resource_path("assets/menu/menu_bg/pause_menu.jpeg")).convert()
-        self.load_gif_frames("assets/menu/menu_bg/pause_menu.gif")
-
-    def load_gif_frames(self, gif_path):
-        try:
-            pil_image = Image.open(resource_path(gif_path))
-            self.bg_frames = []
-            for frame in ImageSequence.Iterator(pil_image):
-                frame = frame.convert("RGBA")
-                data = frame.tobytes()
-                size = frame.size
-                mode = frame.mode
-                surface = pygame.image.fromstring(data, size, mode).convert_alpha()
-                self.bg_frames.append(surface)
-        except Exception as e:
-            pass
-
-    def update_background_animation(self):
-        if self.current_delay < self.frame_delay:
-            self.current_delay += 1
-            return
-        self.current_delay = 0
-        if not self.reverse:
-            self.frame_index += 1
-            if self.frame_index >= len(self.bg_frames) - 1:
-                self.reverse = True
-        else:
-            self.frame_index -= 1
-            if self.frame_index <= 0:
-                self.reverse = False
+        if not self.bg_animation.frames:  # Сцена з кешу вже має фон
+            self.background = pygame.image.load(resource_path("assets/menu/menu_bg/pause_menu.jpeg")).convert()
+        self.bg_animation.load(self.screen.get_size())
 
     def stop(self):
         pass
@@ -123,15 +92,12 @@ class PauseMenu:
             self.selected_confirm_option = 1
 
     def update(self):
-        self.update_background_animation()
+        self.bg_animation.update()
 
     def render(self, screen):
         # Фон
         screen_size = screen.get_size()
-        if self.bg_frames:
-            bg = self.bg_frames[self.frame_index]
-            bg_scaled = pygame.transform.smoothscale(bg, screen.get_size())
-            screen.blit(bg_scaled, (0, 0))
+        self.bg_animation.draw(screen)
 
         # Текстові кнопки
         padding_x, padding_y = 40, 20
@@ -1,11 +1,30 @@
 import pygame
 import json
-from PIL import Image
 import logging
 from utils.resource_loader import resource_path, load_settings, save_progress
+from core.jobs import advance_steps
+from core.delta_frames import DeltaFrames
+
+logger = logging.getLogger("Scene1")
 
 
 class Scene1:
+    WINDOW = 2  # Скільки зображень вступу тримати в пам'яті: поточне і наступне
+    IMAGE_SEQUENCE = [
+        ("assets/scene/intro/house.gif", 10000, 2000, 2000),
+        ("assets/scene/intro/village.gif", 10000, 2000, 2000),
+        ("assets/scene/intro/village2.gif", 10000, 2000, 3000),
+        ("assets/scene/intro/black.png", 8000, 2000, 0),
+        ("assets/scene/intro/house2.gif", 5000, 2000, 1000),
+        ("assets/scene/intro/map.png", 4750, 1000, 0),
+        ("assets/scene/intro/house3.gif", 4000, 0, 100),
+        ("assets/scene/intro/village_war.png", 4000, 100, 100),
+        ("assets/scene/intro/image2.png", 8000, 0, 1000),
+        ("assets/scene/intro/image3.png", 10000, 500, 3000),
+        ("assets/scene/intro/black.png", 3000, 1500, 1500),
+        ("assets/scene/intro/dark_wood.gif", 13000, 4000, 0),
+    ]
+
     def __init__(self, scene_manager, audio_manager):
         self.name = "scene_1"
         self.scene_manager = scene_manager
@@ -19,20 +38,7 @@ class Scene1:
             ("assets/scene/intro/house.mp3", 1),
             ("assets/scene/intro/intro.mp3", 2000),
         ]
-        self.image_sequence = [
-            ("assets/scene/intro/house.gif", 10000, 2000, 2000),
-            ("assets/scene/intro/village.gif", 10000, 2000, 2000),
-            ("assets/scene/intro/village2.gif", 10000, 2000, 3000),
-            ("assets/scene/intro/black.png", 8000, 2000, 0),
-            ("assets/scene/intro/house2.gif", 5000, 2000, 1000),
-            ("assets/scene/intro/map.png", 4750, 1000, 0),
-            ("assets/scene/intro/house3.gif", 4000, 0, 100),
-            ("assets/scene/intro/village_war.png", 4000, 100, 100),
-            ("assets/scene/intro/image2.png", 8000, 0, 1000),
-            ("assets/scene/intro/image3.png", 10000, 500, 3000),
-            ("assets/scene/intro/black.png", 3000, 1500, 1500),
-            ("assets/scene/intro/dark_wood.gif", 13000, 4000, 0),
-        ]
+        self.image_sequence = self.IMAGE_SEQUENCE
         self.texts = [
             (" ", 2000, 0, 0),
             ("Наш герой мав усе, про що можна було мріяти.", 8000, 2000, 1000),
@@ -52,48 +58,11 @@ class Scene1:
             (" ", 10000, 0, 0),
         ]
 
-        self.image_data = []
-        for path, *_ in self.image_sequence:
-            full_path = resource_path(path)
-            if path.endswith(".gif"):
-                gif = Image.open(full_path)
-                frames = []
-                durations = []
-                previous_frame = None
-
-                for frame in range(gif.n_frames):
-                    gif.seek(frame)
-                    duration = 300
-                    "duration = gif.info.get('duration', 100)"
-
-                    # Конвертуємо в RGBA для прозорості
-                    current_frame = gif.convert("RGBA")
-
-                    if previous_frame is not None:
-                        # Поєднуємо попередній кадр з поточним (щоб зберегти повну картинку)
-                        composed = Image.alpha_composite(previous_frame, current_frame)
-                    else:
-                        composed = current_frame.copy()
-
-                    previous_frame = composed.copy()
-
-                    # Конвертація до Surface
-                    frame_surface = pygame.image.fromstring(
-                        composed.tobytes(), composed.size, composed.mode
-                    ).convert_alpha()
-
-                    scaled_surface = pygame.transform.scale(frame_surface, self.screen.get_size())
-                    frames.append(scaled_surface)
-                    durations.append(duration)
-
-                self.image_data.append({
-                    "type": "gif",
-                    "frames": frames,
-                    "durations": durations
-                })
-            else:
-                image = pygame.image.load(full_path).convert_alpha()
-                self.image_data.append({"type": "static", "image": image})
+        self.assets = scene_manager.take_preloaded(self.name)  # GIF, декодовані у фоні (або порожній набір)
+        self.image_data = [None] * len(self.image_sequence)  # Лише вікно поточного зображення (stream)
+        self.pending = {}  # {індекс: Job} — зображення, що декодуються у фоні
+        self.started = False
+        self.loading = None
 
         self.font = pygame.font.Font(resource_path("assets/menu_font.otf"), 40)
 
@@ -120,9 +89,92 @@ class Scene1:
         pygame.mixer.music.set_endevent(pygame.USEREVENT + 10)
         self.pause_before_next_track = 0
 
+    @staticmethod
+    def preload_assets(bundle, screen_size):
+        """Фонове передзавантаження: декодує перші зображення вступу (без convert), решта підвантажується під час показу."""
+        for path, *_ in Scene1.IMAGE_SEQUENCE[:Scene1.WINDOW]:
+            full_path = resource_path(path)
+            if path.endswith(".gif"):
+                bundle.add_gif(full_path, composite=True)
+            else:
+                bundle.add_image(full_path)
+
     def start(self):
         pygame.mixer.music.stop()
 
+        # Зображення декодуються в JobSystem; сам вступ починається, коли готове перше (begin)
+        self.started = False
+        self.loading = self.load_steps()
+
+    def advance_loading(self, budget_ms):
+        if self.loading is None:
+            return False
+        if not advance_steps(self.loading, budget_ms, lambda: self.scene_manager.jobs.busy(self.name)):
+            self.loading = None
+        return self.loading is not None
+
+    def load_steps(self):
+        """Запускає декодування першого вікна зображень і чекає, поки перше приєднають до сцени."""
+        self.stream(0)
+        while self.image_data[0] is None and not self.pending[0].finished:
+            yield
+        self.begin()
+
+    def stream(self, index):
+        """
+        Ковзне вікно зображень: у пам'яті лише поточне і наступне.
+        Наступне декодується у фоні, поки показується поточне; попередні звільняються.
+        """
+        window = range(index, min(index + self.WINDOW, len(self.image_sequence)))
+        for i in range(len(self.image_data)):
+            if i not in window:
+                self.image_data[i] = None
+                job = self.pending.pop(i, None)
+                if job is not None:
+                    self.scene_manager.jobs.cancel_job(job)  # Ще не почате декодування вже не потрібне
+        for i in window:
+            job = self.pending.get(i)
+            if self.image_data[i] is None and job is None:
+                path = resource_path(self.image_sequence[i][0])
+                self.pending[i] = self.scene_manager.jobs.submit(
+                    self.decode_image, path, owner=self.name,
+                    on_done=lambda decoded, i=i: self.attach_image(i, decoded)
+                )
+        if index > 0:
+            self.assets.clear()  # Передзавантажене перше вікно вже забрано
+
+    def decode_image(self, full_path):
+        """
+        Фонова частина (робочий потік): декодування і масштабування під екран, без convert.
+        Кадри GIF уже накладені один на одний (повна картинка) і стиснуті в DeltaFrames.
+        """
+        if full_path.endswith(".gif"):
+            return "gif", DeltaFrames([
+                pygame.transform.scale(pygame.image.fromstring(data, size, mode), self.screen.get_size())
+                for data, size, mode in self.assets.gif_frames(full_path, composite=True)
+            ])
+        return "static", self.assets.image(full_path)
+
+    def attach_image(self, index, decoded):
+        """Завершення на головному потоці: convert_alpha зображення (для GIF — лише робочого кадру)."""
+        kind, data = decoded
+        if index not in self.pending:
+            return  # Зображення вже випало з вікна
+        del self.pending[index]  # Job утримує декодований результат — відпускаємо його
+        if kind == "static":
+            self.image_data[index] = {"type": "static", "image": data.convert_alpha()}
+            return
+
+        duration = 300
+        "duration = gif.info.get('duration', 100)"
+        self.image_data[index] = {
+            "type": "gif",
+            "frames": data.convert(),
+            "durations": [duration] * len(data)
+        }
+
+    def begin(self):
+        """Початок вступу, коли всі зображення завантажено."""
         self.current_image_index = 0
         self.current_text_index = 0
         self.fade_alpha = 0
@@ -143,6 +195,10 @@ class Scene1:
         self.gif_frame_index = 0
         self.gif_frame_time = 0
         self.last_tick = pygame.time.get_ticks()
+        self.started = True
+
+        # Поки йде вступ, у фоні готуємо сцену створення героя
+        self.scene_manager.preload("HeroCreator")
 
     def play_next_track(self):
         if self.current_music_index < len(self.music_playlist):
@@ -155,14 +211,14 @@ class Scene1:
             self.current_music_index += 1
 
     def update(self):
-        if self.is_paused:
+        if self.is_paused or not self.started:
             return
 
         current_time = pygame.time.get_ticks()
         elapsed = current_time - self.start_time
         # Якщо GIF, оновлюємо кадр
         current_image_data = self.image_data[self.current_image_index]
-        if current_image_data["type"] == "gif":
+        if current_image_data and current_image_data["type"] == "gif":
             # Вираховуємо скільки мс минуло з моменту початку анімації зображення
             gif_elapsed = pygame.time.get_ticks() - self.start_time
             durations = current_image_data["durations"]
@@ -212,6 +268,7 @@ class Scene1:
             if self.current_image_index >= len(self.image_data):
                 self.scene_manager.change_scene("HeroCreator")
                 return
+            self.stream(self.current_image_index)
             self.start_time = current_time
             self.fading_in = True
             self.fading_out = False
@@ -225,15 +282,24 @@ class Scene1:
             self.text_alpha = 0
 
     def render(self, screen):
+        if not self.started:
+            screen.fill((0, 0, 0))
+            return
+
         current_image_data = self.image_data[self.current_image_index]
-        if current_image_data["type"] == "gif":
-            current_image = current_image_data["frames"][self.gif_frame_index]
+        if current_image_data is None:
+            # Наступне зображення ще декодується (або не завантажилось) — чорний кадр замість нього
+            screen.fill((0, 0, 0))
         else:
-            current_image = pygame.transform.scale(current_image_data["image"], screen.get_size())
-        scaled = pygame.transform.scale(current_image, screen.get_size())
-        faded = scaled.copy()
-        faded.fill((255, 255, 255, int(self.fade_alpha)), special_flags=pygame.BLEND_RGBA_MULT)
-        screen.blit(faded, (0, 0))
+            if current_image_data["type"] == "gif":
+                frames = current_image_data["frames"]
+                current_image = frames.frame(self.gif_frame_index % len(frames))
+            else:
+                current_image = pygame.transform.scale(current_image_data["image"], screen.get_size())
+            scaled = pygame.transform.scale(current_image, screen.get_size())
+            faded = scaled.copy()
+            faded.fill((255, 255, 255, int(self.fade_alpha)), special_flags=pygame.BLEND_RGBA_MULT)
+            screen.blit(faded, (0, 0))
 
         if self.current_text_index < len(self.texts):
             text = self.font.render(self.texts[self.current_text_index][0], True, (255, 255, 255))
@@ -242,6 +308,9 @@ class Scene1:
             screen.blit(text, rect)
 
     def handle_events(self, events):
+        if not self.started:
+            return
+
         for event in events:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_RETURN:
@@ -278,3 +347,4 @@ class Scene1:
     def destroy(self):
         self.stop()
         self.image_data.clear()
+        self.pending.clear()
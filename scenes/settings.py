@@ -1,12 +1,14 @@
 import pygame
 import logging
-from PIL import Image, ImageSequence
 
 from utils.resource_loader import resource_path, load_settings, save_settings
 from core.audio_manager import play_return_sound, play_random_menu_sound
+from core.animated_background import AnimatedBackground
 
 
 class SettingsMenu:
+    SCREEN_SIZES = [(1024, 864), (1280, 720), (1440, 900), (1920, 1200)]  # Під них запікаються ресурси (--bake)
+
     def __init__(self, scene_manager, audio_manager, settings):
         self.name = "settings"
         self.scene_manager = scene_manager
@@ -19,29 +21,15 @@ class SettingsMenu:
 
         self.options = ["Гучність музики", "Гучність ефектів", "Розмір екрану", "Назад"]
         self.selected_option = 0
-        self.screen_sizes = [(1024, 864), (1280, 720), (1440, 900), (1920, 1200)]
+        self.screen_sizes = self.SCREEN_SIZES
         self.original_screen_size = (self.settings["screen_width"], self.settings["screen_height"])
         self.screen_size_changed = False
 
-        self.bg_frames = []
-        self.frame_index = 0
-        self.frame_delay = 2
-        self.current_delay = 0
-        self.reverse = False
-        self.load_gif_frames(resource_path("assets/menu/menu_bg/setting_menu.gif"))
+        self.bg_animation = AnimatedBackground("assets/menu/menu_bg/setting_menu.gif")
+        self.bg_animation.load(pygame.display.get_surface().get_size())
 
         self.font = pygame.font.Font(resource_path("assets/menu_font.otf"), 50)
 
-    def load_gif_frames(self, gif_path):
-        try:
-            pil_image = Image.open(gif_path)
-            for frame in ImageSequence.Iterator(pil_image):
-                frame = frame.convert("RGBA")
-                surface = pygame.image.fromstring(frame.tobytes(), frame.size, frame.mode).convert_alpha()
-                self.bg_frames.append(surface)
-        except Exception as e:
-            pass
-
     def start(self):
         self.screen = pygame.display.get_surface()
         self.audio_manager.set_music_volume(self.settings["music_volume"] / 10)
@@ -52,29 +40,14 @@ class SettingsMenu:
         self.audio_manager.set_sound_volume(self.settings["sound_volume"] / 10)
 
     def destroy(self):
-        self.bg_frames.clear()
+        self.bg_animation.clear()
 
     def pause(self): pass
 
     def resume(self): pass
 
     def update(self):
-        self.update_background_animation()
-
-    def update_background_animation(self):
-        if self.current_delay < self.frame_delay:
-            self.current_delay += 1
-            return
-        self.current_delay = 0
-
-        if not self.reverse:
-            self.frame_index += 1
-            if self.frame_index >= len(self.bg_frames) - 1:
-                self.reverse = True
-        else:
-            self.frame_index -= 1
-            if self.frame_index <= 0:
-                self.reverse = False
+        self.bg_animation.update()
 
     def handle_events(self, events):
         for event in events:
@@ -112,10 +85,7 @@ class SettingsMenu:
         save_settings(self.settings)
 
     def render(self, screen):
-        if self.bg_frames:
-            bg = self.bg_frames[self.frame_index]
-            scaled = pygame.transform.smoothscale(bg, screen.get_size())
-            screen.blit(scaled, (0, 0))
+        self.bg_animation.draw(screen)
 
         screen_width, screen_height = screen.get_size()
         padding_x, padding_y = 40, 20
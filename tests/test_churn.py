@@ -0,0 +1,23 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# 2 цикли розігріву (core.churn.WARMUP_CYCLES) і ще 4, щоб витік на кожному циклі був видно як ріст,
+# а не як одна шумна різниця між двома замірами
+CYCLES = 6
+
+
+def test_scene_churn_does_not_grow_memory(tmp_path):
+    """
+    menu → scene_1 → HeroCreator → level_1 → pause → menu по колу без вікна і звуку (`main.py --churn`).
+    Окремий процес: гра ініціалізує SDL і пул процесів, тож тест не ділить їх з pytest.
+    HOME — тимчасова папка: збереження і кеш гри (progress.json, шари, спрайти) не чіпають профіль розробника.
+    """
+    env = dict(os.environ, HOME=str(tmp_path), SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    result = subprocess.run(
+        [sys.executable, "main.py", "--churn", str(CYCLES)],
+        cwd=ROOT, env=env, capture_output=True, text=True, timeout=3600,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "✅ Витоків не виявлено" in result.stdout
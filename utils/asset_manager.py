@@ -0,0 +1,99 @@
+import logging
+from collections import OrderedDict
+
+import pygame
+
+from utils.memory import estimate_bytes, format_bytes
+
+logger = logging.getLogger("AssetManager")
+
+
+class AssetEntry:
+    __slots__ = ("value", "size", "owners")
+
+    def __init__(self, value, size):
+        self.value = value
+        self.size = size
+        self.owners = {}  # {власник: скільки разів отримав}
+
+
+class AssetManager:
+    """
+    Єдиний кеш ресурсів гри: кадри, масштабовані зображення, звуки.
+    Ключ — кортеж (шлях, масштаб, перетворення), значення будує build() під час першого запиту.
+    Кожен запит реєструє власника (за замовчуванням — поточну сцену, її виставляє SceneManager),
+    release(власник) знімає всі його посилання під час знищення сцени.
+    Ресурси без власників лишаються в кеші, доки загальний розмір не перевищить budget,
+    і тоді витісняються від найдавніше використаних (LRU).
+    """
+    DEFAULT_BUDGET = 128 * 1024 * 1024
+
+    def __init__(self, budget=DEFAULT_BUDGET):
+        self.entries = OrderedDict()  # {ключ: AssetEntry} — від найдавніше використаного
+        self.owned = {}               # {власник: {ключ, ...}}
+        self.budget = budget
+        self.owner = None             # Власник за замовчуванням (поточна сцена)
+
+    def get(self, key, build, owner=None):
+        """Ресурс за ключем: з кешу або щойно збудований. Реєструє власника (acquire)."""
+        entry = self.entries.get(key)
+        created = entry is None
+        if created:
+            entry = AssetEntry(build(), 0)
+            entry.size = estimate_bytes(entry.value)
+            self.entries[key] = entry
+        else:
+            self.entries.move_to_end(key)
+
+        owner = owner if owner is not None else self.owner
+        if owner is not None:
+            entry.owners[owner] = entry.owners.get(owner, 0) + 1
+            self.owned.setdefault(owner, set()).add(key)
+        if created:
+            self.evict()
+        return entry.value
+
+    def sound(self, path, owner=None):
+        return self.get((path, None, "sound"), lambda: pygame.mixer.Sound(path), owner)
+
+    def release(self, owner):
+        """Знімає всі посилання власника (release) і витісняє зайве понад бюджет."""
+        for key in self.owned.pop(owner, ()):
+            entry = self.entries.get(key)
+            if entry is not None:
+                entry.owners.pop(owner, None)
+                entry.size = estimate_bytes(entry.value)  # Віддзеркалені атласи могли з'явитись пізніше
+        self.evict()
+
+    def evict(self, budget=None):
+        """LRU: видаляє ресурси без власників, доки кеш не вкладеться в бюджет (evict(0) — усі без власників)."""
+        budget = self.budget if budget is None else budget
+        total = self.total_bytes()
+        for key in list(self.entries):
+            if total <= budget:
+                break
+            entry = self.entries[key]
+            if entry.owners:
+                continue
+            del self.entries[key]
+            total -= entry.size
+            logger.debug(f"[AssetManager] Витіснено {key} ({format_bytes(entry.size)})")
+
+    def clear(self):
+        self.entries.clear()
+        self.owned.clear()
+
+    def total_bytes(self):
+        return sum(entry.size for entry in self.entries.values())
+
+    def owner_bytes(self):
+        """Скільки байтів утримує кожен власник ({власник: байти}); None — ресурси без власників."""
+        result = {}
+        for entry in self.entries.values():
+            for owner in entry.owners or (None,):
+                result[owner] = result.get(owner, 0) + entry.size
+        return result
+
+
+# Спільний кеш ресурсів для всіх сцен і об'єктів
+asset_manager = AssetManager()
@@ -0,0 +1,130 @@
+import gc
+
+import pygame
+
+# Посилання на спільні об'єкти, а не власні ресурси сцени — їх не рахуємо
+SKIP_ATTRS = {"scene_manager", "audio_manager", "manager", "screen"}
+
+
+def root_surface(surface):
+    """Surface, якій належать пікселі: для субповерхні (кадру атласу) — її батьківська."""
+    parent = surface.get_parent()
+    while parent is not None:
+        surface, parent = parent, parent.get_parent()
+    return surface
+
+
+def surface_bytes(surface):
+    """Скільки байтів займають пікселі Surface (для субповерхонь — 0, пам'ять належить батьківській)."""
+    if surface.get_parent() is not None:
+        return 0
+    return surface.get_bytesize() * surface.get_width() * surface.get_height()
+
+
+def sound_bytes(sound):
+    """Розмір декодованих семплів Sound (тривалість × частота × канали × байти на семпл)."""
+    mixer = pygame.mixer.get_init()
+    if not mixer:
+        return 0
+    frequency, size, channels = mixer
+    return int(sound.get_length() * frequency) * channels * abs(size) // 8
+
+
+def estimate_bytes(value, seen=None, depth=3):
+    """
+    Приблизний розмір пікселів Surface і семплів Sound у значенні: Surface, Sound, список/кортеж/словник
+    або об'єкт з __dict__. Кожен ресурс рахується один раз; глибина обходу обмежена depth.
+    """
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    if isinstance(value, pygame.Surface):
+        if value.get_parent() is not None:  # Кадр атласу: рахуємо атлас один раз
+            return estimate_bytes(root_surface(value), seen, depth)
+        return 0 if value is pygame.display.get_surface() else surface_bytes(value)
+    if isinstance(value, pygame.mixer.Sound):
+        return sound_bytes(value)
+    if hasattr(value, "memory_bytes"):
+        return value.memory_bytes()  # Контейнер сам знає свій розмір (DeltaFrames)
+    if depth <= 0:
+        return 0
+    if isinstance(value, dict):
+        return sum(estimate_bytes(v, seen, depth - 1) for v in value.values())
+    if isinstance(value, (list, tuple, set)):
+        return sum(estimate_bytes(v, seen, depth - 1) for v in value)
+    if hasattr(value, "__dict__") and not isinstance(value, type):
+        return sum(
+            estimate_bytes(v, seen, depth - 1) for k, v in vars(value).items() if k not in SKIP_ATTRS
+        )
+    return 0
+
+
+def live_surfaces():
+    """
+    Усі Surface, на які посилаються живі контейнери Python (списки, словники, атрибути об'єктів).
+    Surface не відстежується gc напряму, тому шукаємо їх серед посилань відстежуваних об'єктів.
+    Субповерхні (кадри атласів) зводяться до батьківських Surface. Повертає (кількість, байти пікселів).
+    """
+    display = pygame.display.get_surface()
+    found = {}
+    for obj in gc.get_objects():
+        for ref in gc.get_referents(obj):
+            if isinstance(ref, pygame.Surface) and ref is not display:
+                ref = root_surface(ref)
+                found[id(ref)] = ref
+    return len(found), sum(surface_bytes(surface) for surface in found.values())
+
+
+REPORT_DEPTH = 6  # Сцена → менеджер → список → об'єкт → список кадрів → Surface
+
+
+def scene_holders(scene_manager):
+    """Усі живі сцени з підписом: поточна, призупинена під паузою та збережені в кеші."""
+    holders = []
+    if scene_manager.current_scene is not None:
+        holders.append(("поточна", scene_manager.current_scene))
+    if scene_manager.previous_scene is not None:
+        holders.append(("під паузою", scene_manager.previous_scene))
+    for scene, _ in scene_manager.scene_cache.values():
+        holders.append(("у кеші", scene))
+    return holders
+
+
+def memory_report(scene_manager, top_attrs=4):
+    """
+    Скільки байтів пікселів і звуку утримує кожен власник: сцени (з найбільшими атрибутами)
+    і власники ресурсів asset_manager. Повертає ([(підпис, байти, рівень), ...], загалом без повторів).
+    Рядки можуть перекриватися (кадр павука є і в сцені, і в asset_manager), загальна сума — ні.
+    """
+    from utils.asset_manager import asset_manager
+
+    rows = []
+    total_seen = set()
+    total = 0
+
+    for role, scene in scene_holders(scene_manager):
+        name = getattr(scene, "name", type(scene).__name__)
+        attrs = [
+            (attr, estimate_bytes(value, depth=REPORT_DEPTH))
+            for attr, value in vars(scene).items() if attr not in SKIP_ATTRS
+        ]
+        rows.append((f"{name} ({role})", sum(size for _, size in attrs), 0))
+        for attr, size in sorted(attrs, key=lambda item: item[1], reverse=True)[:top_attrs]:
+            if size:
+                rows.append((f"{name}.{attr}", size, 1))
+        total += estimate_bytes(scene, total_seen, REPORT_DEPTH)
+
+    rows.append(("AssetManager", asset_manager.total_bytes(), 0))
+    for owner, size in sorted(asset_manager.owner_bytes().items(), key=lambda item: item[1], reverse=True):
+        rows.append((f"AssetManager[{owner or 'без власника'}]", size, 1))
+    for entry in asset_manager.entries.values():
+        total += estimate_bytes(entry.value, total_seen, REPORT_DEPTH)
+
+    return rows, total
+
+
+def format_bytes(size):
+    return f"{size / 1024 / 1024:.1f} МБ"
@@ -1,6 +1,7 @@
 import os
 import sys
 import json
+import random
 
 def resource_path(relative_path):
     """Повертає абсолютний шлях до ресурсу (працює і з PyInstaller, і під час розробки)"""
@@ -107,4 +108,55 @@ def get_user_data_path():
 def get_save_path(filename):
     base_dir = os.path.join(os.path.expanduser("~"), "Library", "Application Support", "White_Castle")
     os.makedirs(base_dir, exist_ok=True)
-    return os.path.join(base_dir, filename)
\ No newline at end of file
+    return os.path.join(base_dir, filename)
+
+
+def get_cache_path(*parts):
+    """
+    Шлях у кеші користувача: ресурси, які гра генерує сама і може перебудувати (шари рівнів тощо).
+    На відміну від assets/, ця папка доступна для запису і в зібраному застосунку.
+    """
+    path = os.path.join(os.path.dirname(get_save_path("cache")), "cache", *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+
+def load_world_seed(filename="progress.json"):
+    """
+    Seed світу для цього збереження (генерація лісу, туману тощо).
+    Створюється під час першого запиту і зберігається в progress.json поруч з героєм.
+    """
+    path = get_save_path(filename)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+            if not isinstance(data, dict):
+                data = {}
+    except (FileNotFoundError, json.JSONDecodeError):
+        data = {}
+
+    seed = data.get("world_seed")
+    if isinstance(seed, int):
+        return seed
+    return new_world_seed(filename)
+
+
+def new_world_seed(filename="progress.json"):
+    """Створює новий seed світу (нова гра — новий ліс) і зберігає його в progress.json."""
+    path = get_save_path(filename)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+            if not isinstance(data, dict):
+                data = {}
+    except (FileNotFoundError, json.JSONDecodeError):
+        data = {}
+
+    seed = random.SystemRandom().getrandbits(32)  # Не чіпає глобальний генератор (запис/відтворення)
+    data["world_seed"] = seed
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
+    except Exception as e:
+        pass
+    return seed
\ No newline at end of file